@@ -3,6 +3,7 @@
 #Depend: GCode
 #Type: postprocess
 #Param: sdcard_param(float:0) Compress for SD card printing
+#Param: optimize_param(float:0) Remove redundant commands
 #Param: toolTravelSpeed(float:0) Tool change travel speed (mm/s)
 #Param: t0extruder(string:0) T0 PhysicalExtruder (empty=none)
 #Param: t1extruder(string:1) T1 PhysicalExtruder (empty=none)
@@ -52,266 +53,710 @@
 
 __copyright__ = "Copyright (C) 2013 Ambroz Bizjak - Released under the BSD 2-clause license"
 
-def replace_multi(subject, match, replace):
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import tempfile
+
+try:
+    from aprinter_gcode import GcodeCommand, parse_line
+except ImportError:
+    # When run as a Cura plugin, aprinter_gcode.py sits next to this
+    # script in one of Cura's plugin directories, which are not on the path.
+    from Cura.util import pluginInfo
+    sys.path.extend(pluginInfo.getPluginBasePaths())
+    from aprinter_gcode import GcodeCommand, parse_line
+
+def make_replace_multi(match, replace):
+    """Returns a function which replaces each occurrence of match[i] in its
+    argument by replace[i], scanning left to right and preferring earlier
+    patterns at the same position. The patterns are compiled into a single
+    regular expression, and strings which cannot contain any pattern are
+    returned as they are.
+    """
     assert sum([len(m) == 0 for m in match]) == 0
     assert len(replace) == len(match)
-    pos = 0
-    result = []
-    while True:
-        nearest_pos = len(subject)
-        for i in range(len(match)):
-            match_pos = subject.find(match[i], pos)
-            if match_pos >= 0 and match_pos < nearest_pos:
-                nearest_pos = match_pos
-                nearest_match = i
-        result.append(subject[pos:nearest_pos])
-        if nearest_pos == len(subject):
-            break
-        result.append(replace[nearest_match])
-        pos = nearest_pos + len(match[nearest_match])
-    return ''.join(result)
+    if len(match) == 0:
+        return lambda subject: subject
+    regex = re.compile('|'.join([re.escape(m) for m in match]))
+    replacements = {}
+    for (m, r) in zip(match, replace):
+        replacements.setdefault(m, r)
+    first_chars = set([m[0] for m in match])
+    substitute = lambda match_obj: replacements[match_obj.group(0)]
+    def replace_func(subject):
+        for ch in first_chars:
+            if ch in subject:
+                return regex.sub(substitute, subject)
+        return subject
+    return replace_func
 
-physicalExtruders = {}
-tools = {}
+def replace_multi(subject, match, replace):
+    return make_replace_multi(match, replace)(subject)
 
-if 'filename' in locals():
-    physicalExtruders[0] = {'name':axis0, 'offsets':{'X':offset0X, 'Y':offset0Y, 'Z':offset0Z}, 'fan':fan0, 'fan_multiplier':fan_multiplier0}
-    physicalExtruders[1] = {'name':axis1, 'offsets':{'X':offset1X, 'Y':offset1Y, 'Z':offset1Z}, 'fan':fan1, 'fan_multiplier':fan_multiplier1}
-    physicalExtruders[2] = {'name':axis2, 'offsets':{'X':offset2X, 'Y':offset2Y, 'Z':offset2Z}, 'fan':fan2, 'fan_multiplier':fan_multiplier2}
-    
-    if t0extruder:
-        tools[0] = physicalExtruders[int(t0extruder)]
-    if t1extruder:
-        tools[1] = physicalExtruders[int(t1extruder)]
-    if t2extruder:
-        tools[2] = physicalExtruders[int(t2extruder)]
-    
-    inputFileName = filename
-    outputFileName = filename
-    sdcard = (sdcard_param != 0.0)
-    
-else:
-    import argparse
-    
-    parser = argparse.ArgumentParser(description='GCode post-processor for APrinter firmware.')
-    parser.add_argument('--input', dest='input', metavar='InputFile', required=True)
-    parser.add_argument('--output', dest='output', metavar='OutputFile', required=True)
-    parser.add_argument('--tool-travel-speed', dest='tool_travel_speed', metavar='Speedmm/s', required=True)
-    parser.add_argument('--physical', dest='physical', action='append', nargs=4, metavar=('AxisName', 'OffsetX', 'OffsetY', 'OffsetZ'), required=True)
-    parser.add_argument('--tool', dest='tool', action='append', nargs=2, metavar=('ToolIndex', 'PhysicalIndexFrom0'), required=True)
-    parser.add_argument('--fan', dest='fan', action='append', nargs=3, metavar=('FanSpeedCmd', 'PhysicalIndexFrom0', 'SpeedMultiplier'))
-    parser.add_argument('--sdcard', dest='sdcard', action='store_true')
-    
-    args = parser.parse_args()
-    inputFileName = args.input
-    outputFileName = args.output
-    toolTravelSpeed = float(args.tool_travel_speed)
-    for p in args.physical:
-        physicalExtruders[len(physicalExtruders)] = {'name':p[0], 'offsets':{'X':float(p[1]), 'Y':float(p[2]), 'Z':float(p[3])}, 'fan':''}
-    for t in args.tool:
-        if not t[0].isdigit():
-            raise Exception('Tool index is invalid')
-        if not (t[1].isdigit() and int(t[1]) in physicalExtruders):
-            raise Exception('Tool physical index is invalid')
-        tools[int(t[0])] = physicalExtruders[int(t[1])]
-    if args.fan:
-        for f in args.fan:
-            if not (f[1].isdigit() and int(f[1]) in physicalExtruders):
-                raise Exception('Fan physical index is invalid')
-            physicalExtruders[int(f[1])]['fan'] = f[0]
-            physicalExtruders[int(f[1])]['fan_multiplier'] = float(f[2])
-    sdcard = bool(args.sdcard)
+# Axes are kept in fixed slots, in the order in which DeTool has always
+# written them to the output. Only the first PhysAxisCount of them (not E)
+# have a physical position.
+AxisNames = 'YXZE'
+AxisIndex = dict((axisName, index) for (index, axisName) in enumerate(AxisNames))
+AxisE = AxisIndex['E']
+AxisEMask = 1 << AxisE
+PhysAxisCount = 3
+PhysAxisMask = (1 << PhysAxisCount) - 1
 
-with open(inputFileName, "r") as f:
-    lines = f.readlines()
+# The indices of the physical axes in a bit mask, for each mask, so that
+# moves only visit the axes they write.
+AxisMaskIndices = [tuple([index for index in range(PhysAxisCount) if (mask >> index) & 1]) for mask in range(1 << PhysAxisCount)]
 
-currentTool = min(tools.keys())
-currentRelative = False
-currentPhysPos = {'X':0.0, 'Y':0.0, 'Z':0.0}
-currentReqPos = {'X':0.0, 'Y':0.0, 'Z':0.0, 'E':0.0}
-currentKnown = {'X':False, 'Y':False, 'Z':False}
-currentPending = {'X':False, 'Y':False, 'Z':False}
-currentF = 999999.0
-currentFanSpeed = 0.0
-currentIgnore = False
+# Creates GcodeCommand records without going through the Python-level
+# constructor of the namedtuple, as aprinter_gcode.parse_line does.
+_new_tuple = tuple.__new__
 
-subst_match = ['{T%sAxis}' % (i) for i in tools] + ['?T%sAxis?' % (i) for i in tools]
-subst_replace = [tools[i]['name'] for i in tools] + [tools[i]['name'] for i in tools]
+class DeToolState(object):
+    """The state tracked by detool_commands, with per-axis values in lists
+    indexed as AxisNames. The lists are updated in place, but each move
+    still builds its parameters and output record.
+    """
+    __slots__ = ('tool', 'relative', 'physPos', 'reqPos', 'known', 'pending', 'f', 'fanSpeed', 'ignore')
+    
+    def __init__(self, tool):
+        self.tool = tool
+        self.relative = False
+        self.physPos = [0.0] * PhysAxisCount
+        self.reqPos = [0.0] * len(AxisNames)
+        self.known = [False] * PhysAxisCount
+        self.pending = [False] * PhysAxisCount
+        self.f = 999999.0
+        self.fanSpeed = 0.0
+        self.ignore = False
 
-with open(outputFileName, "w") as f:
+def detool_commands(inputLines, tools, toolTravelSpeed, sdcard, state=None):
+    """Generator which rewrites the lines of the input for the given tools.
+    It yields comment text (not in sdcard mode), input lines to be kept
+    as GcodeLine records, and generated commands as GcodeCommand records.
+    A new DeToolState may be given to be able to follow the state.
+    """
+    if state is None:
+        state = DeToolState(min(tools.keys()))
+    physPos = state.physPos
+    reqPos = state.reqPos
+    known = state.known
+    pending = state.pending
+    newReqPos = list(reqPos)
+    physRange = range(PhysAxisCount)
+    toolOffsets = dict((tool, [tools[tool]['offsets'][axisName] for axisName in AxisNames[:PhysAxisCount]]) for tool in tools)
+    offsets = toolOffsets[state.tool]
+    toolName = tools[state.tool]['name']
+    relative = state.relative
+    
+    subst_match = ['{T%sAxis}' % (i) for i in tools] + ['?T%sAxis?' % (i) for i in tools]
+    subst_replace = [tools[i]['name'] for i in tools] + [tools[i]['name'] for i in tools]
+    substitute = make_replace_multi(subst_match, subst_replace)
+    
     if not sdcard:
-        f.write(';DeTool init\n')
-    f.write('G90\n')
+        yield ';DeTool init\n'
+    yield GcodeCommand('G90', [])
     for tool in tools:
-        f.write('G92 %s%.5f\n' % (tools[tool]['name'], currentReqPos['E']))
-    f.write('G0 F%.1f\n' % (currentF))
-    if tools[currentTool]['fan']:
-        f.write('%s S%.2f\n' % (tools[currentTool]['fan'], currentFanSpeed * tools[currentTool]['fan_multiplier']))
+        yield GcodeCommand('G92', [(tools[tool]['name'], reqPos[AxisE], 5)])
+    yield GcodeCommand('G0', [('F', state.f, 1)])
+    if tools[state.tool]['fan']:
+        yield GcodeCommand(tools[state.tool]['fan'], [('S', state.fanSpeed * tools[state.tool]['fan_multiplier'], 2)])
     if not sdcard:
-        f.write(';DeTool init end\n')
+        yield ';DeTool init end\n'
     
-    for line in lines:
+    for line in inputLines:
         line = line.strip()
-        line = replace_multi(line, subst_match, subst_replace)
-        commentPos = line.find(';')
-        if commentPos < 0:
-            commentPos = len(line)
-        dataLine = line[:commentPos]
-        commentLine = line[commentPos:]
-        oldIgnore = currentIgnore
-        if commentLine.find('DeToolIgnoreSection') >= 0:
-            currentIgnore = True
-        elif commentLine.find('DeToolEndIgnoreSection') >= 0:
-            currentIgnore = False
-        comps = dataLine.split()
-        newLine = (dataLine if sdcard else line) + '\n'
-        if len(comps) == 0 or oldIgnore or commentLine.find('DeToolKeep') >= 0:
+        line = substitute(line)
+        record = parse_line(line)
+        commentLine = record.comment
+        oldIgnore = state.ignore
+        if commentLine:
+            if commentLine.find('DeToolIgnoreSection') >= 0:
+                state.ignore = True
+            elif commentLine.find('DeToolEndIgnoreSection') >= 0:
+                state.ignore = False
+        comps = record.words
+        if len(comps) == 0 or oldIgnore or (commentLine and commentLine.find('DeToolKeep') >= 0):
             if not sdcard or len(comps) != 0:
-                f.write(newLine)
+                yield record
             continue
+        command = comps[0]
+        
+        if command == 'G0' or command == 'G1':
+            newF = state.f
+            newReqPos[:] = reqPos
+            seenAxes = 0
+            for (letter, value) in record.params():
+                if value is None:
+                    raise Exception('Got parameter without a value in G0 or G1')
+                if letter == 'F':
+                    newF = value
+                    continue
+                index = AxisIndex.get(letter)
+                if index is None:
+                    raise Exception('Unknown axis in G0 or G1')
+                if relative:
+                    if index != AxisE and not known[index]:
+                        raise Exception('Got relative move with axis whose position is unknown')
+                    newReqPos[index] += value
+                else:
+                    newReqPos[index] = value
+                seenAxes |= 1 << index
+            anyPending = pending[0] or pending[1] or pending[2]
+            if command == 'G1' or (seenAxes & PhysAxisMask) == 0:
+                if anyPending:
+                    travelParams = []
+                    for index in physRange:
+                        if pending[index]:
+                            assert known[index]
+                            physPos[index] = reqPos[index] + offsets[index]
+                            pending[index] = False
+                            travelParams.append((AxisNames[index], physPos[index], 5))
+                    travelParams.append(('F', toolTravelSpeed * 60.0, 1))
+                    if not sdcard:
+                        yield ';DeTool travel after tool change\n'
+                    yield GcodeCommand('G0', travelParams)
+                    yield GcodeCommand('G0', [('F', state.f, 1)])
+                    if not sdcard:
+                        yield ';DeTool travel after tool change end\n'
+            elif anyPending:
+                if not sdcard:
+                    yield ';DeTool merging tool change with G0\n'
+            newParams = []
+            if newF != state.f:
+                newParams.append(('F', newF, 1))
+            writeMask = seenAxes & PhysAxisMask
+            if anyPending:
+                for index in physRange:
+                    if pending[index]:
+                        writeMask |= 1 << index
+            for index in AxisMaskIndices[writeMask]:
+                axisReqPhysPos = newReqPos[index] + offsets[index]
+                newParams.append((AxisNames[index], axisReqPhysPos, 5))
+                physPos[index] = axisReqPhysPos
+                pending[index] = False
+                known[index] = True
+            if seenAxes & AxisEMask:
+                newParams.append((toolName, newReqPos[AxisE], 5))
+            state.f = newF
+            reqPos[:] = newReqPos
+            yield _new_tuple(GcodeCommand, (command, newParams))
         
-        if comps[0].startswith('T'):
-            newLine = ''
-            toolStr = comps[0][1:]
+        elif command.startswith('T'):
+            toolStr = command[1:]
             if not (toolStr.isdigit() and int(toolStr) in tools):
                 raise Exception('Invalid tool in T command')
             newTool = int(toolStr)
-            if newTool != currentTool:
+            if newTool != state.tool:
                 toolName = tools[newTool]['name']
                 if not sdcard:
-                    newLine += ';DeTool switch to tool %s (%s)\n' % (newTool, toolName)
-                newLine += 'G92 %s%.5f\n' % (toolName, currentReqPos['E'])
-                for axisName in currentPhysPos:
-                    if not currentKnown[axisName]:
+                    yield ';DeTool switch to tool %s (%s)\n' % (newTool, toolName)
+                yield GcodeCommand('G92', [(toolName, reqPos[AxisE], 5)])
+                for index in physRange:
+                    if not known[index]:
                         raise Exception('Got tool change while position is unknown')
-                    currentPending[axisName] = True
-                if tools[currentTool]['fan']:
-                    newLine += '%s S0\n' % (tools[currentTool]['fan'])
+                    pending[index] = True
+                if tools[state.tool]['fan']:
+                    yield GcodeCommand(tools[state.tool]['fan'], [('S', 0, None)])
                 if tools[newTool]['fan']:
-                    newLine += '%s S%.2f\n' % (tools[newTool]['fan'], currentFanSpeed * tools[newTool]['fan_multiplier'])
+                    yield GcodeCommand(tools[newTool]['fan'], [('S', state.fanSpeed * tools[newTool]['fan_multiplier'], 2)])
                 if not sdcard:
-                    newLine += ';DeTool switch end\n'
-                currentTool = newTool
+                    yield ';DeTool switch end\n'
+                state.tool = newTool
+                offsets = toolOffsets[newTool]
+                toolName = tools[newTool]['name']
             
-        elif comps[0] == 'G28':
+        elif command == 'G28':
             homeAxes = []
-            for i in range(1, len(comps)):
-                axisName = comps[i][0]
-                if not axisName in currentPhysPos:
+            for comp in comps[1:]:
+                index = AxisIndex.get(comp[0])
+                if index is None or index >= PhysAxisCount:
                     raise Exception('Got G28 with unknown axis')
-                homeAxes.append(axisName)
+                homeAxes.append(index)
             if len(homeAxes) == 0:
-                homeAxes = currentPhysPos.keys()
-            for axisName in homeAxes:
-                currentKnown[axisName] = False
-                currentPending[axisName] = False
+                homeAxes = physRange
+            for index in homeAxes:
+                known[index] = False
+                pending[index] = False
+            yield record
             
-        elif comps[0] == 'G90':
-            currentRelative = False
-            newLine = ''
+        elif command == 'G90':
+            state.relative = relative = False
             if not sdcard:
-                newLine = ';DeTool absolute\n'
+                yield ';DeTool absolute\n'
             
-        elif comps[0] == 'G91':
-            currentRelative = True
-            newLine = ''
+        elif command == 'G91':
+            state.relative = relative = True
             if not sdcard:
-                newLine = ';DeTool relative\n'
+                yield ';DeTool relative\n'
             
-        elif comps[0] == 'G92':
-            newComps = [comps[0]]
-            for i in range(1, len(comps)):
-                comp = comps[i]
-                if len(comp) == 0 or not comp[0] in currentReqPos:
+        elif command == 'G92':
+            newParams = []
+            for (letter, value) in record.params():
+                index = AxisIndex.get(letter)
+                if index is None:
                     raise Exception('Got G92 with unknown axis')
-                axisName = comp[0]
-                value = float(comp[1:])
-                if axisName == 'E':
-                    comp = '%s%.5f' % (tools[currentTool]['name'], value)
+                if value is None:
+                    raise Exception('Got G92 with parameter without a value')
+                if index == AxisE:
+                    newParams.append((toolName, value, 5))
                 else:
-                    if currentKnown[axisName]:
-                        currentPhysPos[axisName] += value - currentReqPos[axisName]
+                    if known[index]:
+                        physPos[index] += value - reqPos[index]
                     else:
-                        currentPhysPos[axisName] = value + tools[currentTool]['offsets'][axisName]
-                        currentKnown[axisName] = True
-                    comp = '%s%.5f' % (axisName, currentPhysPos[axisName])
-                currentReqPos[axisName] = value
-                newComps.append(comp)
-            newLine = '%s\n' % (' '.join(newComps))
+                        physPos[index] = value + offsets[index]
+                        known[index] = True
+                    newParams.append((letter, physPos[index], 5))
+                reqPos[index] = value
+            yield GcodeCommand(command, newParams)
         
-        elif comps[0] == 'M106' or comps[0] == 'M107':
-            for i in range(1, len(comps)):
-                comp = comps[i]
-                if comps[0] == 'M106' and len(comp) > 0 and comp[0] == 'S':
-                    currentFanSpeed = float(comp[1:])
+        elif command == 'M106' or command == 'M107':
+            for (letter, value) in record.params():
+                if command == 'M106' and letter == 'S' and value is not None:
+                    state.fanSpeed = value
                 else:
                     raise Exception('Got unknown parameter in M106 or M107')
-            if comps[0] == 'M107':
-                currentFanSpeed = 0.0
-            newLine = ''
-            if tools[currentTool]['fan']:
-                newLine = '%s S%.2f\n' % (tools[currentTool]['fan'], currentFanSpeed * tools[currentTool]['fan_multiplier'])
-        
-        elif comps[0] == 'G0' or comps[0] == 'G1':
-            newLine = ''
-            newF = currentF
-            newReqPos = currentReqPos.copy()
-            seenAxes = []
-            for i in range(1, len(comps)):
-                comp = comps[i]
-                if len(comp) > 0 and comp[0] == 'F':
-                    newF = float(comp[1:])
-                elif len(comp) > 0 and comp[0] in currentReqPos:
-                    if currentRelative:
-                        if comp[0] != 'E' and not currentKnown[comp[0]]:
-                            raise Exception('Got relative move with axis whose position is unknown')
-                        newReqPos[comp[0]] += float(comp[1:])
-                    else:
-                        newReqPos[comp[0]] = float(comp[1:])
-                    seenAxes.append(comp[0])
-                else:
-                    raise Exception('Unknown axis in G0 or G1')
-            if comps[0] == 'G1' or len([axisName for axisName in seenAxes if axisName in currentPhysPos]) == 0:
-                pendingAxes = []
-                for axisName in currentPhysPos:
-                    if currentPending[axisName]:
-                        assert currentKnown[axisName]
-                        pendingAxes.append(axisName)
-                        currentPhysPos[axisName] = currentReqPos[axisName] + tools[currentTool]['offsets'][axisName]
-                        currentPending[axisName] = False
-                if len(pendingAxes) > 0:
-                    if not sdcard:
-                        newLine += ';DeTool travel after tool change\n'
-                    newLine += \
-                        'G0 %s F%.1f\n' % (' '.join(['%s%.5f' % (axisName, currentPhysPos[axisName]) for axisName in pendingAxes]), toolTravelSpeed * 60.0) + \
-                        'G0 F%.1f\n' % (currentF)
-                    if not sdcard:
-                        newLine += ';DeTool travel after tool change end\n'
-            elif sum(currentPending.values()) > 0:
-                if not sdcard:
-                    newLine += ';DeTool merging tool change with G0\n'
-            newLine += comps[0]
-            if newF != currentF:
-                newLine += ' F%.1f' % (newF)
-            for axisName in currentReqPos:
-                if axisName in seenAxes or (axisName != 'E' and currentPending[axisName]):
-                    axisCurrentPhysPos = currentPhysPos[axisName] if axisName != 'E' else currentReqPos[axisName]
-                    axisReqPhysPos = newReqPos[axisName]
-                    if axisName != 'E':
-                        axisReqPhysPos += tools[currentTool]['offsets'][axisName]
-                    realAxisName = axisName if axisName != 'E' else tools[currentTool]['name']
-                    newLine += ' %s%.5f' % (realAxisName, axisReqPhysPos)
-                    if axisName != 'E':
-                        currentPhysPos[axisName] = axisReqPhysPos
-                        currentPending[axisName] = False
-                        currentKnown[axisName] = True
-            currentF = newF
-            currentReqPos = newReqPos
-            newLine += '\n'
-        
-        f.write(newLine)
+            if command == 'M107':
+                state.fanSpeed = 0.0
+            if tools[state.tool]['fan']:
+                yield GcodeCommand(tools[state.tool]['fan'], [('S', state.fanSpeed * tools[state.tool]['fan_multiplier'], 2)])
         
+        else:
+            yield record
+    
     if not sdcard:
-        f.write(';DeTool end\n')
+        yield ';DeTool end\n'
     if sdcard:
-        f.write('EOF\n')
+        yield GcodeCommand('EOF', [])
+
+# Commands which optimize_commands may keep passing through without
+# forgetting what it knows about the machine state.
+StatelessCommands = set(['G4', 'G21', 'M104', 'M105', 'M109', 'M114', 'M117', 'M140', 'M190'])
+
+def same_written_value(a, b, digits):
+    """Tells whether the values are the same once written with the given
+    number of decimal places (or as integers if digits is None).
+    """
+    if a == b:
+        return True
+    if a is None or b is None or digits is None or not abs(a - b) < 2 * 10.0**(-digits):
+        return False
+    return '%.*f' % (digits, a) == '%.*f' % (digits, b)
+
+def optimize_commands(items, extruders=()):
+    """Generator which filters the output of detool_commands, leaving out
+    what does not change the behaviour of the machine: feedrate-only G0
+    commands and F parameters equal to the current feedrate, fan commands
+    setting the speed the fan already has, and moves to the current
+    position. Values are compared as they are written out. A feedrate
+    which is left out is instead given with the next move, so the
+    feedrate restore after a tool change travel is merged into the
+    following move. Input lines which are kept as they are and may depend
+    on or change the machine state get the pending feedrate first, and
+    make the optimizer forget what it knows about the state.
+    The names of the extruder axes are given as extruders; while M83 is
+    in effect, a move with any of them is always kept.
+    """
+    lastPos = {}
+    lastF = None
+    wantF = None
+    fanSpeeds = {}
+    relative = False
+    relativeE = False
+    for item in items:
+        itemType = type(item)
+        if itemType is GcodeCommand:
+            command, params = item
+            if command == 'G0' or command == 'G1':
+                moved = False
+                hasF = False
+                for param in params:
+                    letter = param[0]
+                    if letter == 'F':
+                        wantF = param
+                        hasF = True
+                    elif relative or (relativeE and letter in extruders):
+                        moved = True
+                    elif not same_written_value(lastPos.get(letter), param[1], param[2]):
+                        moved = True
+                        lastPos[letter] = param[1]
+                if not moved:
+                    continue
+                if wantF is not None and not same_written_value(wantF[1], lastF, wantF[2]):
+                    lastF = wantF[1]
+                    if not hasF:
+                        item = GcodeCommand(command, [wantF] + params)
+                elif hasF:
+                    item = GcodeCommand(command, [param for param in params if param[0] != 'F'])
+            elif command == 'G92':
+                if not relative:
+                    for (letter, value, digits) in params:
+                        lastPos[letter] = value
+            elif command == 'G90':
+                relative = False
+            elif command[0] == 'M' and len(params) == 1:
+                speed = params[0][1]
+                if same_written_value(fanSpeeds.get(command), speed, params[0][2]):
+                    continue
+                fanSpeeds[command] = speed
+        elif itemType is not str and len(item.words) > 0:
+            command = item.words[0]
+            if command in StatelessCommands:
+                pass
+            elif command == 'G28':
+                lastPos.clear()
+            elif command == 'G90':
+                relative = False
+            elif command == 'G91':
+                relative = True
+                lastPos.clear()
+            elif command == 'M82' or command == 'M83':
+                relativeE = (command == 'M83')
+                for letter in extruders:
+                    lastPos.pop(letter, None)
+            else:
+                if wantF is not None and not same_written_value(wantF[1], lastF, wantF[2]):
+                    yield GcodeCommand('G0', [wantF])
+                lastPos.clear()
+                lastF = None
+                wantF = None
+                fanSpeeds.clear()
+        yield item
+
+OutputBufferSize = 2**20
+
+class DeToolEngine(object):
+    """Rewrites g-code for one tool configuration. The engine has no state
+    of its own between inputs, so it can be created once and used for any
+    number of files or streams.
+    With sdcard, comments are left out for SD card printing. With optimize,
+    the commands are filtered through optimize_commands.
+    """
+    def __init__(self, tools, toolTravelSpeed, sdcard=False, optimize=False):
+        if len(tools) == 0:
+            raise Exception('No tools defined')
+        self.tools = tools
+        self.toolTravelSpeed = toolTravelSpeed
+        self.sdcard = sdcard
+        self.optimize = optimize
+    
+    @classmethod
+    def from_options(cls, toolTravelSpeed, physical, tool, fan=None, sdcard=False, optimize=False):
+        """Creates an engine from the values of the command line options;
+        see make_tools.
+        """
+        return cls(make_tools(physical, tool, fan), float(toolTravelSpeed), sdcard, optimize)
+    
+    def commands(self, inputLines, sdcard=None, state=None):
+        """Generator of the output of detool_commands for the input lines,
+        optimized if so configured.
+        """
+        items = detool_commands(inputLines, self.tools, self.toolTravelSpeed, self.sdcard if sdcard is None else sdcard, state)
+        if self.optimize:
+            items = optimize_commands(items, set(tool['name'] for tool in self.tools.values()))
+        return items
+    
+    def lines(self, inputLines, state=None):
+        """Generator which rewrites the lines of the input, yielding the
+        output text piece by piece.
+        """
+        return self._format(self.commands(inputLines, state=state))
+    
+    def _format(self, items):
+        # Writes out the output of commands as text.
+        sdcard = self.sdcard
+        for item in items:
+            itemType = type(item)
+            if itemType is GcodeCommand:
+                yield item.format() + '\n'
+            elif itemType is str:
+                yield item
+            elif sdcard:
+                yield item.data + '\n'
+            else:
+                yield item.data + item.comment + '\n'
+    
+    def packets(self, inputLines, state=None):
+        """Generator which rewrites the lines of the input for SD card
+        printing and yields the packed g-code, the same as running
+        aprinter_encode.py on the sdcard output, except that the commands
+        go straight to the encoder without being written out. Encoding
+        errors are reported with the number of the input line, like
+        aprinter_encode.py does.
+        """
+        from aprinter_encode import EncodeLineErrors, encode_command, encode_record
+        lineNumber = [0]
+        def countedLines():
+            for line in inputLines:
+                lineNumber[0] += 1
+                yield line
+        for item in self.commands(countedLines(), True, state):
+            try:
+                if type(item) is GcodeCommand:
+                    yield encode_command(item)
+                else:
+                    yield encode_record(item)
+            except EncodeLineErrors as e:
+                e.args = ('line {}: {}'.format(lineNumber[0], e.args[0]),)
+                raise
+        yield chr(0xE0)
+    
+    def checkpoint(self, state, offset, line, layer):
+        """Returns a resume index checkpoint (see aprinter_resume.py) for
+        the given state, or None if the position is not known.
+        """
+        if not all(state.known):
+            return None
+        tool = self.tools[state.tool]
+        pos = dict((AxisNames[index], state.physPos[index]) for index in range(PhysAxisCount))
+        pos[tool['name']] = state.reqPos[AxisE]
+        fans = {}
+        if tool['fan']:
+            fans[tool['fan']] = state.fanSpeed * tool['fan_multiplier']
+        return {'offset': offset, 'line': line, 'layer': layer, 'pos': pos, 'feedrate': state.f, 'fans': fans,
+                'tool': state.tool, 'phys_pos': dict(zip(AxisNames, state.physPos)), 'req_pos': dict(zip(AxisNames, state.reqPos)),
+                'fan_speed': state.fanSpeed}
+    
+    def _checkpointed(self, inputLines, state, index, layer_of):
+        # Passes the input lines through, adding checkpoints to the index
+        # before them. When the next line is asked for, the output of the
+        # previous lines has been written and the state is up to date.
+        lineNumber = 0
+        for line in inputLines:
+            lineNumber += 1
+            layer = layer_of(line)
+            if index.due(layer):
+                checkpoint = self.checkpoint(state, index.offset, lineNumber, layer)
+                if checkpoint is not None:
+                    index.add(checkpoint)
+            yield line
+    
+    def process_file(self, inputFileName, outputFileName, binary=False, indexFileName=None, indexInterval=None, createdFiles=None):
+        """Streams the input file through lines (or packets with binary)
+        into the output file. If both are the same file, the output goes to
+        a temporary file which then replaces the input, keeping its mode;
+        a symbolic link is followed to the file it points to.
+        With indexFileName, a resume index is written for the output, with
+        a checkpoint at each layer and every indexInterval commands.
+        The names of the files opened for writing are appended to the
+        createdFiles list if given, for the caller to clean up on failure.
+        """
+        sameFile = os.path.realpath(inputFileName) == os.path.realpath(outputFileName)
+        if sameFile:
+            outputFileName = os.path.realpath(outputFileName)
+            tempFd, writeFileName = tempfile.mkstemp(prefix='.detool', dir=os.path.dirname(outputFileName))
+            os.close(tempFd)
+        else:
+            writeFileName = outputFileName
+        index = None
+        try:
+            with open(inputFileName, "r") as inputFile:
+                with open(writeFileName, "wb" if binary else "w", OutputBufferSize) as outputFile:
+                    if createdFiles is not None and not sameFile:
+                        createdFiles.append(writeFileName)
+                    write = outputFile.write
+                    inputLines = inputFile
+                    state = None
+                    if indexFileName is not None:
+                        from aprinter_resume import IndexWriter, DefaultIndexInterval, layer_of
+                        index = IndexWriter(indexFileName, binary, indexInterval or DefaultIndexInterval)
+                        if createdFiles is not None:
+                            createdFiles.append(indexFileName)
+                        state = DeToolState(min(self.tools.keys()))
+                        inputLines = self._checkpointed(inputFile, state, index, layer_of)
+                    if binary:
+                        pieces = self.packets(inputLines, state)
+                    elif index is None:
+                        pieces = self.lines(inputLines, state)
+                    else:
+                        pieces = self._format(count_commands(self.commands(inputLines, state=state), index))
+                    if index is None:
+                        for data in pieces:
+                            write(data)
+                    elif binary:
+                        for data in pieces:
+                            write(data)
+                            index.offset += len(data)
+                            if len(data) > 0:
+                                index.commands += 1
+                    else:
+                        for data in pieces:
+                            write(data)
+                            index.offset += len(data)
+            if sameFile:
+                shutil.copymode(outputFileName, writeFileName)
+                if os.name == 'nt':
+                    os.remove(outputFileName)
+                os.rename(writeFileName, outputFileName)
+        except:
+            if sameFile and os.path.exists(writeFileName):
+                os.remove(writeFileName)
+            raise
+        finally:
+            if index is not None:
+                index.close()
+
+def count_commands(items, index):
+    """Generator which passes the output of detool_commands through,
+    counting the commands in it (not comments or empty lines) in
+    index.commands.
+    """
+    for item in items:
+        itemType = type(item)
+        if itemType is GcodeCommand or (itemType is not str and len(item.words) > 0):
+            index.commands += 1
+        yield item
+
+def make_tools(physical, tool, fan):
+    """Builds the tools argument of DeToolEngine from the --physical,
+    --tool and --fan arguments, given as lists of lists of strings.
+    """
+    physicalExtruders = {}
+    tools = {}
+    for p in physical:
+        physicalExtruders[len(physicalExtruders)] = {'name':str(p[0]), 'offsets':{'X':float(p[1]), 'Y':float(p[2]), 'Z':float(p[3])}, 'fan':''}
+    for t in tool:
+        t = [str(x) for x in t]
+        if not t[0].isdigit():
+            raise Exception('Tool index is invalid')
+        if not (t[1].isdigit() and int(t[1]) in physicalExtruders):
+            raise Exception('Tool physical index is invalid')
+        tools[int(t[0])] = physicalExtruders[int(t[1])]
+    for f in (fan or []):
+        f = [str(x) for x in f]
+        if not (f[1].isdigit() and int(f[1]) in physicalExtruders):
+            raise Exception('Fan physical index is invalid')
+        physicalExtruders[int(f[1])]['fan'] = f[0]
+        physicalExtruders[int(f[1])]['fan_multiplier'] = float(f[2])
+    return tools
+
+def load_manifest(manifestFileName):
+    """Reads a batch manifest, a JSON object whose "files" member lists the
+    files to process, each an object with "input" and "output" and
+    optionally any of the settings "tool_travel_speed", "physical", "tool",
+    "fan", "sdcard", "binary", "optimize", "index" and "index_interval",
+    named and given as the command line options. Settings in the top
+    level object are defaults for all files. Returns the list of files
+    with the defaults merged in and relative paths made relative to the
+    manifest.
+    """
+    with open(manifestFileName, 'r') as manifestFile:
+        manifest = json.load(manifestFile)
+    baseDir = os.path.dirname(os.path.abspath(manifestFileName))
+    defaults = dict((key, value) for (key, value) in manifest.items() if key != 'files')
+    jobs = []
+    for entry in manifest['files']:
+        job = dict(defaults)
+        job.update(entry)
+        for key in ('input', 'output', 'index'):
+            if key in job:
+                job[key] = os.path.join(baseDir, job[key])
+        jobs.append(job)
+    return jobs
+
+def run_batch_job(job):
+    """Processes the file of one manifest entry. Returns a description of
+    the entry, the error message or None on success, and the time taken.
+    A failed file does not leave a partial output or index behind, and
+    files which the job did not get to write are left alone.
+    """
+    startTime = time.time()
+    inputFileName = job.get('input')
+    name = '%s -> %s' % (inputFileName, job.get('output'))
+    createdFiles = []
+    try:
+        engine = DeToolEngine.from_options(job['tool_travel_speed'], job['physical'], job['tool'], job.get('fan'),
+                                           bool(job.get('sdcard')), bool(job.get('optimize')))
+        engine.process_file(inputFileName, job['output'], bool(job.get('binary')), job.get('index'), job.get('index_interval'), createdFiles)
+        error = None
+    except Exception as e:
+        error = '%s: %s' % (type(e).__name__, e)
+        for fileName in createdFiles:
+            if os.path.exists(fileName):
+                os.remove(fileName)
+    return (name, error, time.time() - startTime)
+
+def run_batch(jobs, processes=None):
+    """Runs the manifest entries in a pool of worker processes, printing a
+    line for each file as it is done, in the order the files finish.
+    Returns the number of failed files.
+    """
+    import multiprocessing
+    startTime = time.time()
+    pool = multiprocessing.Pool(processes)
+    failed = 0
+    try:
+        for (name, error, seconds) in pool.imap_unordered(run_batch_job, jobs):
+            if error is None:
+                print('ok     %8.3f s  %s' % (seconds, name))
+            else:
+                failed += 1
+                print('FAILED %8.3f s  %s: %s' % (seconds, name, error))
+            sys.stdout.flush()
+        pool.close()
+    except:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+    print('%d files, %d failed, %.3f s' % (len(jobs), failed, time.time() - startTime))
+    return failed
+
+def cura_main(params):
+    """Entry point when run as a Cura plugin, which executes this script
+    with the #Param values and the file name in its namespace.
+    """
+    physicalExtruders = {}
+    for i in range(3):
+        physicalExtruders[i] = {
+            'name':params['axis%s' % (i)],
+            'offsets':{'X':params['offset%sX' % (i)], 'Y':params['offset%sY' % (i)], 'Z':params['offset%sZ' % (i)]},
+            'fan':params['fan%s' % (i)], 'fan_multiplier':params['fan_multiplier%s' % (i)]}
+    tools = {}
+    for i in range(3):
+        if params['t%sextruder' % (i)]:
+            tools[i] = physicalExtruders[int(params['t%sextruder' % (i)])]
+    engine = DeToolEngine(tools, params['toolTravelSpeed'], params['sdcard_param'] != 0.0, params['optimize_param'] != 0.0)
+    engine.process_file(params['filename'], params['filename'])
+
+def main():
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='GCode post-processor for APrinter firmware.')
+    parser.add_argument('--input', dest='input', metavar='InputFile')
+    parser.add_argument('--output', dest='output', metavar='OutputFile')
+    parser.add_argument('--tool-travel-speed', dest='tool_travel_speed', metavar='Speedmm/s')
+    parser.add_argument('--physical', dest='physical', action='append', nargs=4, metavar=('AxisName', 'OffsetX', 'OffsetY', 'OffsetZ'))
+    parser.add_argument('--tool', dest='tool', action='append', nargs=2, metavar=('ToolIndex', 'PhysicalIndexFrom0'))
+    parser.add_argument('--fan', dest='fan', action='append', nargs=3, metavar=('FanSpeedCmd', 'PhysicalIndexFrom0', 'SpeedMultiplier'))
+    parser.add_argument('--sdcard', dest='sdcard', action='store_true')
+    parser.add_argument('--binary', dest='binary', action='store_true')
+    parser.add_argument('--optimize', dest='optimize', action='store_true')
+    parser.add_argument('--index', dest='index', metavar='IndexFile')
+    parser.add_argument('--index-interval', dest='index_interval', type=int, metavar='Commands')
+    parser.add_argument('--batch', dest='batch', metavar='ManifestFile')
+    parser.add_argument('--jobs', dest='jobs', type=int, metavar='Processes')
+    
+    args = parser.parse_args()
+    if args.batch is not None:
+        if args.jobs is not None and args.jobs < 1:
+            parser.error('--jobs must be at least 1')
+        sys.exit(1 if run_batch(load_manifest(args.batch), args.jobs) > 0 else 0)
+    if args.jobs is not None:
+        parser.error('--jobs requires --batch')
+    for (value, option) in [(args.input, '--input'), (args.output, '--output'), (args.tool_travel_speed, '--tool-travel-speed'), (args.physical, '--physical'), (args.tool, '--tool')]:
+        if value is None:
+            parser.error('%s is required' % (option))
+    engine = DeToolEngine.from_options(args.tool_travel_speed, args.physical, args.tool, args.fan, bool(args.sdcard), bool(args.optimize))
+    if args.index_interval is not None and args.index_interval < 1:
+        parser.error('--index-interval must be at least 1')
+    engine.process_file(args.input, args.output, bool(args.binary), args.index, args.index_interval)
+
+# Cura runs this script with execfile, so __name__ is not '__main__' then.
+if 'filename' in locals():
+    cura_main(locals())
+elif __name__ == '__main__':
+    main()
@@ -23,96 +23,861 @@
 
 from __future__ import print_function
 from __future__ import with_statement
+import os
+import sys
+import time
 import struct
-
-class GcodeSyntaxError(Exception):
-    pass
+from aprinter_gcode import GcodeSyntaxError, parse_line, parse_params
 
 EncodeLineErrors = GcodeSyntaxError
 
-def encode_line(line):
-    comment_index = line.find(';')
-    if comment_index >= 0:
-        line = line[:comment_index]
-    line = line.strip()
-    if len(line) == 0:
+class EncodingPolicy(object):
+    # Chooses the encoding of parameters with real values, which are
+    # otherwise always encoded as float. The first of uint32 (for
+    # non-negative integral values), float and double (only if allowed)
+    # which preserves the value is used. With a precision given, a value
+    # is preserved if it is within half a unit of the last of that many
+    # decimal places; otherwise it must be preserved exactly. If no type
+    # preserves the value, float is used. Where float is used, uint32 is
+    # still chosen if it preserves the value after rounding to float, so
+    # that encoding the decoded text gives the same packet.
+    def __init__(self, precision=None, allow_double=False):
+        self.precision = precision
+        self.allow_double = allow_double
+        self._tolerance = 0.0 if precision is None else 0.5 * 10.0**(-precision)
+    
+    def encode_real(self, value):
+        packet = self._encode_integral(value)
+        if packet is not None:
+            return packet
+        try:
+            float_payload = struct.pack('<f', value)
+        except OverflowError:
+            if self.allow_double:
+                return (2, struct.pack('<d', value))
+            raise _float_range_error()
+        float_value = struct.unpack('<f', float_payload)[0]
+        if self.allow_double and float_value != value and abs(float_value - value) > self._tolerance:
+            return (2, struct.pack('<d', value))
+        packet = self._encode_integral(float_value)
+        if packet is not None:
+            return packet
+        return (1, float_payload)
+    
+    def _encode_integral(self, value):
+        if value == value and abs(value) < 2**33:
+            integral_value = round(value)
+            if 0 <= integral_value < 2**32 and abs(integral_value - value) <= self._tolerance:
+                return (3, struct.pack('<I', int(integral_value)))
+        return None
+
+def encode_line(line, policy=None):
+    if policy is None and type(line) is str:
+        packet = _encode_small_line(line)
+        if packet is not None:
+            return packet
+    return encode_record(parse_line(line), policy)
+
+def encode_record(record, policy=None):
+    # Encodes a line already parsed by aprinter_gcode.parse_line.
+    _, _, code, parts, _, checksum = record
+    if len(parts) == 0:
         return ''
-    parts = line.split()
-    cmd_letter = parts[0][0]
-    if cmd_letter == 'E':
+    if checksum is not None and not record.checksum_ok():
+        raise GcodeSyntaxError('checksum mismatch')
+    if policy is None:
+        small_command_code = _FastSmallCommands.get(parts[0])
+        if small_command_code is not None:
+            packet = _encode_small_command(small_command_code, parts, code)
+            if packet is not None:
+                return packet
+    return _encode_parts(parts, policy)
+
+def encode_command(command, policy=None):
+    # Encodes an aprinter_gcode.GcodeCommand, producing the same packet as
+    # encode_line(command.format()) but without going through text. Each
+    # value is still rounded to its decimal places as the text would be.
+    command_word, command_params = command
+    if policy is None and command_word in _FastSmallCommands:
+        packet = _encode_small_command_generated(command_word, command_params)
+        if packet is not None:
+            return packet
+    if len(command_params) > 14:
+        raise GcodeSyntaxError('too many parameters')
+    params = []
+    for (param_letter, value, digits) in command_params:
+        if len(param_letter) != 1 or not _letter_ok(param_letter):
+            raise GcodeSyntaxError('invalid parameter letter')
+        if digits is None:
+            value = int(value)
+            if not (value >= 0 and value < 2**64):
+                value = float(value)
+        elif digits == 0:
+            # Written without a '.', so the text is taken as an integer
+            # where it is one.
+            text = '%.0f' % value
+            try:
+                value = int(text)
+                if not (value >= 0 and value < 2**64):
+                    value = float(text)
+            except ValueError:
+                value = float(text)
+        else:
+            value = float('%.*f' % (digits, value))
+        params.append((param_letter, value))
+    parsed_word = _parse_command_word(command_word)
+    if parsed_word is None:
         return chr(0xE0)
+    return _encode_params(parsed_word[0], parsed_word[1], params, policy)
+
+def _parse_parts(parts):
+    # Returns None for EOF, otherwise (cmd_letter, cmd_number, params)
+    # where params is a list of (letter, value) with the value being
+    # None for void parameters, an int for unsigned integers which fit
+    # into 64 bits and a float otherwise.
+    command = _parse_command_word(parts[0])
+    if command is None:
+        return None
+    cmd_letter, cmd_number = command
+    if len(parts) - 1 > 14:
+        raise GcodeSyntaxError('too many parameters')
+    for part in parts[1:]:
+        if not _letter_ok(part[0]):
+            raise GcodeSyntaxError('invalid parameter letter')
+    return (cmd_letter, cmd_number, parse_params(parts[1:]))
+
+def _parse_command_word(word):
+    # Returns None for EOF, otherwise (cmd_letter, cmd_number).
+    cmd_letter = word[0]
+    if cmd_letter == 'E':
+        return None
     if not _letter_ok(cmd_letter):
         raise GcodeSyntaxError('invalid command letter')
     try:
-        cmd_number = int(parts[0][1:])
+        cmd_number = int(word[1:])
     except ValueError:
         raise GcodeSyntaxError('invalid command number')
     if not (cmd_number >= 0 and cmd_number < 2048):
         raise GcodeSyntaxError('invalid command number')
-    packet_index = ''
-    packet_payload = ''
-    num_params = len(parts) - 1
-    if num_params > 14:
-        raise GcodeSyntaxError('too many parameters')
-    for part in parts[1:]:
-        param_letter = part[0]
-        if not _letter_ok(param_letter):
-            raise GcodeSyntaxError('invalid parameter letter')
-        param_value = part[1:]
-        if param_value == '':
-            encode_as = 'void'
-        else:
-            encode_as = 'integer'
-            try:
-                integer_value = int(param_value)
-                if not (integer_value >= 0 and integer_value < 2**64):
-                    raise ValueError()
-            except ValueError:
-                encode_as = 'real'
-                try:
-                    real_value = float(param_value)
-                except ValueError:
-                    raise GcodeSyntaxError('invalid command argument')
-        if encode_as == 'void':
-            type_code = 5
-            param_payload = ''
-        elif encode_as == 'integer':
-            if integer_value < 2**32:
-                type_code = 3
-                param_payload = struct.pack('<I', integer_value)
-            else:
-                type_code = 4
-                param_payload = struct.pack('<Q', integer_value)
-        elif encode_as == 'real':
-            type_code = 1
-            param_payload = struct.pack('<f', real_value)
-        packet_index += chr((type_code << 5) + (ord(param_letter) - ord('A')))
-        packet_payload += param_payload
+    return (cmd_letter, cmd_number)
+
+def _encode_header(cmd_letter, cmd_number, index_size):
     if (cmd_letter, cmd_number) in _SmallCommands:
         command_type_code = _SmallCommands[(cmd_letter, cmd_number)]
         packet_header_large = ''
     else:
         command_type_code = 15
         packet_header_large = struct.pack('BB', ((ord(cmd_letter) - ord('A')) << 3) + (cmd_number >> 8), (cmd_number & 0xFF))
-    packet_header = struct.pack('B', (command_type_code << 4) + num_params) + packet_header_large
-    packet = packet_header + packet_index + packet_payload
-    return packet
+    return struct.pack('B', (command_type_code << 4) + index_size) + packet_header_large
+
+def _pack_float(value):
+    try:
+        return struct.pack('<f', value)
+    except OverflowError:
+        raise _float_range_error()
+
+def _float_range_error():
+    return GcodeSyntaxError('command argument out of float range')
+
+def _encode_integer(value):
+    if value < 2**32:
+        return (3, struct.pack('<I', value))
+    return (4, struct.pack('<Q', value))
+
+def _encode_parts(parts, policy=None):
+    command = _parse_parts(parts)
+    if command is None:
+        return chr(0xE0)
+    return _encode_params(command[0], command[1], command[2], policy)
+
+def _encode_params(cmd_letter, cmd_number, params, policy):
+    packet_index = []
+    packet_payload = []
+    for (param_letter, value) in params:
+        if value is None:
+            type_code = 5
+            param_payload = ''
+        elif isinstance(value, float):
+            if policy is None:
+                type_code = 1
+                param_payload = _pack_float(value)
+            else:
+                type_code, param_payload = policy.encode_real(value)
+        else:
+            type_code, param_payload = _encode_integer(value)
+        packet_index.append(chr((type_code << 5) + (ord(param_letter) - ord('A'))))
+        packet_payload.append(param_payload)
+    return _encode_header(cmd_letter, cmd_number, len(params)) + ''.join(packet_index) + ''.join(packet_payload)
+
+class DeltaEncoder(object):
+    # Encoder for the delta profile, a denser variant of the packed format
+    # which only the Python decoder (DeltaDecoder) understands, not the
+    # firmware. It differs from the standard format as follows:
+    # - The file starts with DeltaProfileMagic, a version byte and the
+    #   number of decimal digits D of the quantum (10^-D).
+    # - Index size 15 in the header means that the index is the same as in
+    #   the previous packet, and is not repeated.
+    # - Parameter types 6 and 7 (int8 and int16 little endian) are deltas,
+    #   in quanta, from the previous value of the same parameter letter.
+    # The previous value of a letter is what the decoder decodes for it,
+    # rounded to quanta. Deltas are only used for values written with a
+    # decimal point which are whole multiples of the quantum.
+    def __init__(self, quantum_digits=3):
+        self.file_header = DeltaProfileMagic + chr(DeltaProfileVersion) + chr(quantum_digits)
+        self._scale = 10.0**quantum_digits
+        self._last = {}
+        self._last_index = None
+    
+    def encode_line(self, line):
+        return self.encode_record(parse_line(line))
+    
+    def encode_record(self, record):
+        parts = record.words
+        if len(parts) == 0:
+            return ''
+        if record.checksum is not None and not record.checksum_ok():
+            raise GcodeSyntaxError('checksum mismatch')
+        command = _parse_parts(parts)
+        if command is None:
+            return chr(0xE0)
+        cmd_letter, cmd_number, params = command
+        last = self._last
+        scale = self._scale
+        packet_index = []
+        packet_payload = []
+        for (param_letter, value) in params:
+            if value is None:
+                type_code = 5
+                param_payload = ''
+                last.pop(param_letter, None)
+            elif isinstance(value, float):
+                type_code = None
+                last_quanta = last.get(param_letter)
+                quanta = _delta_quantize(value, scale)
+                if last_quanta is not None and quanta is not None and quanta / scale == value:
+                    delta = quanta - last_quanta
+                    if delta >= -2**7 and delta < 2**7:
+                        type_code = 6
+                        param_payload = struct.pack('<b', delta)
+                    elif delta >= -2**15 and delta < 2**15:
+                        type_code = 7
+                        param_payload = struct.pack('<h', delta)
+                if type_code is not None:
+                    last[param_letter] = quanta
+                else:
+                    type_code = 1
+                    param_payload = _pack_float(value)
+                    last[param_letter] = _delta_quantize(struct.unpack('<f', param_payload)[0], scale)
+            else:
+                type_code, param_payload = _encode_integer(value)
+                last[param_letter] = _delta_quantize(value, scale)
+            packet_index.append(chr((type_code << 5) + (ord(param_letter) - ord('A'))))
+            packet_payload.append(param_payload)
+        packet_index = ''.join(packet_index)
+        if len(params) > 0 and packet_index == self._last_index:
+            header = _encode_header(cmd_letter, cmd_number, 15)
+            packet_index = ''
+        else:
+            header = _encode_header(cmd_letter, cmd_number, len(params))
+            self._last_index = packet_index
+        return header + packet_index + ''.join(packet_payload)
+
+DeltaProfileMagic = 'APGD'
+DeltaProfileVersion = 1
+
+def _delta_quantize(value, scale):
+    quanta = value * scale
+    if not (abs(quanta) < 2**53):
+        return None
+    return int(round(quanta))
 
 EncodeFileErrors = (IOError, GcodeSyntaxError)
 
-def encode_file(input_file_name, output_file_name):
-    line_num = 0
-    with open(input_file_name, "r") as input_file:
-        with open(output_file_name, "w") as output_file:
-            for line in input_file:
-                line_num += 1
-                try:
-                    encoded_data = encode_line(line)
-                except GcodeSyntaxError as e:
-                    e.args = ('line {}: {}'.format(line_num, e.args[0]),)
-                    raise
-                output_file.write(encoded_data)
-            output_file.write(chr(0xE0))
+DefaultReadBlockSize = 2**20
+DefaultWriteBufferSize = 2**20
+
+class EncodeStats(object):
+    def __init__(self):
+        self.input_bytes = 0
+        self.output_bytes = 0
+        self.lines = 0
+        self.seconds = 0.0
+    
+    def summary(self):
+        seconds = max(self.seconds, 1e-9)
+        ratio = self.output_bytes / float(max(self.input_bytes, 1))
+        return '{} lines, {} -> {} bytes ({:.1%}) in {:.3f} s ({:.2f} MB/s, {:.0f} lines/s)'.format(
+            self.lines, self.input_bytes, self.output_bytes, ratio, self.seconds,
+            self.input_bytes / seconds / 1e6, self.lines / seconds)
+
+class _OutputBuffer(object):
+    def __init__(self, output_file, size):
+        self._output_file = output_file
+        self._buf = bytearray(size)
+        self._pos = 0
+        self.written = 0
+    
+    def append(self, data):
+        pos = self._pos
+        end = pos + len(data)
+        if end > len(self._buf):
+            self.flush()
+            pos = 0
+            end = len(data)
+            if end > len(self._buf):
+                self._output_file.write(data)
+                self.written += end
+                return
+        self._buf[pos:end] = data
+        self._pos = end
+    
+    def tell(self):
+        return self.written + self._pos
+    
+    def flush(self):
+        if self._pos > 0:
+            self._output_file.write(buffer(self._buf, 0, self._pos))
+            self.written += self._pos
+            self._pos = 0
+
+def _iter_line_chunks(input_file, read_block_size, stats):
+    # Yields chunks of complete lines, without the final newline,
+    # reading the input in large blocks.
+    partial = ''
+    while True:
+        block = input_file.read(read_block_size)
+        if len(block) == 0:
+            break
+        stats.input_bytes += len(block)
+        last_newline = block.rfind('\n')
+        if last_newline < 0:
+            partial += block
+            continue
+        chunk = partial + block[:last_newline]
+        partial = block[(last_newline + 1):]
+        yield chunk
+    if len(partial) > 0:
+        yield partial
+
+def _line_encoder(policy):
+    if policy is None:
+        return encode_line
+    return lambda line: encode_line(line, policy)
+
+class _IndexingLineEncoder(object):
+    # Line encoder which adds checkpoints to a resume index (see
+    # aprinter_resume.py) before the lines, as due.
+    def __init__(self, policy, index, output):
+        from aprinter_resume import PositionTracker, layer_of
+        self._policy = policy
+        self._index = index
+        self._output = output
+        self._tracker = PositionTracker()
+        self._layer_of = layer_of
+        self._line_num = 0
+    
+    def __call__(self, line):
+        self._line_num += 1
+        record = parse_line(line)
+        layer = self._layer_of(record.comment) if len(record.comment) > 0 else None
+        if self._index.due(layer) and self._tracker.ready():
+            self._index.add(self._tracker.checkpoint(self._output.tell(), self._line_num, layer))
+        encoded_data = encode_record(record, self._policy)
+        if len(encoded_data) > 0:
+            self._index.commands += 1
+        self._tracker.update(record)
+        return encoded_data
+
+def _encode_chunk_into(chunk, first_line_num, append, encode):
+    line_num = first_line_num
+    for line in chunk.split('\n'):
+        try:
+            encoded_data = encode(line)
+        except GcodeSyntaxError as e:
+            e.args = ('line {}: {}'.format(line_num, e.args[0]),)
+            raise
+        append(encoded_data)
+        line_num += 1
+    return line_num - first_line_num
+
+def _encode_chunk(chunk, first_line_num, policy):
+    encoded = []
+    _encode_chunk_into(chunk, first_line_num, encoded.append, _line_encoder(policy))
+    return ''.join(encoded)
+
+def encode_stream(input_file, output_file, read_block_size=DefaultReadBlockSize, write_buffer_size=DefaultWriteBufferSize, policy=None, delta_encoder=None, index=None):
+    # With index, an aprinter_resume.IndexWriter, checkpoints are added to
+    # it; this cannot be combined with delta_encoder.
+    stats = EncodeStats()
+    start_time = time.time()
+    output = _OutputBuffer(output_file, write_buffer_size)
+    if delta_encoder is not None:
+        output.append(delta_encoder.file_header)
+        encode = delta_encoder.encode_line
+    elif index is not None:
+        encode = _IndexingLineEncoder(policy, index, output)
+    else:
+        encode = _line_encoder(policy)
+    for chunk in _iter_line_chunks(input_file, read_block_size, stats):
+        stats.lines += _encode_chunk_into(chunk, stats.lines + 1, output.append, encode)
+    output.append(chr(0xE0))
+    output.flush()
+    stats.output_bytes = output.written
+    stats.seconds = time.time() - start_time
+    return stats
+
+DefaultChunkSize = 4 * 2**20
+
+def encode_stream_parallel(input_file, output_file, jobs, chunk_size=DefaultChunkSize, policy=None):
+    # Chunks are encoded by a process pool and written in order.
+    # At most 2*jobs chunks are in flight, bounding memory use.
+    import collections
+    import multiprocessing
+    stats = EncodeStats()
+    start_time = time.time()
+    pool = multiprocessing.Pool(jobs)
+    try:
+        in_flight = collections.deque()
+        def write_oldest():
+            encoded_data = in_flight.popleft().get()
+            output_file.write(encoded_data)
+            stats.output_bytes += len(encoded_data)
+        for chunk in _iter_line_chunks(input_file, chunk_size, stats):
+            if len(in_flight) >= 2 * jobs:
+                write_oldest()
+            in_flight.append(pool.apply_async(_encode_chunk, (chunk, stats.lines + 1, policy)))
+            stats.lines += chunk.count('\n') + 1
+        while len(in_flight) > 0:
+            write_oldest()
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+    output_file.write(chr(0xE0))
+    stats.output_bytes += 1
+    stats.seconds = time.time() - start_time
+    return stats
+
+def encode_file(input_file_name, output_file_name, jobs=1, policy=None, delta_digits=None, index_file_name=None, index_interval=None):
+    # A file name of "-" means standard input or output.
+    # With index_file_name, a resume index is written (see aprinter_resume.py).
+    with _open_std(input_file_name, "rb", sys.stdin) as input_file:
+        with _open_std(output_file_name, "wb", sys.stdout) as output_file:
+            if index_file_name is not None:
+                from aprinter_resume import IndexWriter, DefaultIndexInterval
+                with IndexWriter(index_file_name, True, index_interval or DefaultIndexInterval) as index:
+                    return encode_stream(input_file, output_file, policy=policy, index=index)
+            if delta_digits is not None:
+                return encode_stream(input_file, output_file, delta_encoder=DeltaEncoder(delta_digits))
+            if jobs > 1:
+                return encode_stream_parallel(input_file, output_file, jobs, policy=policy)
+            return encode_stream(input_file, output_file, policy=policy)
+
+class _StdFile(object):
+    def __init__(self, std_file):
+        self._std_file = std_file
+    
+    def __enter__(self):
+        return self._std_file
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._std_file.flush()
+
+def _open_std(file_name, mode, std_file):
+    if file_name == '-':
+        return _StdFile(std_file)
+    return open(file_name, mode)
+
+class StreamEncoder(object):
+    # Incremental encoder for g-code arriving in arbitrary pieces, e.g.
+    # from a pipe or socket. Lines split across pieces are reassembled.
+    # feed() takes str, unicode or bytearray (as filled by recv_into or
+    # readinto) and returns the packets of all lines completed so far, and
+    # finish() the packets of any unterminated last line and the EOF packet.
+    def __init__(self, policy=None, delta_digits=None):
+        self._partial = ''
+        self._lines = 0
+        self._header = ''
+        if delta_digits is not None:
+            delta_encoder = DeltaEncoder(delta_digits)
+            self._header = delta_encoder.file_header
+            self._encode = delta_encoder.encode_line
+        else:
+            self._encode = _line_encoder(policy)
+    
+    def feed(self, data):
+        if isinstance(data, unicode):
+            data = data.encode('utf-8')
+        elif isinstance(data, bytearray):
+            data = bytes(data)
+        last_newline = data.rfind('\n')
+        if last_newline < 0:
+            self._partial += data
+            return self._take_header()
+        chunk = self._partial + data[:last_newline]
+        self._partial = data[(last_newline + 1):]
+        encoded = [self._take_header()]
+        self._lines += _encode_chunk_into(chunk, self._lines + 1, encoded.append, self._encode)
+        return ''.join(encoded)
+    
+    def finish(self):
+        encoded = [self._take_header()]
+        if len(self._partial) > 0:
+            self._lines += _encode_chunk_into(self._partial, self._lines + 1, encoded.append, self._encode)
+            self._partial = ''
+        encoded.append(chr(0xE0))
+        return ''.join(encoded)
+    
+    def _take_header(self):
+        header = self._header
+        self._header = ''
+        return header
+
+def iter_encode(chunks, policy=None, delta_digits=None):
+    # Encodes an iterable of g-code pieces, yielding packed data.
+    encoder = StreamEncoder(policy, delta_digits)
+    for chunk in chunks:
+        encoded_data = encoder.feed(chunk)
+        if len(encoded_data) > 0:
+            yield encoded_data
+    yield encoder.finish()
+
+def iter_read(source, block_size=DefaultReadBlockSize):
+    # Yields blocks from a file-like object (read) or socket (recv) until EOF.
+    read = source.recv if hasattr(source, 'recv') else source.read
+    while True:
+        block = read(block_size)
+        if len(block) == 0:
+            return
+        yield block
+
+class GcodeDecodeError(Exception):
+    pass
+
+DecodeFileErrors = (IOError, GcodeDecodeError)
+
+_PayloadStructs = {
+    1: struct.Struct('<f'),
+    2: struct.Struct('<d'),
+    3: struct.Struct('<I'),
+    4: struct.Struct('<Q'),
+}
+
+_PayloadSizes = {1: 4, 2: 8, 3: 4, 4: 8, 5: 0}
+
+class Packet(object):
+    # A view of one packet within the encoded data. Nothing is copied;
+    # parameters are only unpacked when asked for.
+    __slots__ = ('data', 'offset', 'size', 'cmd_letter', 'cmd_number', 'num_params', '_index_offset')
+    
+    def __init__(self, data, offset):
+        self.data = data
+        self.offset = offset
+        data_len = len(data)
+        cmd_letter, cmd_number, num_params, pos = _decode_header(data, offset)
+        if num_params > 14:
+            raise GcodeDecodeError('offset {}: invalid index size'.format(offset))
+        index_offset = pos
+        pos += num_params
+        if pos > data_len:
+            raise GcodeDecodeError('offset {}: truncated packet'.format(offset))
+        for i in range(index_offset, pos):
+            index_elem = ord(data[i])
+            payload_size = _PayloadSizes.get(index_elem >> 5)
+            if payload_size is None or (index_elem & 0x1F) > 25:
+                raise GcodeDecodeError('offset {}: invalid index element'.format(offset))
+            pos += payload_size
+        if pos > data_len:
+            raise GcodeDecodeError('offset {}: truncated packet'.format(offset))
+        self.size = pos - offset
+        self.cmd_letter = cmd_letter
+        self.cmd_number = cmd_number
+        self.num_params = num_params
+        self._index_offset = index_offset
+    
+    def is_eof(self):
+        return self.cmd_number is None
+    
+    def raw(self):
+        return buffer(self.data, self.offset, self.size)
+    
+    def params(self):
+        # Returns a list of (letter, type_code, value) tuples,
+        # with value None for void parameters.
+        data = self.data
+        payload_pos = self._index_offset + self.num_params
+        params = []
+        for i in range(self._index_offset, self._index_offset + self.num_params):
+            index_elem = ord(data[i])
+            type_code = index_elem >> 5
+            letter = chr(ord('A') + (index_elem & 0x1F))
+            if type_code == 5:
+                value = None
+            else:
+                value = _PayloadStructs[type_code].unpack_from(data, payload_pos)[0]
+                payload_pos += _PayloadSizes[type_code]
+            params.append((letter, type_code, value))
+        return params
+    
+    def to_gcode(self):
+        if self.is_eof():
+            return 'EOF'
+        return _format_command(self.cmd_letter, self.cmd_number, [(letter, value) for (letter, type_code, value) in self.params()])
+
+def _decode_header(data, offset):
+    # Returns (cmd_letter, cmd_number, index_size, index_offset),
+    # with cmd_number None for the EOF packet.
+    data_len = len(data)
+    if offset >= data_len:
+        raise GcodeDecodeError('offset {}: truncated packet'.format(offset))
+    header = ord(data[offset])
+    command_type_code = header >> 4
+    pos = offset + 1
+    if command_type_code == 14:
+        cmd_letter, cmd_number = 'E', None
+    elif command_type_code == 15:
+        if pos + 2 > data_len:
+            raise GcodeDecodeError('offset {}: truncated packet'.format(offset))
+        long_header = (ord(data[pos]) << 8) | ord(data[pos + 1])
+        cmd_letter = chr(ord('A') + (long_header >> 11))
+        cmd_number = long_header & 0x7FF
+        if not _letter_ok(cmd_letter):
+            raise GcodeDecodeError('offset {}: invalid command letter'.format(offset))
+        pos += 2
+    elif command_type_code in _SmallCommandsByCode:
+        cmd_letter, cmd_number = _SmallCommandsByCode[command_type_code]
+    else:
+        raise GcodeDecodeError('offset {}: invalid operation type'.format(offset))
+    return (cmd_letter, cmd_number, header & 0xF, pos)
+
+def _format_command(cmd_letter, cmd_number, params):
+    parts = ['{}{}'.format(cmd_letter, cmd_number)]
+    for (letter, value) in params:
+        if value is None:
+            parts.append(letter)
+        elif isinstance(value, float):
+            parts.append('{}{}'.format(letter, _format_real(value)))
+        else:
+            parts.append('{}{}'.format(letter, value))
+    return ' '.join(parts)
+
+def _format_real(value):
+    # repr gives the shortest text which reads back as exactly the same
+    # double, so that decoding is lossless for floats and doubles alike
+    # and encoding the result with any policy chooses the same types. The
+    # text always has a '.' or an exponent, so it is not taken as an
+    # integer.
+    text = repr(value)
+    if text.lstrip('-').isdigit():
+        text += '.0'
+    return text
+
+def iter_packets(data, offset=0):
+    # Yields packets up to and including the EOF packet.
+    while True:
+        packet = Packet(data, offset)
+        yield packet
+        if packet.is_eof():
+            return
+        offset += packet.size
+
+class _MappedFile(object):
+    # The file "-" is the standard input, which is read into memory since
+    # a pipe cannot be mapped.
+    def __init__(self, file_name):
+        import mmap
+        if file_name == '-':
+            self._file = None
+            self.data = sys.stdin.read()
+            if len(self.data) == 0:
+                raise GcodeDecodeError('empty file')
+            return
+        self._file = open(file_name, 'rb')
+        try:
+            if os.fstat(self._file.fileno()).st_size == 0:
+                raise GcodeDecodeError('empty file')
+            self.data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except:
+            self._file.close()
+            raise
+    
+    def __enter__(self):
+        return self.data
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._file is not None:
+            self.data.close()
+            self._file.close()
+
+_DeltaPayloadStructs = dict(_PayloadStructs, **{6: struct.Struct('<b'), 7: struct.Struct('<h')})
+
+_DeltaPayloadSizes = dict(_PayloadSizes, **{6: 1, 7: 2})
+
+def iter_delta_commands(data):
+    # Reference decoder for the delta profile (see DeltaEncoder).
+    # Yields (cmd_letter, cmd_number, params) up to but not including
+    # the EOF packet, with params a list of (letter, value).
+    header_size = len(DeltaProfileMagic) + 2
+    if data[:len(DeltaProfileMagic)] != DeltaProfileMagic or len(data) < header_size:
+        raise GcodeDecodeError('not a delta profile file')
+    if ord(data[len(DeltaProfileMagic)]) != DeltaProfileVersion:
+        raise GcodeDecodeError('unsupported delta profile version')
+    scale = 10.0**ord(data[len(DeltaProfileMagic) + 1])
+    last = {}
+    last_index = None
+    offset = header_size
+    while True:
+        cmd_letter, cmd_number, index_size, pos = _decode_header(data, offset)
+        if cmd_number is None:
+            return
+        if index_size == 15:
+            if last_index is None:
+                raise GcodeDecodeError('offset {}: no index to repeat'.format(offset))
+            index = last_index
+        else:
+            index = data[pos:(pos + index_size)]
+            if len(index) != index_size:
+                raise GcodeDecodeError('offset {}: truncated packet'.format(offset))
+            pos += index_size
+            last_index = index
+        params = []
+        for index_elem in index:
+            index_elem = ord(index_elem)
+            type_code = index_elem >> 5
+            letter = chr(ord('A') + (index_elem & 0x1F))
+            if type_code not in _DeltaPayloadSizes or letter > 'Z':
+                raise GcodeDecodeError('offset {}: invalid index element'.format(offset))
+            if type_code == 5:
+                value = None
+                last.pop(letter, None)
+            else:
+                if pos + _DeltaPayloadSizes[type_code] > len(data):
+                    raise GcodeDecodeError('offset {}: truncated packet'.format(offset))
+                value = _DeltaPayloadStructs[type_code].unpack_from(data, pos)[0]
+                pos += _DeltaPayloadSizes[type_code]
+                if type_code in (6, 7):
+                    if last.get(letter) is None:
+                        raise GcodeDecodeError('offset {}: delta without previous value'.format(offset))
+                    quanta = last[letter] + value
+                    value = quanta / scale
+                    last[letter] = quanta
+                else:
+                    last[letter] = _delta_quantize(value, scale)
+            params.append((letter, value))
+        yield (cmd_letter, cmd_number, params)
+        offset = pos
+
+def decode_file(input_file_name, output_file_name):
+    with _MappedFile(input_file_name) as data:
+        with _open_std(output_file_name, 'wb', sys.stdout) as output_file:
+            if data[:len(DeltaProfileMagic)] == DeltaProfileMagic:
+                for command in iter_delta_commands(data):
+                    output_file.write(_format_command(*command) + '\n')
+                return
+            # The final EOF packet is left out since encoding adds it back.
+            for packet in iter_packets(data):
+                if not packet.is_eof():
+                    output_file.write(packet.to_gcode() + '\n')
+
+VerifyFileErrors = EncodeFileErrors + (GcodeDecodeError,)
+
+def verify_stream(gcode_file, data, policy=None, delta_encoder=None):
+    # Encodes the g-code chunk by chunk and compares the result with the
+    # encoded data, in a single pass over both. Raises GcodeDecodeError
+    # describing the first difference.
+    stats = EncodeStats()
+    start_time = time.time()
+    offset = 0
+    if delta_encoder is not None:
+        offset = len(delta_encoder.file_header)
+        if data[:offset] != delta_encoder.file_header:
+            raise GcodeDecodeError('delta profile file header differs')
+        encode = delta_encoder.encode_line
+    else:
+        encode = _line_encoder(policy)
+    for chunk in _iter_line_chunks(gcode_file, DefaultReadBlockSize, stats):
+        packets = []
+        _encode_chunk_into(chunk, stats.lines + 1, packets.append, encode)
+        encoded_data = ''.join(packets)
+        if data[offset:(offset + len(encoded_data))] != encoded_data:
+            for (i, packet) in enumerate(packets):
+                if data[offset:(offset + len(packet))] != packet:
+                    raise GcodeDecodeError('line {}, offset {}: packet differs'.format(stats.lines + 1 + i, offset))
+                offset += len(packet)
+        offset += len(encoded_data)
+        stats.lines += len(packets)
+    if data[offset:] != chr(0xE0):
+        raise GcodeDecodeError('offset {}: expected EOF packet at end of file'.format(offset))
+    stats.output_bytes = len(data)
+    stats.seconds = time.time() - start_time
+    return stats
+
+def verify_file(gcode_file_name, encoded_file_name, policy=None, delta_digits=None):
+    delta_encoder = None if delta_digits is None else DeltaEncoder(delta_digits)
+    with _open_std(gcode_file_name, 'rb', sys.stdin) as gcode_file:
+        with _MappedFile(encoded_file_name) as data:
+            return verify_stream(gcode_file, data, policy, delta_encoder)
+
+_TypeNames = {1: 'float', 2: 'double', 3: 'uint32', 4: 'uint64', 5: 'void'}
+
+class EncodingProfiler(object):
+    # Collects histograms about the packets of a file: command frequency,
+    # parameter types and bytes per command, and packet sizes. Memory use
+    # only depends on the number of distinct commands and packet sizes.
+    def __init__(self):
+        self.commands = {}
+        self.param_types = {}
+        self.packet_sizes = {}
+    
+    def add_packet(self, packet_data):
+        packet = Packet(packet_data, 0)
+        command = 'EOF' if packet.is_eof() else '{}{}'.format(packet.cmd_letter, packet.cmd_number)
+        command_stats = self.commands.get(command)
+        if command_stats is None:
+            command_stats = {'count': 0, 'bytes': 0, 'param_types': {}}
+            self.commands[command] = command_stats
+        command_stats['count'] += 1
+        command_stats['bytes'] += packet.size
+        command_param_types = command_stats['param_types']
+        for index_elem in packet_data[packet._index_offset:(packet._index_offset + packet.num_params)]:
+            type_name = _TypeNames[ord(index_elem) >> 5]
+            command_param_types[type_name] = command_param_types.get(type_name, 0) + 1
+            self.param_types[type_name] = self.param_types.get(type_name, 0) + 1
+        self.packet_sizes[packet.size] = self.packet_sizes.get(packet.size, 0) + 1
+    
+    def report(self, stats):
+        packets = sum(self.packet_sizes.values())
+        total_size = sum(size * count for (size, count) in self.packet_sizes.items())
+        # Commands using the long header, by the bytes a short header would save.
+        long_commands = [command for command in self.commands if command != 'EOF' and
+                         (command[0], int(command[1:])) not in _SmallCommands]
+        long_commands.sort(key=lambda command: -self.commands[command]['count'])
+        return {
+            'lines': stats.lines,
+            'input_bytes': stats.input_bytes,
+            'output_bytes': stats.output_bytes,
+            'packets': packets,
+            'mean_packet_size': total_size / float(max(packets, 1)),
+            'max_packet_size': max(self.packet_sizes) if packets > 0 else 0,
+            'commands': self.commands,
+            'param_types': self.param_types,
+            'packet_sizes': dict((str(size), count) for (size, count) in self.packet_sizes.items()),
+            'short_header_candidates': [{'command': command, 'saved_bytes': 2 * self.commands[command]['count']} for command in long_commands],
+        }
+
+def profile_stream(input_file, policy=None):
+    stats = EncodeStats()
+    start_time = time.time()
+    profiler = EncodingProfiler()
+    def add_packet(packet_data):
+        if len(packet_data) > 0:
+            stats.output_bytes += len(packet_data)
+            profiler.add_packet(packet_data)
+    for chunk in _iter_line_chunks(input_file, DefaultReadBlockSize, stats):
+        stats.lines += _encode_chunk_into(chunk, stats.lines + 1, add_packet, _line_encoder(policy))
+    add_packet(chr(0xE0))
+    stats.seconds = time.time() - start_time
+    return profiler.report(stats)
 
 _SmallCommands = {
     ('G', 0) : 1,
@@ -120,6 +885,207 @@ _SmallCommands = {
     ('G', 92) : 3
 }
 
+_SmallCommandsByCode = dict((code, command) for (command, code) in _SmallCommands.items())
+
+_FastSmallCommands = dict(('{}{}'.format(letter, number), code) for ((letter, number), code) in _SmallCommands.items())
+
+_DecimalDigits = '0123456789'
+
+_LettersToSpaces = ''.join([(' ' if (ch >= 'A' and ch <= 'Z') else ch) for ch in map(chr, range(256))])
+
+_MaxFastShapes = 4096
+
+# Maps the shape of a line (the line with all digits removed, prefixed by
+# the command) to the packet prefix and payload struct, or to False if the
+# shape does not consist only of decimal floats.
+_FastShapePackers = {}
+
+# Maps the first four characters of a line followed by the line with all
+# digits removed to the packet prefix, the payload struct and the value
+# converters (None if all values are floats), or to False if the line is
+# not a plain G0/G1/G92 with decimal parameters. The first four characters
+# pin down the command word, as it must be followed by whitespace.
+_FastLinePackers = {}
+
+# Maps a parameter signature (command type code followed by parameter
+# letters each followed by a type character) to the packet prefix,
+# that is the header and index bytes, and a struct for the payload.
+_FastSignaturePackers = {}
+
+# Maps a command word followed by the parameter letters, separated by
+# spaces, to the packer for commands given as GcodeCommand.
+_FastCommandPackers = {}
+
+_FastTypeCodes = {'f': 1, 'I': 3, 'v': 5}
+
+def _encode_small_line(line):
+    # Fast path of encode_line for lines with nothing but a G0/G1/G92 and
+    # decimal float or integer parameters, which skips the tokenizer.
+    # Returns None for anything else, including comments, line numbers,
+    # checksums and void parameters. It is not free of allocations: the
+    # cache key, the value strings, the numbers and the packet are still
+    # built for each line.
+    key = line[:4] + line.translate(None, _DecimalDigits)
+    packer = _FastLinePackers.get(key)
+    if packer is None:
+        packer = _make_line_packer(line)
+        if len(_FastLinePackers) < _MaxFastShapes:
+            _FastLinePackers[key] = packer
+    if packer is False:
+        return None
+    prefix, payload_struct, converters = packer
+    # With the letters turned into spaces, the words are the command
+    # number followed by the parameter values. A void parameter, which has
+    # the same shape as an integer, gives no word and fails the count.
+    values = line.translate(_LettersToSpaces).split()[1:]
+    try:
+        if converters is None:
+            return prefix + payload_struct.pack(*map(float, values))
+        if len(values) != len(converters):
+            return None
+        return prefix + payload_struct.pack(*[convert(value) for (convert, value) in zip(converters, values)])
+    except (ValueError, OverflowError, struct.error):
+        return None
+
+def _make_line_packer(line):
+    # Parameters with only digits may be integers or void, and parameters
+    # like "X.", "X-." or "X+." once the digits are removed may be floats.
+    words = line.split()
+    if len(words) == 0:
+        return False
+    command_type_code = _FastSmallCommands.get(words[0])
+    if command_type_code is None or not line.startswith(words[0]) or line[len(words[0]):(len(words[0]) + 1)].strip() != '':
+        return False
+    signature = []
+    converters = []
+    for param_shape in line.translate(None, _DecimalDigits).split()[1:]:
+        if not _letter_ok(param_shape[0]):
+            return False
+        if param_shape[1:] in ('.', '-.', '+.'):
+            signature.append(param_shape[0] + 'f')
+            converters.append(float)
+        elif param_shape[1:] == '':
+            signature.append(param_shape[0] + 'I')
+            converters.append(int)
+        else:
+            return False
+    packer = _make_signature_packer(command_type_code, ''.join(signature))
+    if packer is None:
+        return False
+    return packer + ((None if int not in converters else tuple(converters)),)
+
+def _encode_small_command(command_type_code, parts, line):
+    # Fast path for G0/G1/G92. Returns None for anything which must go
+    # through the generic encoder; otherwise the result is identical to
+    # what the generic encoder produces. The shape is computed with
+    # str.translate, so other string types (unicode) are left to the
+    # generic encoder.
+    if type(line) is not str:
+        return None
+    shape = parts[0] + line.translate(None, _DecimalDigits)
+    packer = _FastShapePackers.get(shape)
+    if packer is None:
+        packer = _make_shape_packer(command_type_code, shape)
+        if len(_FastShapePackers) < _MaxFastShapes:
+            _FastShapePackers[shape] = packer
+    if packer is False:
+        return _encode_small_command_params(command_type_code, parts)
+    try:
+        values = [float(part[1:]) for part in parts[1:]]
+        return packer[0] + packer[1].pack(*values)
+    except (ValueError, OverflowError):
+        return None
+
+def _make_shape_packer(command_type_code, shape):
+    # All parameters need to look like "X.", "X-." or "X+." once the
+    # digits are removed. Such values cannot be integers, so they are
+    # either floats or syntax errors.
+    signature = []
+    for param_shape in shape.split()[1:]:
+        if not (param_shape[1:] in ('.', '-.', '+.') and _letter_ok(param_shape[0])):
+            return False
+        signature.append(param_shape[0] + 'f')
+    packer = _make_signature_packer(command_type_code, ''.join(signature))
+    if packer is None:
+        return False
+    return packer
+
+def _encode_small_command_params(command_type_code, parts):
+    # Handles G0/G1/G92 mixing floats, small integers and void parameters.
+    signature = str(command_type_code)
+    values = []
+    try:
+        for part in parts[1:]:
+            value_str = part[1:]
+            if '.' in value_str:
+                values.append(float(value_str))
+                signature += part[0] + 'f'
+            elif value_str.isdigit():
+                value = int(value_str)
+                if value >= 2**32:
+                    return None
+                values.append(value)
+                signature += part[0] + 'I'
+            elif value_str == '':
+                signature += part[0] + 'v'
+            else:
+                return None
+    except ValueError:
+        return None
+    packer = _FastSignaturePackers.get(signature)
+    if packer is None:
+        packer = _make_signature_packer(command_type_code, signature[1:])
+        if packer is None:
+            return None
+        if len(_FastSignaturePackers) < _MaxFastShapes:
+            _FastSignaturePackers[signature] = packer
+    try:
+        return packer[0] + packer[1].pack(*values)
+    except OverflowError:
+        return None
+
+def _encode_small_command_generated(command_word, params):
+    # Fast path of encode_command for G0/G1/G92 with only decimal values.
+    # The packers are cached by the command word and parameter letters.
+    signature = command_word
+    values = []
+    for (param_letter, value, digits) in params:
+        if not digits:
+            return None
+        signature += ' ' + param_letter
+        values.append(float('%.*f' % (digits, value)))
+    packer = _FastCommandPackers.get(signature)
+    if packer is None:
+        letters = signature.split()[1:]
+        for letter in letters:
+            if len(letter) != 1 or not _letter_ok(letter):
+                return None
+        packer = _make_signature_packer(_FastSmallCommands[command_word], ''.join([letter + 'f' for letter in letters]))
+        if packer is None:
+            return None
+        if len(_FastCommandPackers) < _MaxFastShapes:
+            _FastCommandPackers[signature] = packer
+    try:
+        return packer[0] + packer[1].pack(*values)
+    except OverflowError:
+        return None
+
+def _make_signature_packer(command_type_code, param_signature):
+    if len(param_signature) > 2 * 14:
+        return None
+    index = []
+    formats = []
+    for pos in range(0, len(param_signature), 2):
+        letter = param_signature[pos]
+        type_char = param_signature[pos + 1]
+        if not _letter_ok(letter):
+            return None
+        index.append(chr((_FastTypeCodes[type_char] << 5) + (ord(letter) - ord('A'))))
+        if type_char != 'v':
+            formats.append(type_char)
+    prefix = chr((command_type_code << 4) + len(index)) + ''.join(index)
+    return (prefix, struct.Struct('<' + ''.join(formats)))
+
 def _letter_ok(ch):
     return (ord(ch) >= ord('A') and ord(ch) <= ord('Z'))
 
@@ -127,9 +1093,74 @@ def main():
     import argparse
     parser = argparse.ArgumentParser(description='G-code packet for APrinter firmware.')
     parser.add_argument('--input', required=True)
-    parser.add_argument('--output', required=True)
+    parser.add_argument('--output', help='Output file (required except with --stats).')
+    parser.add_argument('--jobs', type=int, default=1, help='Number of encoding processes.')
+    parser.add_argument('--verbose', action='store_true', help='Report encoding throughput and size.')
+    parser.add_argument('--precision', type=int, help='Encode reals in the smallest type preserving this many decimal places.')
+    parser.add_argument('--double', action='store_true', help='Allow doubles where float is not precise enough (the decoder must support them).')
+    parser.add_argument('--delta', type=int, metavar='DIGITS', help='Use the delta profile with a quantum of 10^-DIGITS (not supported by the firmware).')
+    parser.add_argument('--index', metavar='FILE', help='Write a resume index for aprinter_resume.py.')
+    parser.add_argument('--index-interval', type=int, metavar='COMMANDS', help='Commands between checkpoints in the resume index (default 1000).')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--decode', action='store_true', help='Decode packed --input into g-code --output.')
+    mode.add_argument('--verify', action='store_true', help='Check that packed --output matches g-code --input.')
+    mode.add_argument('--stats', action='store_true', help='Write packet statistics of g-code --input as JSON to --output or stdout.')
     args = parser.parse_args()
-    encode_file(args.input, args.output)
+    if args.output is None and not args.stats:
+        parser.error('--output is required')
+    if args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+    if args.delta is not None:
+        if not (0 <= args.delta <= 9):
+            parser.error('--delta must be between 0 and 9')
+        if args.jobs > 1 or args.precision is not None or args.double:
+            parser.error('--delta cannot be combined with --jobs, --precision or --double')
+    if args.stats and (args.jobs > 1 or args.delta is not None):
+        parser.error('--stats cannot be combined with --jobs or --delta')
+    if args.index is not None:
+        if args.jobs > 1 or args.delta is not None or args.decode or args.verify or args.stats:
+            parser.error('--index cannot be combined with --jobs, --delta, --decode, --verify or --stats')
+        if args.index_interval is not None and args.index_interval < 1:
+            parser.error('--index-interval must be at least 1')
+    policy = None
+    if args.precision is not None or args.double:
+        policy = EncodingPolicy(precision=args.precision, allow_double=args.double)
+    if args.verify and args.input == '-' and args.output == '-':
+        parser.error('--input and --output cannot both be - with --verify')
+    if args.decode:
+        try:
+            decode_file(args.input, args.output)
+        except DecodeFileErrors as e:
+            print('Decoding failed: {}'.format(e), file=sys.stderr)
+            sys.exit(1)
+        return
+    if args.stats:
+        import json
+        try:
+            with _open_std(args.input, 'rb', sys.stdin) as input_file:
+                report = profile_stream(input_file, policy)
+        except EncodeFileErrors as e:
+            print('Encoding failed: {}'.format(e), file=sys.stderr)
+            sys.exit(1)
+        with _open_std('-' if args.output is None else args.output, 'wb', sys.stdout) as output_file:
+            json.dump(report, output_file, indent=2, separators=(',', ': '), sort_keys=True)
+            output_file.write('\n')
+        return
+    if args.verify:
+        try:
+            stats = verify_file(args.input, args.output, policy, args.delta)
+        except VerifyFileErrors as e:
+            print('Verification failed: {}'.format(e), file=sys.stderr)
+            sys.exit(1)
+    else:
+        try:
+            stats = encode_file(args.input, args.output, jobs=args.jobs, policy=policy, delta_digits=args.delta,
+                                index_file_name=args.index, index_interval=args.index_interval)
+        except EncodeFileErrors as e:
+            print('Encoding failed: {}'.format(e), file=sys.stderr)
+            sys.exit(1)
+    if args.verbose:
+        print(stats.summary(), file=sys.stderr)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,120 @@
+# Copyright (c) 2015 Ambroz Bizjak
+# All rights reserved.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import collections
+
+# G-code line tokenizer shared by DeTool.py and aprinter_encode.py.
+# A line is parsed into a GcodeLine once, and the record can then be
+# handed from one tool to the next without going back to text.
+
+class GcodeSyntaxError(Exception):
+    pass
+
+class GcodeLine(collections.namedtuple('GcodeLine', ('data', 'comment', 'code', 'words', 'line_number', 'checksum'))):
+    # data: text before the comment, as given.
+    # comment: the comment including the ';', or ''.
+    # code: data without the line number and checksum, stripped.
+    # words: code split into words; words[0] is the command.
+    # line_number, checksum: the N and * values as ints, or None.
+    __slots__ = ()
+    
+    def params(self):
+        # The parameters of the command as (letter, value); see parse_params.
+        return parse_params(self.words[1:])
+    
+    def checksum_ok(self):
+        return self.checksum is None or compute_checksum(self.data[:self.data.rfind('*')]) == self.checksum
+
+def compute_checksum(text):
+    # The RepRap checksum, XOR of all characters before the '*'.
+    checksum = 0
+    for ch in text:
+        checksum ^= ord(ch)
+    return checksum
+
+def parse_line(line):
+    comment_pos = line.find(';')
+    if comment_pos < 0:
+        data = line
+        comment = ''
+    else:
+        data = line[:comment_pos]
+        comment = line[comment_pos:]
+    code = data
+    checksum = None
+    if '*' in data:
+        checksum_pos = data.rfind('*')
+        checksum_str = data[(checksum_pos + 1):].strip()
+        if checksum_str.isdigit():
+            checksum = int(checksum_str)
+            code = data[:checksum_pos]
+    words = code.split()
+    line_number = None
+    if len(words) > 0 and words[0][0] == 'N' and words[0][1:].isdigit():
+        line_number = int(words[0][1:])
+        code = code.strip()[len(words[0]):]
+        del words[0]
+    return _new_tuple(GcodeLine, (data, comment, code.strip(), words, line_number, checksum))
+
+def parse_params(words):
+    # Returns the parameter words as a list of (letter, value), with the
+    # value being None for void parameters, an int for unsigned integers
+    # which fit into 64 bits and a float otherwise. Values are only parsed
+    # when asked for, since lines such as M117 have words which are not
+    # numbers.
+    try:
+        return [(word[0], float(word[1:]) if '.' in word else _parse_value(word[1:])) for word in words]
+    except ValueError:
+        raise GcodeSyntaxError('invalid command argument')
+
+def _parse_value(text):
+    # Parses a value without a '.', which may still be a float such as
+    # "1e5" or an integer out of the unsigned 64-bit range.
+    if text == '':
+        return None
+    if text.isdigit() or (text[0] in '+-' and text[1:].isdigit()):
+        value = int(text)
+        if value >= 0 and value < 2**64:
+            return value
+    return float(text)
+
+# Creating the record through tuple.__new__ skips the Python-level
+# constructor of the namedtuple, which is a significant part of the cost
+# of parsing a line.
+_new_tuple = tuple.__new__
+
+class GcodeCommand(collections.namedtuple('GcodeCommand', ('command', 'params'))):
+    # A command generated by a tool rather than parsed, kept as values
+    # so that it can be encoded without going through text.
+    # command: the command word, e.g. 'G1'.
+    # params: list of (letter, value, digits); the value is written with
+    #   that many decimal places, or as an integer if digits is None.
+    __slots__ = ()
+    
+    def format(self):
+        text = self.command
+        for (letter, value, digits) in self.params:
+            if digits is None:
+                text += ' %s%d' % (letter, value)
+            else:
+                text += ' %s%.*f' % (letter, digits, value)
+        return text
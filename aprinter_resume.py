@@ -0,0 +1,257 @@
+#!/usr/bin/env python2.7
+# Copyright (c) 2015 Ambroz Bizjak
+# All rights reserved.
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright
+#    notice, this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright
+#    notice, this list of conditions and the following disclaimer in the
+#    documentation and/or other materials provided with the distribution.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from __future__ import print_function
+from __future__ import with_statement
+import sys
+import json
+from aprinter_gcode import GcodeCommand
+
+# Resume index: a sidecar file to a g-code or packed g-code file which is
+# written by DeTool.py and aprinter_encode.py with --index. It is made of
+# JSON lines, a header followed by checkpoints. Each checkpoint gives the
+# byte offset in the indexed file where a command starts, the input line
+# and layer (from Cura's ";LAYER:" comments) it came from, and what the
+# machine state is at that point: the positions of all axes ("pos"), the
+# feedrate, the fan speeds, and whether all moves (G91, "relative") or
+# only the extruders (M83, "relative_extrusion") are relative. These two
+# are taken as false if missing; DeTool leaves them out as its output is
+# always absolute, and adds its own tool state instead. A layer which
+# starts before the state is known gets the first checkpoint after that,
+# the point from which the layer can be resumed. Given a
+# checkpoint, the rest of the file can be printed after a short preamble
+# which restores the state, without processing what comes before.
+
+IndexFormat = 'aprinter-resume-index'
+IndexVersion = 1
+DefaultIndexInterval = 1000
+
+# Axes which are moved to in the preamble; all other axes with a position
+# are extruders, whose position is only set.
+MoveAxes = 'XYZ'
+
+class IndexWriter(object):
+    # The writer of the indexed file keeps offset (bytes written) and
+    # commands (commands written) up to date, if it needs them.
+    def __init__(self, file_name, binary, interval=DefaultIndexInterval):
+        self.interval = interval
+        self.offset = 0
+        self.commands = 0
+        self._last_commands = None
+        self._pending_layer = None
+        self._file = open(file_name, 'w')
+        self._write({'format': IndexFormat, 'version': IndexVersion, 'binary': binary})
+    
+    def close(self):
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def due(self, layer):
+        # Tells whether to add a checkpoint before the next input line,
+        # given its layer number (or None), with self.commands being the
+        # number of commands written so far. A layer stays pending until a
+        # checkpoint is added, in case the state is not known yet.
+        if layer is not None:
+            self._pending_layer = layer
+        return self._pending_layer is not None or self._last_commands is None or self.commands - self._last_commands >= self.interval
+    
+    def add(self, checkpoint):
+        if checkpoint['layer'] is None:
+            checkpoint['layer'] = self._pending_layer
+        self._pending_layer = None
+        self._last_commands = self.commands
+        self._write(checkpoint)
+    
+    def _write(self, obj):
+        json.dump(obj, self._file, sort_keys=True)
+        self._file.write('\n')
+
+def read_index(file_name):
+    # Returns the header and the list of checkpoints.
+    with open(file_name, 'r') as f:
+        header = json.loads(f.readline())
+        if header.get('format') != IndexFormat or header.get('version') != IndexVersion:
+            raise ValueError('not a supported resume index')
+        return (header, [json.loads(line) for line in f if line.strip()])
+
+def layer_of(comment):
+    # Returns the layer number from a ";LAYER:n" comment, or None.
+    pos = comment.find(';LAYER:')
+    if pos < 0:
+        return None
+    try:
+        return int(comment[pos + 7:].split()[0])
+    except (ValueError, IndexError):
+        return None
+
+class PositionTracker(object):
+    # Follows the machine state through g-code commands, for checkpoints
+    # of files without any better knowledge of the state (DeTool has its
+    # own). Fans are only known as M106/M107.
+    def __init__(self):
+        self.pos = {}
+        self.feedrate = None
+        self.fans = {}
+        self.relative = False
+        self.relative_extrusion = False
+    
+    def ready(self):
+        # The state can only be restored once the moved axes are known.
+        return all([axis in self.pos for axis in MoveAxes])
+    
+    def checkpoint(self, offset, line, layer):
+        return {'offset': offset, 'line': line, 'layer': layer, 'pos': dict(self.pos), 'feedrate': self.feedrate, 'fans': dict(self.fans),
+                'relative': self.relative, 'relative_extrusion': self.relative_extrusion}
+    
+    def update(self, record):
+        # Takes the line as parsed by aprinter_gcode.parse_line.
+        if len(record.words) == 0:
+            return
+        command = record.words[0]
+        if command == 'G0' or command == 'G1':
+            for (letter, value) in _params(record):
+                if letter == 'F':
+                    self.feedrate = value
+                elif self.relative or (self.relative_extrusion and letter not in MoveAxes):
+                    if letter in self.pos:
+                        self.pos[letter] += value
+                else:
+                    self.pos[letter] = value
+        elif command == 'G92':
+            for (letter, value) in _params(record):
+                self.pos[letter] = value
+        elif command == 'G28':
+            self.pos.clear()
+        elif command == 'G90':
+            self.relative = False
+        elif command == 'G91':
+            self.relative = True
+        elif command == 'M82':
+            self.relative_extrusion = False
+        elif command == 'M83':
+            self.relative_extrusion = True
+        elif command == 'M106':
+            self.fans['M106'] = 0.0
+            for (letter, value) in _params(record):
+                if letter == 'S':
+                    self.fans['M106'] = value
+        elif command == 'M107':
+            self.fans['M106'] = 0.0
+
+def _params(record):
+    # The parameters of the record with float values, as the state is
+    # kept. Void parameters are taken as 0, as the firmware reads them.
+    return [(letter, 0.0 if value is None else float(value)) for (letter, value) in record.params()]
+
+def make_preamble(checkpoint, travel_feedrate, home=False):
+    # Returns the commands which bring the machine into the state of the
+    # checkpoint: positions of extruders set, fans on, moved to the
+    # position (up to the Z height first), the feedrate restored and
+    # finally relative moves or extrusion turned back on.
+    pos = checkpoint['pos']
+    commands = []
+    if home:
+        commands.append(GcodeCommand('G28', []))
+    commands.append(GcodeCommand('G90', []))
+    extruders = sorted([axis for axis in pos if axis not in MoveAxes])
+    if len(extruders) > 0:
+        commands.append(GcodeCommand('G92', [(axis, pos[axis], 5) for axis in extruders]))
+    for fan in sorted(checkpoint['fans']):
+        commands.append(GcodeCommand(fan, [('S', checkpoint['fans'][fan], 2)]))
+    commands.append(GcodeCommand('G0', [('Z', pos['Z'], 5), ('F', travel_feedrate, 1)]))
+    commands.append(GcodeCommand('G0', [('X', pos['X'], 5), ('Y', pos['Y'], 5)]))
+    if checkpoint['feedrate'] is not None:
+        commands.append(GcodeCommand('G0', [('F', checkpoint['feedrate'], 1)]))
+    if checkpoint.get('relative'):
+        commands.append(GcodeCommand('G91', []))
+    if checkpoint.get('relative_extrusion'):
+        commands.append(GcodeCommand('M83', []))
+    return commands
+
+def find_checkpoint(checkpoints, layer=None, line=None):
+    # Returns the first checkpoint of the layer, or the last checkpoint at
+    # or before the input line.
+    if layer is not None:
+        for checkpoint in checkpoints:
+            if checkpoint['layer'] == layer:
+                return checkpoint
+        raise ValueError('no checkpoint for layer {}'.format(layer))
+    found = None
+    for checkpoint in checkpoints:
+        if checkpoint['line'] > line:
+            break
+        found = checkpoint
+    if found is None:
+        raise ValueError('no checkpoint at or before line {}'.format(line))
+    return found
+
+CopyBlockSize = 2**20
+
+def resume_file(input_file_name, index_file_name, output_file_name, travel_feedrate, layer=None, line=None, home=False):
+    # Writes the preamble for the chosen checkpoint followed by the rest of
+    # the indexed file from its offset. Returns the checkpoint.
+    header, checkpoints = read_index(index_file_name)
+    checkpoint = find_checkpoint(checkpoints, layer, line)
+    preamble = make_preamble(checkpoint, travel_feedrate, home)
+    binary = header['binary']
+    with open(input_file_name, 'rb') as input_file:
+        with open(output_file_name, 'wb') as output_file:
+            if binary:
+                from aprinter_encode import encode_command
+                output_file.write(''.join([encode_command(command) for command in preamble]))
+            else:
+                output_file.write(''.join([command.format() + '\n' for command in preamble]))
+            input_file.seek(checkpoint['offset'])
+            while True:
+                data = input_file.read(CopyBlockSize)
+                if len(data) == 0:
+                    break
+                output_file.write(data)
+    return checkpoint
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description='Resume printing a g-code or packed g-code file from a checkpoint of its resume index.')
+    parser.add_argument('--input', required=True, help='The g-code or packed g-code file.')
+    parser.add_argument('--index', required=True, help='Its resume index.')
+    parser.add_argument('--output', required=True, help='File for the preamble and the rest of the input.')
+    position = parser.add_mutually_exclusive_group(required=True)
+    position.add_argument('--layer', type=int, help='Resume at the start of this layer.')
+    position.add_argument('--line', type=int, help='Resume at the last checkpoint at or before this line of the original input.')
+    parser.add_argument('--travel-speed', type=float, default=50.0, metavar='Speedmm/s', help='Speed of the moves to the resume position.')
+    parser.add_argument('--home', action='store_true', help='Home all axes first.')
+    args = parser.parse_args()
+    try:
+        checkpoint = resume_file(args.input, args.index, args.output, args.travel_speed * 60.0, args.layer, args.line, args.home)
+    except (IOError, ValueError) as e:
+        print('Cannot resume: {}'.format(e), file=sys.stderr)
+        sys.exit(1)
+    print('Resuming at line {} (layer {}), offset {}.'.format(checkpoint['line'], checkpoint['layer'], checkpoint['offset']), file=sys.stderr)
+
+if __name__ == '__main__':
+    main()
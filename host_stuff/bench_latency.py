@@ -0,0 +1,224 @@
+#!/usr/bin/python2.7 -B
+
+# Measures round-trip latency and throughput of sending g-code with
+# GcodeSender, by default against fake_firmware.py on a pseudo terminal so
+# that no printer is needed. Each mode is run with a fresh fake firmware:
+# stop-and-wait sends one command at a time like test_latency.py, pipelined
+# keeps the receive buffer of the firmware filled. The latency of a command
+# is the time from sending it until its "ok"; jitter is the mean difference
+# between the latencies of consecutive commands.
+
+from __future__ import print_function
+import os
+import sys
+import json
+import math
+import time
+import random
+import argparse
+import subprocess
+import littlevent.close
+import littlevent.error
+import littlevent.loop
+import littlevent.serial
+import littlevent.gcode_sender
+
+Modes = ['stop-and-wait', 'pipelined']
+Percentiles = [50, 90, 99]
+
+def parse_mix (mix):
+    weights = []
+    for item in mix.split(','):
+        command, sep, weight = item.partition('=')
+        try:
+            weights.append((command.strip().upper(), float(weight) if sep else 1.0))
+        except ValueError:
+            raise ValueError('Invalid command mix item {}.'.format(item))
+    return weights
+
+def make_commands (weights, count, seed):
+    rng = random.Random(seed)
+    total = sum(weight for (command, weight) in weights)
+    x, y, e = 100.0, 100.0, 0.0
+    commands = []
+    for i in range(count):
+        pick = rng.uniform(0, total)
+        for (command, weight) in weights:
+            pick -= weight
+            if pick <= 0:
+                break
+        if command in ('G0', 'G1'):
+            x = min(200.0, max(0.0, x + rng.uniform(-5, 5)))
+            y = min(200.0, max(0.0, y + rng.uniform(-5, 5)))
+            e += rng.uniform(0, 0.2)
+            commands.append('{} X{:.3f} Y{:.3f} E{:.5f} F1800'.format(command, x, y, e).encode('ascii'))
+        else:
+            commands.append(command.encode('ascii'))
+    return commands
+
+def percentile (sorted_values, percent):
+    rank = int(math.ceil(percent / 100.0 * len(sorted_values)))
+    return sorted_values[min(len(sorted_values), max(1, rank)) - 1]
+
+def summarize (latencies, total_time, sent_bytes):
+    # Without any latencies, such as when no command was acknowledged, the
+    # latency statistics are None.
+    values = sorted(latencies)
+    result = {
+        'commands': len(latencies),
+        'time': total_time,
+        'commands_per_second': len(latencies) / total_time if total_time > 0 else 0.0,
+        'bytes_per_second': sent_bytes / total_time if total_time > 0 else 0.0,
+    }
+    if len(values) == 0:
+        for key in ['mean', 'max', 'jitter'] + ['p{}'.format(percent) for percent in Percentiles]:
+            result[key] = None
+        return result
+    jitter = sum(abs(b - a) for (a, b) in zip(latencies, latencies[1:])) / max(1, len(latencies) - 1)
+    result.update({
+        'mean': sum(values) / len(values),
+        'max': values[-1],
+        'jitter': jitter,
+    })
+    for percent in Percentiles:
+        result['p{}'.format(percent)] = percentile(values, percent)
+    return result
+
+def histogram (latencies):
+    # Buckets are powers of two of microseconds.
+    buckets = {}
+    for latency in latencies:
+        bucket = max(0, int(math.floor(math.log(max(latency * 1e6, 1.0), 2))))
+        buckets[bucket] = buckets.get(bucket, 0) + 1
+    largest = max(buckets.values())
+    lines = []
+    for bucket in range(min(buckets), max(buckets) + 1):
+        count = buckets.get(bucket, 0)
+        lines.append('  {:>9} - {:>9} us {:>7} {}'.format(2**bucket, 2**(bucket + 1), count, '#' * int(math.ceil(40.0 * count / largest))))
+    return lines
+
+class Run (littlevent.close.Obj):
+    def __init__ (self, port, baud, commands, window_size, max_commands, edge_triggered):
+        littlevent.close.Obj.__init__(self)
+        try:
+            self.loop = self.add(littlevent.loop.Loop(edge_triggered=edge_triggered))
+            self.serial = self.add(littlevent.serial.Serial(self.loop, port, baud, self._error_handler))
+            self.latencies = []
+            self.error = None
+            self.sender = self.add(littlevent.gcode_sender.GcodeSender(self.serial, commands, window_size, self._done_handler,
+                reply_handler=self._reply_handler, max_commands=max_commands, ack_handler=self._ack_handler))
+        
+        except littlevent.error.Error:
+            self.close()
+            raise
+    
+    def run (self):
+        self.sender.start()
+        self.loop.run()
+        if self.error is not None:
+            raise littlevent.error.Error(self.error)
+        return summarize(self.latencies, self.end_time - self.sender.start_time, self.sender.sent_bytes)
+    
+    def _error_handler (self, returned_events):
+        self.error = 'unexpected event'
+        self.loop.quit(1)
+    
+    def _reply_handler (self, event):
+        self.error = 'unexpected response: {}'.format(event)
+        self.loop.quit(1)
+    
+    def _ack_handler (self, number, send_time):
+        # Line 0 is the M110 which starts the numbering.
+        if number > 0:
+            self.latencies.append(time.time() - send_time)
+    
+    def _done_handler (self, err):
+        self.end_time = time.time()
+        if err is not None:
+            self.error = str(err)
+        self.loop.quit(0 if err is None else 1)
+
+def start_fake_firmware (args):
+    command = [sys.executable, '-B', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fake_firmware.py'),
+               '--recv-buffer-size-exp', str(args.recv_buffer_size_exp), '--delay', str(args.delay), '--jitter', str(args.jitter)]
+    for (code, seconds) in args.command_delay:
+        command += ['--command-delay', code, seconds]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE)
+    port = process.stdout.readline().decode('ascii').strip()
+    if len(port) == 0:
+        process.wait()
+        raise littlevent.error.Error('The fake firmware did not start.')
+    return (process, port)
+
+def main ():
+    parser = argparse.ArgumentParser(description='Benchmark g-code round-trip latency and throughput.')
+    parser.add_argument('--count', type=int, default=5000, help='Number of commands for each mode.')
+    parser.add_argument('--mix', default='G1', help='Command mix as COMMAND=WEIGHT,... (default: G1).')
+    parser.add_argument('--seed', type=int, default=1, help='Seed for generating commands.')
+    parser.add_argument('--modes', nargs='+', choices=Modes, default=Modes, help='Modes to run.')
+    parser.add_argument('--recv-buffer-size-exp', type=int, default=7, help='RecvBufferSizeExp of the firmware (default: 7).')
+    parser.add_argument('--delay', type=float, default=0.0, help='Fake firmware: time to process a command, in seconds.')
+    parser.add_argument('--command-delay', nargs=2, action='append', default=[], metavar=('COMMAND', 'SECONDS'), help='Fake firmware: time to process a specific command.')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Fake firmware: maximum random time added to each delay, in seconds.')
+    parser.add_argument('--port', help='Use this serial port instead of a fake firmware.')
+    parser.add_argument('--baud', type=int, default=115200, help='Baud rate for --port.')
+    parser.add_argument('--edge-triggered', action='store_true', help='Use edge-triggered epoll.')
+    parser.add_argument('--json', help='Also write the results to this file as JSON.')
+    parser.add_argument('--max-p99', type=float, help='Fail if the 99th percentile latency of a mode exceeds this many seconds.')
+    args = parser.parse_args()
+    
+    try:
+        commands = make_commands(parse_mix(args.mix), args.count, args.seed)
+    except ValueError as e:
+        print('ERROR: {}'.format(e))
+        sys.exit(1)
+    window_size = littlevent.gcode_sender.window_for_recv_buffer(args.recv_buffer_size_exp)
+    
+    results = {}
+    failed = False
+    for mode in args.modes:
+        process = None
+        try:
+            if args.port is not None:
+                port = args.port
+            else:
+                process, port = start_fake_firmware(args)
+            run = Run(port, args.baud, commands, window_size, 1 if mode == 'stop-and-wait' else None, args.edge_triggered)
+            try:
+                result = run.run()
+                latencies = run.latencies
+            finally:
+                run.close()
+        except littlevent.error.Error as e:
+            print('ERROR: {}: {}'.format(mode, e))
+            sys.exit(1)
+        finally:
+            if process is not None:
+                process.terminate()
+                process.wait()
+        results[mode] = result
+        
+        print('{}: {} commands in {:.3f} s, {:.0f} commands/s, {:.0f} bytes/s'.format(
+            mode, result['commands'], result['time'], result['commands_per_second'], result['bytes_per_second']))
+        if result['commands'] == 0:
+            print('  latency us: no commands were acknowledged')
+        else:
+            print('  latency us: mean {:.1f} p50 {:.1f} p90 {:.1f} p99 {:.1f} max {:.1f} jitter {:.1f}'.format(
+                *[result[key] * 1e6 for key in ['mean', 'p50', 'p90', 'p99', 'max', 'jitter']]))
+            for line in histogram(latencies):
+                print(line)
+        if args.max_p99 is not None:
+            if result['p99'] is None:
+                print('  FAILED: no p99 latency to check')
+                failed = True
+            elif result['p99'] > args.max_p99:
+                print('  FAILED: p99 latency exceeds {} s'.format(args.max_p99))
+                failed = True
+    
+    if args.json is not None:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    sys.exit(1 if failed else 0)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/python2.7 -B
+
+# Measures littlevent dispatch latency against the number of pending LIFO
+# events. Each dispatched event pushes two other events, most of which are
+# already pending, so the queue stays full and every push also moves an
+# event within it. To compare against an older littlevent, run the copy of
+# this script in an older checkout.
+
+from __future__ import print_function
+import sys
+import argparse
+import random
+import time
+import littlevent.close
+import littlevent.error
+import littlevent.loop
+
+class Bench (littlevent.close.Obj):
+    def __init__ (self, event_count, dispatch_count):
+        littlevent.close.Obj.__init__(self)
+        try:
+            self.loop = self.add(littlevent.loop.Loop())
+            self.events = [self.add(littlevent.loop.LifoEvent(self.loop, self._event_handler)) for i in range(event_count)]
+            rng = random.Random(1)
+            self.targets = [self.events[rng.randrange(event_count)] for i in range(4096)]
+            self.target_pos = 0
+            self.want_count = dispatch_count
+            self.done_count = 0
+        except littlevent.error.Error:
+            self.close()
+            raise
+    
+    def run (self):
+        for event in self.events:
+            event.push()
+        start_time = time.time()
+        self.loop.run()
+        return time.time() - start_time
+    
+    def _event_handler (self):
+        self.done_count += 1
+        if self.done_count >= self.want_count:
+            return self.loop.quit(0)
+        pos = self.target_pos
+        self.targets[pos].push()
+        self.targets[pos + 1].push()
+        self.target_pos = (pos + 2) % len(self.targets)
+
+def main ():
+    parser = argparse.ArgumentParser(description='Benchmark littlevent dispatch latency against the number of events.')
+    parser.add_argument('--events', type=int, nargs='+', default=[1, 10, 100, 1000, 10000], help='Numbers of events to test.')
+    parser.add_argument('--count', type=int, default=200000, help='Number of dispatches for each test.')
+    args = parser.parse_args()
+    
+    print('{:>8} {:>14}'.format('events', 'us/dispatch'))
+    for event_count in args.events:
+        try:
+            bench = Bench(event_count, args.count)
+        except littlevent.error.Error as e:
+            print('ERROR: {}'.format(e))
+            sys.exit(1)
+        try:
+            run_time = bench.run()
+        finally:
+            bench.close()
+        print('{:>8} {:>14.3f}'.format(event_count, run_time / bench.done_count * 1e6))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/python2.7 -B
+
+# Stands in for a printer on a pseudo terminal, for testing and benchmarking
+# hosts without hardware. It prints the path of the terminal and then
+# processes commands one at a time like APrinter does: it keeps received
+# data in a receive buffer of 2^RecvBufferSizeExp - 1 bytes, checks line
+# numbers and checksums, answers with "ok" after a configurable delay, and
+# reports "Error:receive buffer overrun" if the host sends too much.
+
+from __future__ import print_function
+import os
+import sys
+import pty
+import tty
+import time
+import select
+import random
+import argparse
+
+class FakeFirmware (object):
+    def __init__ (self, fd, recv_buffer_size_exp, delay, command_delays, jitter, seed):
+        self.fd = fd
+        self.capacity = 2**recv_buffer_size_exp - 1
+        self.delay = delay
+        self.command_delays = command_delays
+        self.jitter = jitter
+        self.rng = random.Random(seed)
+        self.buffer = b''
+        self.overrun = False
+        self.overrun_error = False
+        self.line_number = 1
+    
+    def run (self):
+        while True:
+            newline_pos = self.buffer.find(b'\n')
+            if newline_pos < 0:
+                if not self._receive(True):
+                    return
+                continue
+            line = self.buffer[:newline_pos]
+            if self.overrun_error:
+                self.overrun_error = False
+                reply = b'Error:receive buffer overrun\nok\n'
+            else:
+                reply = self._process(line.rstrip(b'\r'))
+            # The command stays in the receive buffer until it is finished.
+            if not self._receive(False):
+                return
+            if self.overrun:
+                # What was received after the command is lost, and the next
+                # command reports the error.
+                self.overrun = False
+                self.overrun_error = True
+                self.buffer = b''
+            else:
+                self.buffer = self.buffer[(newline_pos + 1):]
+            os.write(self.fd, reply)
+    
+    def _receive (self, wait):
+        while True:
+            if not select.select([self.fd], [], [], None if wait else 0)[0]:
+                return True
+            data = os.read(self.fd, 4096)
+            if len(data) == 0:
+                return False
+            self.buffer += data
+            if len(self.buffer) > self.capacity:
+                self.buffer = self.buffer[:self.capacity]
+                self.overrun = True
+            wait = False
+    
+    def _process (self, line):
+        data, star, checksum = line.partition(b'*')
+        parts = data.split()
+        if len(parts) == 0:
+            return b'Error:empty command\nok\n'
+        if star:
+            computed = 0
+            for ch in bytearray(data):
+                computed ^= ch
+            if not checksum.strip().isdigit() or int(checksum) != computed:
+                return b'Error:incorrect checksum\nok\n'
+        number = None
+        if parts[0].startswith(b'N'):
+            number = int(parts[0][1:])
+            parts = parts[1:]
+            if len(parts) == 0:
+                return b'Error:empty command\nok\n'
+        command = parts[0].upper()
+        if command == b'M110':
+            self.line_number = number if number is not None else 0
+        elif number is not None and number != self.line_number:
+            return b'Error:Line Number is not Last Line Number+1, Last Line:%d\nok\n' % (self.line_number - 1)
+        if number is not None or command == b'M110':
+            self.line_number += 1
+        delay = self.command_delays.get(command, self.delay)
+        if self.jitter > 0:
+            delay += self.rng.uniform(0, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+        if command == b'M105':
+            return b'ok B:20.0 /0.0 T:21.0 /0.0\n'
+        return b'ok\n'
+
+def main ():
+    parser = argparse.ArgumentParser(description='Emulate a printer on a pseudo terminal.')
+    parser.add_argument('--recv-buffer-size-exp', type=int, default=7, help='RecvBufferSizeExp to emulate (default: 7).')
+    parser.add_argument('--delay', type=float, default=0.0, help='Time to process a command, in seconds.')
+    parser.add_argument('--command-delay', nargs=2, action='append', default=[], metavar=('COMMAND', 'SECONDS'), help='Time to process a specific command, like G1.')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Maximum random time added to each delay, in seconds.')
+    parser.add_argument('--seed', type=int, default=1, help='Seed for the jitter.')
+    parser.add_argument('--link', help='Also make this symbolic link to the terminal.')
+    args = parser.parse_args()
+    command_delays = dict((command.upper().encode('ascii'), float(seconds)) for (command, seconds) in args.command_delay)
+    
+    master_fd, slave_fd = pty.openpty()
+    tty.setraw(master_fd)
+    tty.setraw(slave_fd)
+    path = os.ttyname(slave_fd)
+    if args.link is not None:
+        if os.path.islink(args.link):
+            os.remove(args.link)
+        os.symlink(path, args.link)
+    print(path)
+    sys.stdout.flush()
+    try:
+        FakeFirmware(master_fd, args.recv_buffer_size_exp, args.delay, command_delays, args.jitter, args.seed).run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if args.link is not None and os.path.islink(args.link):
+            os.remove(args.link)
+
+if __name__ == '__main__':
+    main()
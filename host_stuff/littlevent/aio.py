@@ -0,0 +1,209 @@
+# Asyncio adapter for the littlevent file descriptor and serial port I/O,
+# for use alongside other asyncio based code. This module needs Python 3.7
+# or newer, the rest of littlevent does not depend on it.
+#
+# Like littlevent.fd_io.FileDescriptor, the transport works on a non-blocking
+# file descriptor, but it is driven by loop.add_reader/loop.add_writer of the
+# running asyncio loop instead of littlevent.loop.Loop.
+
+import os
+import tty
+import fcntl
+import errno
+import termios
+import asyncio
+import littlevent.error
+
+DefaultReadMaxLength = 512
+DefaultWriteHighWater = 64 * 1024
+DefaultWriteLowWater = 16 * 1024
+
+class FileDescriptorTransport (asyncio.Transport):
+    def __init__ (self, loop, fd_num, close_it, protocol, read_max_length=DefaultReadMaxLength, extra=None):
+        asyncio.Transport.__init__(self, extra)
+        self._loop = loop
+        self._fd_num = fd_num
+        self._close_it = close_it
+        self._protocol = protocol
+        self._read_max_length = read_max_length
+        self._reading = False
+        self._closing = False
+        self._closed = False
+        self._write_buffer = bytearray()
+        self._writing_paused = False
+        self._write_high_water = DefaultWriteHighWater
+        self._write_low_water = DefaultWriteLowWater
+        try:
+            fl = fcntl.fcntl(self._fd_num, fcntl.F_GETFL)
+            fcntl.fcntl(self._fd_num, fcntl.F_SETFL, fl | os.O_NONBLOCK)
+        except OSError as e:
+            raise littlevent.error.Error(e)
+        self._loop.call_soon(self._protocol.connection_made, self)
+        self._loop.call_soon(self.resume_reading)
+    
+    def get_protocol (self):
+        return self._protocol
+    
+    def set_protocol (self, protocol):
+        self._protocol = protocol
+    
+    def is_closing (self):
+        return self._closing
+    
+    def is_reading (self):
+        return self._reading
+    
+    def pause_reading (self):
+        if self._reading:
+            self._loop.remove_reader(self._fd_num)
+            self._reading = False
+    
+    def resume_reading (self):
+        if not self._reading and not self._closing:
+            self._loop.add_reader(self._fd_num, self._read_ready)
+            self._reading = True
+    
+    def get_write_buffer_size (self):
+        return len(self._write_buffer)
+    
+    def set_write_buffer_limits (self, high=None, low=None):
+        if high is None:
+            high = DefaultWriteHighWater if low is None else 4 * low
+        if low is None:
+            low = high // 4
+        assert 0 <= low <= high
+        self._write_high_water = high
+        self._write_low_water = low
+        self._update_write_flow()
+    
+    def get_write_buffer_limits (self):
+        return (self._write_low_water, self._write_high_water)
+    
+    def write (self, data):
+        if self._closing or len(data) == 0:
+            return
+        if len(self._write_buffer) == 0:
+            try:
+                written = os.write(self._fd_num, data)
+            except OSError as e:
+                if e.errno != errno.EWOULDBLOCK and e.errno != errno.EAGAIN:
+                    return self._fatal_error(e)
+                written = 0
+            if written == len(data):
+                return
+            data = memoryview(data)[written:]
+            self._loop.add_writer(self._fd_num, self._write_ready)
+        self._write_buffer += data
+        self._update_write_flow()
+    
+    # A serial port cannot be half-closed, so write_eof is left to
+    # asyncio.WriteTransport, which raises NotImplementedError.
+    def can_write_eof (self):
+        return False
+    
+    def close (self):
+        if self._closing:
+            return
+        self._closing = True
+        self.pause_reading()
+        if len(self._write_buffer) == 0:
+            self._loop.call_soon(self._finish_close, None)
+    
+    def abort (self):
+        self._force_close(None)
+    
+    def _read_ready (self):
+        try:
+            data = os.read(self._fd_num, self._read_max_length)
+        except OSError as e:
+            if e.errno == errno.EWOULDBLOCK or e.errno == errno.EAGAIN:
+                return
+            return self._fatal_error(e)
+        if len(data) == 0:
+            self.pause_reading()
+            keep_open = self._protocol.eof_received()
+            if not keep_open:
+                self.close()
+            return
+        self._protocol.data_received(data)
+    
+    def _write_ready (self):
+        try:
+            written = os.write(self._fd_num, self._write_buffer)
+        except OSError as e:
+            if e.errno == errno.EWOULDBLOCK or e.errno == errno.EAGAIN:
+                return
+            return self._fatal_error(e)
+        del self._write_buffer[:written]
+        self._update_write_flow()
+        if len(self._write_buffer) == 0:
+            self._loop.remove_writer(self._fd_num)
+            if self._closing:
+                self._finish_close(None)
+    
+    def _update_write_flow (self):
+        size = len(self._write_buffer)
+        if not self._writing_paused and size > self._write_high_water:
+            self._writing_paused = True
+            self._protocol.pause_writing()
+        elif self._writing_paused and size <= self._write_low_water:
+            self._writing_paused = False
+            self._protocol.resume_writing()
+    
+    def _fatal_error (self, exc):
+        self._force_close(exc)
+    
+    def _force_close (self, exc):
+        if self._closed:
+            return
+        if len(self._write_buffer) != 0:
+            del self._write_buffer[:]
+            self._loop.remove_writer(self._fd_num)
+        if not self._closing:
+            self._closing = True
+            self.pause_reading()
+        self._loop.call_soon(self._finish_close, exc)
+    
+    def _finish_close (self, exc):
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._protocol.connection_lost(exc)
+        finally:
+            if self._close_it:
+                try:
+                    os.close(self._fd_num)
+                except OSError as e:
+                    pass
+
+async def create_fd_connection (protocol_factory, fd_num, close_it, read_max_length=DefaultReadMaxLength):
+    loop = asyncio.get_running_loop()
+    protocol = protocol_factory()
+    transport = FileDescriptorTransport(loop, fd_num, close_it, protocol, read_max_length)
+    return (transport, protocol)
+
+async def create_serial_connection (protocol_factory, device_path, baud_rate, read_max_length=DefaultReadMaxLength):
+    # The baud rate is accepted for compatibility with littlevent.serial.Serial,
+    # which leaves the port speed as it is.
+    try:
+        fd_num = os.open(device_path, os.O_RDWR)
+    except OSError as e:
+        raise littlevent.error.Error(e)
+    try:
+        try:
+            tty.setraw(fd_num)
+        except termios.error as e:
+            raise littlevent.error.Error(e)
+        return await create_fd_connection(protocol_factory, fd_num, True, read_max_length)
+    except littlevent.error.Error:
+        os.close(fd_num)
+        raise
+
+async def open_serial (device_path, baud_rate, limit=2**16):
+    # Streams interface, like asyncio.open_connection.
+    reader = asyncio.StreamReader(limit=limit)
+    protocol = asyncio.StreamReaderProtocol(reader)
+    transport, _ = await create_serial_connection(lambda: protocol, device_path, baud_rate)
+    writer = asyncio.StreamWriter(transport, protocol, reader, asyncio.get_running_loop())
+    return (reader, writer)
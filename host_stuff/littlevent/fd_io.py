@@ -1,38 +1,61 @@
 import os
+import io
 import fcntl
 import errno
+import itertools
+import collections
 import littlevent.error
 import littlevent.close
 import littlevent.loop
 
+_HaveWritev = hasattr(os, 'writev')
+try:
+    _IovMax = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError):
+    _IovMax = 16
+
+# Writes are queued as memoryview segments, written together with writev
+# where available, and partial writes only slice the first segment. With
+# buffered reads, the read handler gets a memoryview into a buffer which is
+# reused for all reads, valid until the handler returns.
 class FileDescriptor (littlevent.close.Obj):
     def __init__ (self, loop, fd_num, close_it, error_handler):
         self.fd_num = fd_num
         self.close_it = close_it
         self.error_handler = error_handler
         littlevent.close.Obj.__init__(self)
+        def on_close ():
+            if self.close_it:
+                try:
+                    os.close(self.fd_num)
+                except OSError as e:
+                    pass
+        self.add(on_close)
         self.loop_fd = self.add(littlevent.loop.FileDescriptor(loop, self.fd_num, self._fd_handler))
         self.read_handler = None
+        self.read_buffered = False
+        self.read_file = None
+        self.read_buffer = None
         self.read_max_length = 0
         self.read_lifo_event = self.add(littlevent.loop.LifoEvent(loop, self._read_lifo_event_handler))
         self.write_handler = None
-        self.write_data = ''
+        self.write_queue = collections.deque()
+        self.write_length = 0
         self.write_lifo_event = self.add(littlevent.loop.LifoEvent(loop, self._write_lifo_event_handler))
         try:
             fl = fcntl.fcntl(self.fd_num, fcntl.F_GETFL)
             fcntl.fcntl(self.fd_num, fcntl.F_SETFL, fl | os.O_NONBLOCK)
         except IOError as e:
             raise littlevent.error.Error(e)
-        def on_close ():
-            if self.close_it:
-                try:
-                    os.close(self.fd_num)
-                except OSError as e:
-                    pass
-        self.add(on_close)
     
-    def read_set_handler (self, read_handler):
+    def read_set_handler (self, read_handler, buffered=False):
         self.read_handler = read_handler
+        self.read_buffered = buffered
+        if buffered and self.read_file is None:
+            try:
+                self.read_file = self.add(io.FileIO(self.fd_num, 'r', closefd=False))
+            except (IOError, OSError) as e:
+                raise littlevent.error.Error(e)
     
     def read_start (self, read_max_length):
         assert self.read_max_length == 0
@@ -40,26 +63,41 @@ class FileDescriptor (littlevent.close.Obj):
         self.read_max_length = read_max_length
         self.read_lifo_event.push()
     
+    def read_cancel (self):
+        if self.read_max_length > 0:
+            self.read_max_length = 0
+            self.read_lifo_event.remove()
+            self.loop_fd.remove_events(littlevent.loop.FdEventRead)
+    
     def write_set_handler (self, write_handler):
         self.write_handler = write_handler
     
     def write_start (self, write_data):
-        assert len(self.write_data) == 0
+        # May be called while writing, the handler is called once all queued
+        # data has been written. The data must not be modified until then.
         assert len(write_data) > 0
-        self.write_data = write_data
-        self.write_lifo_event.push()
+        self.write_queue.append(memoryview(write_data))
+        self.write_length += len(write_data)
+        if self.write_length == len(write_data):
+            self.write_lifo_event.push()
     
     def _read_lifo_event_handler (self):
         assert self.read_max_length > 0
         try:
-            data = os.read(self.fd_num, self.read_max_length)
-        except OSError as e:
-            if e.args[0] == errno.EWOULDBLOCK or e.args[0] == errno.EAGAIN:
-                self.loop_fd.add_events(littlevent.loop.FdEventRead)
+            if self.read_buffered:
+                data = self._read_into_buffer()
+            else:
+                data = os.read(self.fd_num, self.read_max_length)
+        except (IOError, OSError) as e:
+            if e.errno == errno.EWOULDBLOCK or e.errno == errno.EAGAIN:
+                self.loop_fd.wait_events(littlevent.loop.FdEventRead)
                 return
             data = None
             err = e
         else:
+            if data is None:
+                self.loop_fd.wait_events(littlevent.loop.FdEventRead)
+                return
             if len(data) == 0:
                 data = None
                 err = IOError('EOF encountered.')
@@ -69,26 +107,48 @@ class FileDescriptor (littlevent.close.Obj):
         self.read_max_length = 0
         return self.read_handler(data, err)
     
+    def _read_into_buffer (self):
+        if self.read_buffer is None or len(self.read_buffer) < self.read_max_length:
+            self.read_buffer = memoryview(bytearray(self.read_max_length))
+        length = self.read_file.readinto(self.read_buffer[:self.read_max_length])
+        if length is None:
+            return None
+        return self.read_buffer[:length]
+    
     def _write_lifo_event_handler (self):
-        assert len(self.write_data) > 0
+        assert self.write_length > 0
+        write_queue = self.write_queue
         while True:
             try:
-                written = os.write(self.fd_num, self.write_data)
+                if not _HaveWritev:
+                    written = os.write(self.fd_num, write_queue[0])
+                elif len(write_queue) <= _IovMax:
+                    written = os.writev(self.fd_num, write_queue)
+                else:
+                    written = os.writev(self.fd_num, list(itertools.islice(write_queue, _IovMax)))
             except OSError as e:
                 if e.args[0] == errno.EWOULDBLOCK or e.args[0] == errno.EAGAIN:
-                    self.loop_fd.add_events(littlevent.loop.FdEventWrite)
+                    self.loop_fd.wait_events(littlevent.loop.FdEventWrite)
                     return
                 err = e
             else:
                 if written == 0:
                     err = IOError('Zero write.')
                 else:
-                    if written < len(self.write_data):
-                        self.write_data = self.write_data[written:]
+                    self.write_length -= written
+                    while written > 0:
+                        segment = write_queue[0]
+                        if written < len(segment):
+                            write_queue[0] = segment[written:]
+                            break
+                        written -= len(segment)
+                        write_queue.popleft()
+                    if self.write_length > 0:
                         continue
                     err = None
             self.loop_fd.remove_events(littlevent.loop.FdEventWrite)
-            self.write_data = ''
+            write_queue.clear()
+            self.write_length = 0
             return self.write_handler(err)
     
     def _fd_handler (self, returned_events):
@@ -96,7 +156,7 @@ class FileDescriptor (littlevent.close.Obj):
         if self.read_max_length > 0 and (returned_events & littlevent.loop.FdEventRead):
             self.read_lifo_event.push()
             handled = True
-        if len(self.write_data) > 0 and (returned_events & littlevent.loop.FdEventWrite):
+        if self.write_length > 0 and (returned_events & littlevent.loop.FdEventWrite):
             self.write_lifo_event.push()
             handled = True
         if not handled:
@@ -0,0 +1,100 @@
+import re
+import collections
+import littlevent.error
+
+# Splits received data into lines. The data is kept in one bytearray, with
+# the offset of the first unconsumed byte and the offset up to which it has
+# been searched for a newline, so each byte is scanned once and consumed
+# data is only removed when more data is fed. Lines are returned as
+# memoryviews into the buffer, which should not be kept after the next feed.
+
+DefaultMaxLength = 4096
+
+class LineFramer (object):
+    def __init__ (self, max_length=DefaultMaxLength):
+        self.max_length = max_length
+        self.buffer = bytearray()
+        self.start = 0
+        self.scan = 0
+    
+    def feed (self, data):
+        try:
+            if self.start > 0:
+                del self.buffer[:self.start]
+            self.buffer += data
+        except BufferError:
+            # A line from before is still being referenced, leave it alone.
+            self.buffer = self.buffer[self.start:] + data
+        self.scan -= self.start
+        self.start = 0
+    
+    def _line_ranges (self):
+        buffer = self.buffer
+        while True:
+            newline_pos = buffer.find(b'\n', self.scan)
+            if newline_pos < 0:
+                self.scan = len(buffer)
+                if self.scan - self.start > self.max_length:
+                    raise littlevent.error.Error('Received line is too long.')
+                return
+            line_start = self.start
+            line_end = newline_pos
+            if line_end > line_start and buffer[line_end - 1] == 13:
+                line_end -= 1
+            self.start = newline_pos + 1
+            self.scan = self.start
+            yield (line_start, line_end)
+    
+    def lines (self):
+        view = memoryview(self.buffer)
+        for (line_start, line_end) in self._line_ranges():
+            yield view[line_start:line_end]
+
+# Typed events for the responses of the firmware.
+#
+# Ok: "ok", with anything after it as info.
+# Error: "Error:...". The resend field is the number of the line the firmware
+#   expects next if it said so, ResendCurrent for checksum errors, where the
+#   command being processed needs to be sent again, or None. The overrun field
+#   is true for receive buffer overruns, after which it is not known which
+#   commands were lost.
+# Resend: "Resend: N" or "rs N".
+# Other: anything else, like the output of M105.
+
+Ok = collections.namedtuple('Ok', ['info'])
+Error = collections.namedtuple('Error', ['message', 'resend', 'overrun'])
+Resend = collections.namedtuple('Resend', ['line_number'])
+Other = collections.namedtuple('Other', ['line'])
+
+ResendCurrent = -1
+
+_PlainOk = Ok(b'')
+_LastLineRegex = re.compile(br'Last Line: *(\d+)', re.IGNORECASE)
+_ResendRegex = re.compile(br'^(?:Resend: *|rs +N?)(\d+)', re.IGNORECASE)
+
+def parse_response (line):
+    if line.startswith(b'ok'):
+        return _PlainOk if len(line) == 2 else Ok(line[2:].strip())
+    if line.startswith(b'Error:'):
+        message = line[6:]
+        match = _LastLineRegex.search(message)
+        if match is not None:
+            return Error(message, int(match.group(1)) + 1, False)
+        lower = message.lower()
+        if b'checksum' in lower:
+            return Error(message, ResendCurrent, False)
+        return Error(message, None, b'overrun' in lower)
+    if line[:1] in (b'R', b'r'):
+        match = _ResendRegex.match(line)
+        if match is not None:
+            return Resend(int(match.group(1)))
+    return Other(line)
+
+class ResponseFramer (LineFramer):
+    def events (self):
+        buffer = self.buffer
+        for (line_start, line_end) in self._line_ranges():
+            if line_end - line_start == 2 and buffer.startswith(b'ok', line_start):
+                yield _PlainOk
+            else:
+                yield parse_response(bytes(buffer[line_start:line_end]))
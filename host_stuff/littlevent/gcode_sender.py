@@ -0,0 +1,225 @@
+import time
+import collections
+import littlevent.close
+import littlevent.error
+import littlevent.framer
+
+# Sends g-code over a serial port without waiting for the reply to each
+# command. Commands are numbered and checksummed, and as many are kept
+# outstanding as fit into the receive buffer of the firmware; each "ok"
+# frees the space of the oldest command. When the firmware asks for a line
+# to be sent again, all outstanding commands from that line on are sent
+# again, and the errors which the firmware reports for the commands already
+# on the way are ignored.
+
+def window_for_recv_buffer (recv_buffer_size_exp):
+    # The receive buffer of the firmware is a ring buffer of this many bytes,
+    # of which one is always left free.
+    return 2**recv_buffer_size_exp - 1
+
+def strip_line (line):
+    comment_pos = line.find(b';')
+    if comment_pos >= 0:
+        line = line[:comment_pos]
+    return line.strip()
+
+def format_line (number, command):
+    data = b'N%d %s' % (number, command)
+    checksum = 0
+    for ch in bytearray(data):
+        checksum ^= ch
+    return b'%s*%d\n' % (data, checksum)
+
+class _Entry (object):
+    __slots__ = ['number', 'data', 'superseded', 'send_time']
+    
+    def __init__ (self, number, data):
+        self.number = number
+        self.data = data
+        self.superseded = False
+        self.send_time = None
+
+class GcodeSender (littlevent.close.Obj):
+    # With max_commands, at most this many commands are outstanding; 1 gives
+    # stop-and-wait. The ack handler, if given, is called with the line number
+    # and the time the command was sent for each acknowledged command. The done
+    # handler gets a littlevent.error.Error when the job itself cannot go on,
+    # and the error of the serial port when that fails.
+    def __init__ (self, serial, commands, window_size, done_handler, reply_handler=None, max_commands=None, ack_handler=None):
+        self.serial = serial
+        self.commands = iter(commands)
+        self.window_size = window_size
+        self.done_handler = done_handler
+        self.reply_handler = reply_handler
+        self.max_commands = max_commands
+        self.ack_handler = ack_handler
+        littlevent.close.Obj.__init__(self)
+        self.serial.read_io().read_set_handler(self._read_handler, buffered=True)
+        self.serial.write_io().write_set_handler(self._write_handler)
+        self.next_number = 0
+        self.next_entry = self._make_entry(b'M110')
+        self.input_done = False
+        self.unacked = collections.deque()
+        self.resend = collections.deque()
+        self.outstanding = 0
+        self.finished = False
+        self.framer = littlevent.framer.ResponseFramer()
+        self.sent_count = 0
+        self.resent_count = 0
+        self.error_count = 0
+        self.sent_bytes = 0
+        self.start_time = None
+        self.stopped = False
+        self.rewound_number = None
+        def cancel_read ():
+            self.serial.read_io().read_cancel()
+        self.add(cancel_read)
+    
+    def start (self):
+        self.start_time = time.time()
+        self.serial.read_io().read_start(512)
+        self._send()
+    
+    def stop (self):
+        # Stops sending commands. The done handler is called once the
+        # outstanding commands have been acknowledged.
+        if self.finished or self.stopped:
+            return
+        self.stopped = True
+        self.next_entry = None
+        self.input_done = True
+        self.resend.clear()
+        if len(self.unacked) == 0:
+            self._finish(None)
+    
+    def _make_entry (self, command):
+        entry = _Entry(self.next_number, format_line(self.next_number, command))
+        self.next_number += 1
+        return entry
+    
+    def _take_next (self):
+        entry = self.next_entry
+        self.next_entry = None
+        for line in self.commands:
+            command = strip_line(line)
+            if len(command) > 0:
+                self.next_entry = self._make_entry(command)
+                break
+        else:
+            self.input_done = True
+        return entry
+    
+    def _send (self):
+        if self.finished:
+            return
+        write_io = self.serial.write_io()
+        while True:
+            if len(self.resend) != 0:
+                entry = self.resend[0]
+            elif self.next_entry is not None:
+                entry = self.next_entry
+            else:
+                break
+            if self.max_commands is not None and len(self.unacked) >= self.max_commands:
+                break
+            if self.outstanding + len(entry.data) > self.window_size:
+                if len(self.unacked) == 0:
+                    return self._finish(littlevent.error.Error('Line {} does not fit into the receive buffer.'.format(entry.number)))
+                break
+            if len(self.resend) != 0:
+                self.resend.popleft()
+                self.resent_count += 1
+            else:
+                try:
+                    self._take_next()
+                except (IOError, OSError) as e:
+                    return self._finish(littlevent.error.Error('Cannot read the commands: {}'.format(e)))
+                self.sent_count += 1
+            self.unacked.append(entry)
+            self.outstanding += len(entry.data)
+            self.sent_bytes += len(entry.data)
+            if self.ack_handler is not None:
+                entry.send_time = time.time()
+            write_io.write_start(entry.data)
+    
+    def _write_handler (self, err):
+        if err is not None:
+            return self._finish(err)
+    
+    def _read_handler (self, data, err):
+        if err is not None:
+            return self._finish(err)
+        if self.finished:
+            return
+        self.serial.read_io().read_start(512)
+        self.framer.feed(data)
+        try:
+            for event in self.framer.events():
+                if self.finished:
+                    return
+                self._handle_event(event)
+        except littlevent.error.Error as e:
+            return self._finish(e)
+    
+    def _handle_event (self, event):
+        if type(event) is littlevent.framer.Ok:
+            return self._ack()
+        if type(event) is littlevent.framer.Resend:
+            number = event.line_number
+        elif type(event) is littlevent.framer.Error:
+            if event.overrun:
+                return self._finish(littlevent.error.Error('Receive buffer overrun in the firmware, check the receive buffer size.'))
+            number = event.resend
+        else:
+            number = None
+        if number is not None:
+            # Errors for commands sent before a resend are expected.
+            head = self.unacked[0] if len(self.unacked) != 0 else None
+            if head is None or head.superseded:
+                return
+            if self.stopped:
+                return
+            return self._rewind(head.number if number == littlevent.framer.ResendCurrent else number)
+        if type(event) is littlevent.framer.Error:
+            self.error_count += 1
+        if self.reply_handler is not None:
+            self.reply_handler(event)
+    
+    def _ack (self):
+        if len(self.unacked) == 0:
+            return
+        entry = self.unacked.popleft()
+        self.outstanding -= len(entry.data)
+        self.rewound_number = None
+        if self.ack_handler is not None and not entry.superseded:
+            self.ack_handler(entry.number, entry.send_time)
+        if self.input_done and self.next_entry is None and len(self.resend) == 0 and len(self.unacked) == 0:
+            return self._finish(None)
+        self._send()
+    
+    def _rewind (self, number):
+        # One fault may be reported twice before its ok, as an Error and as a
+        # Resend, and a line already waiting to be sent again needs nothing.
+        if number == self.rewound_number or any(entry.number == number for entry in self.resend):
+            return
+        pending = [entry for entry in self.unacked if not entry.superseded]
+        index = 0
+        for entry in pending:
+            if entry.number == number:
+                break
+            index += 1
+        else:
+            return self._finish(littlevent.error.Error('Cannot resend line {}, which is not outstanding.'.format(number)))
+        self.rewound_number = number
+        again = []
+        for entry in pending[index:]:
+            entry.superseded = True
+            again.append(_Entry(entry.number, entry.data))
+        self.resend.extendleft(reversed(again))
+        self._send()
+    
+    def _finish (self, err):
+        if self.finished:
+            return
+        self.finished = True
+        self.done_handler(err)
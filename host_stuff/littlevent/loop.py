@@ -8,8 +8,27 @@ FdEventWrite = 2**1
 FdEventError = 2**2
 FdEventHup = 2**3
 
+FdEventsAlways = FdEventError | FdEventHup
+
+def _translate_epoll_events (epoll_events):
+    events = 0
+    if epoll_events & select.EPOLLIN:
+        events |= FdEventRead
+    if epoll_events & select.EPOLLOUT:
+        events |= FdEventWrite
+    if epoll_events & select.EPOLLERR:
+        events |= FdEventError
+    if epoll_events & select.EPOLLHUP:
+        events |= FdEventHup
+    return events
+
 class Loop (littlevent.close.Obj):
-    def __init__ (self):
+    # In edge-triggered mode, file descriptors are registered once for both
+    # directions with EPOLLET and the loop caches their readiness, so
+    # changing the events of interest does not need an epoll.modify call.
+    # Readiness is only forgotten when the user reports that an operation
+    # would block, using FileDescriptor.wait_events.
+    def __init__ (self, edge_triggered=False):
         littlevent.close.Obj.__init__(self)
         try:
             signal.signal(signal.SIGINT, signal.SIG_DFL)
@@ -17,12 +36,14 @@ class Loop (littlevent.close.Obj):
                 self.epoll = self.add(select.epoll())
             except socket.error as e:
                 raise littlevent.error.Error(e)
+            self.edge_triggered = edge_triggered
             self.quitting = False
             self.fds = {}
             self.pending_fds = set()
-            self.pending_lifo = []
+            self.epoll_event_map = {}
+            self.pending_lifo = LifoQueue()
             def check_close ():
-                assert len(self.pending_lifo) == 0
+                assert self.pending_lifo.empty()
                 assert len(self.pending_fds) == 0
                 assert len(self.fds) == 0
             self.add(check_close)
@@ -33,20 +54,17 @@ class Loop (littlevent.close.Obj):
     
     def run (self):
         self._process_lifo()
+        pending_fds = self.pending_fds
         while not self.quitting:
-            results = self.epoll.poll()
-            self.pending_fds = dict((self.fds[fd_num], epoll_returned_events) for (fd_num, epoll_returned_events) in results)
-            while not self.quitting and len(self.pending_fds) != 0:
-                fd_obj, epoll_returned_events = self.pending_fds.popitem()
-                returned_events = 0
-                if (fd_obj.events & FdEventRead) and (epoll_returned_events & select.EPOLLIN):
-                    returned_events |= FdEventRead
-                if (fd_obj.events & FdEventWrite) and (epoll_returned_events & select.EPOLLOUT):
-                    returned_events |= FdEventWrite
-                if (epoll_returned_events & select.EPOLLERR):
-                    returned_events |= FdEventError
-                if (epoll_returned_events & select.EPOLLHUP):
-                    returned_events |= FdEventHup
+            if len(pending_fds) == 0:
+                self._poll()
+            while not self.quitting and len(pending_fds) != 0:
+                fd_obj = pending_fds.pop()
+                ready = fd_obj.ready
+                returned_events = ready & (fd_obj.events | FdEventsAlways)
+                # Read and write readiness stays cached in edge-triggered
+                # mode, everything else is reported once.
+                fd_obj.ready = ready & (FdEventRead | FdEventWrite) if self.edge_triggered else 0
                 if returned_events != 0:
                     fd_obj.handler(returned_events)
                     self._process_lifo()
@@ -56,19 +74,66 @@ class Loop (littlevent.close.Obj):
         self.quitting = True
         self.return_value = return_value
     
+    def _poll (self):
+        results = self.epoll.poll()
+        event_map = self.epoll_event_map
+        for (fd_num, epoll_returned_events) in results:
+            events = event_map.get(epoll_returned_events)
+            if events is None:
+                events = _translate_epoll_events(epoll_returned_events)
+                event_map[epoll_returned_events] = events
+            fd_obj = self.fds[fd_num]
+            fd_obj.ready |= events
+            self.pending_fds.add(fd_obj)
+    
     def _process_lifo (self):
-        while not self.quitting and len(self.pending_lifo) != 0:
+        while not self.quitting and not self.pending_lifo.empty():
             lifo_event = self.pending_lifo.pop()
             assert lifo_event.pending
             lifo_event.pending = False
             lifo_event.handler()
 
+class LifoQueue (object):
+    # Circular doubly-linked list threaded through the pending LifoEvent
+    # objects themselves, with the queue as the sentinel node, so that
+    # pushing, popping and removing an event are all O(1).
+    def __init__ (self):
+        self.lifo_prev = self
+        self.lifo_next = self
+    
+    def empty (self):
+        return self.lifo_next is self
+    
+    def top (self):
+        return None if self.lifo_prev is self else self.lifo_prev
+    
+    def append (self, node):
+        last = self.lifo_prev
+        node.lifo_prev = last
+        node.lifo_next = self
+        last.lifo_next = node
+        self.lifo_prev = node
+    
+    def remove (self, node):
+        node.lifo_prev.lifo_next = node.lifo_next
+        node.lifo_next.lifo_prev = node.lifo_prev
+        node.lifo_prev = None
+        node.lifo_next = None
+    
+    def pop (self):
+        assert not self.empty()
+        node = self.lifo_prev
+        self.remove(node)
+        return node
+
 class LifoEvent (littlevent.close.Obj):
     def __init__ (self, loop, handler):
         self.loop = loop
         self.handler = handler
         littlevent.close.Obj.__init__(self)
         self.pending = False
+        self.lifo_prev = None
+        self.lifo_next = None
         def on_close ():
             if self.pending:
                 self.loop.pending_lifo.remove(self)
@@ -76,6 +141,8 @@ class LifoEvent (littlevent.close.Obj):
     
     def push (self):
         if self.pending:
+            if self.loop.pending_lifo.top() is self:
+                return
             self.loop.pending_lifo.remove(self)
         self.loop.pending_lifo.append(self)
         self.pending = True
@@ -94,10 +161,14 @@ class FileDescriptor (littlevent.close.Obj):
         littlevent.close.Obj.__init__(self)
         try:
             self.events = 0
-            self.loop.epoll.register(self.fd_num)
+            self.ready = 0
+            if self.loop.edge_triggered:
+                self.loop.epoll.register(self.fd_num, select.EPOLLIN | select.EPOLLOUT | select.EPOLLET)
+            else:
+                self.loop.epoll.register(self.fd_num, 0)
             self.loop.fds[self.fd_num] = self
             def close_it ():
-                self.loop.pending_fds.pop(self, None)
+                self.loop.pending_fds.discard(self)
                 del self.loop.fds[self.fd_num]
                 self.loop.epoll.unregister(self.fd_num)
             self.add(close_it)
@@ -109,6 +180,11 @@ class FileDescriptor (littlevent.close.Obj):
         assert (events & ~(FdEventRead | FdEventWrite)) == 0
         if events == self.events:
             return
+        if self.loop.edge_triggered:
+            if (events & ~self.events & self.ready) != 0:
+                self.loop.pending_fds.add(self)
+            self.events = events
+            return
         epoll_events = 0
         if events & FdEventRead:
             epoll_events |= select.EPOLLIN
@@ -125,3 +201,10 @@ class FileDescriptor (littlevent.close.Obj):
     
     def remove_events (self, events):
         self.set_events(self.events & ~events)
+    
+    def wait_events (self, events):
+        # To be called when an operation would block: forgets any cached
+        # readiness and waits for the events.
+        assert (events & ~(FdEventRead | FdEventWrite)) == 0
+        self.ready &= ~events
+        self.add_events(events)
@@ -0,0 +1,72 @@
+import os
+import stat
+import errno
+import socket
+import littlevent.error
+import littlevent.close
+import littlevent.loop
+import littlevent.fd_io
+
+class Listener (littlevent.close.Obj):
+    def __init__ (self, loop, path, accept_handler, error_handler):
+        self.path = path
+        self.accept_handler = accept_handler
+        self.error_handler = error_handler
+        littlevent.close.Obj.__init__(self)
+        try:
+            try:
+                # Remove the socket left behind by a previous instance.
+                if stat.S_ISSOCK(os.stat(self.path).st_mode):
+                    os.remove(self.path)
+            except OSError as e:
+                pass
+            try:
+                self.sock = self.add(socket.socket(socket.AF_UNIX, socket.SOCK_STREAM))
+                self.sock.bind(self.path)
+                def remove_it ():
+                    try:
+                        os.remove(self.path)
+                    except OSError as e:
+                        pass
+                self.add(remove_it)
+                self.sock.listen(16)
+                self.sock.setblocking(False)
+            except socket.error as e:
+                raise littlevent.error.Error(e)
+            self.loop_fd = self.add(littlevent.loop.FileDescriptor(loop, self.sock.fileno(), self._fd_handler))
+            self.loop_fd.set_events(littlevent.loop.FdEventRead)
+        
+        except littlevent.error.Error:
+            self.close()
+            raise
+    
+    def _fd_handler (self, returned_events):
+        if not (returned_events & littlevent.loop.FdEventRead):
+            return self.error_handler(IOError('Error on listening socket.'))
+        while True:
+            try:
+                conn_sock, address = self.sock.accept()
+            except socket.error as e:
+                if e.args[0] == errno.EWOULDBLOCK or e.args[0] == errno.EAGAIN:
+                    self.loop_fd.wait_events(littlevent.loop.FdEventRead)
+                    return
+                if e.args[0] == errno.EINTR or e.args[0] == errno.ECONNABORTED:
+                    continue
+                return self.error_handler(e)
+            self.accept_handler(conn_sock)
+
+class Connection (littlevent.close.Obj):
+    def __init__ (self, loop, sock, error_handler):
+        littlevent.close.Obj.__init__(self)
+        self.sock = self.add(sock)
+        try:
+            self.fd_io = self.add(littlevent.fd_io.FileDescriptor(loop, self.sock.fileno(), False, error_handler))
+        except littlevent.error.Error:
+            self.close()
+            raise
+    
+    def read_io (self):
+        return self.fd_io
+    
+    def write_io (self):
+        return self.fd_io
@@ -0,0 +1,317 @@
+#!/usr/bin/python2.7 -B
+
+# Drives a number of printers from one littlevent loop, sending the jobs
+# queued for each printer one after another with GcodeSender.
+#
+# Jobs are managed through a Unix socket, with one JSON request per line,
+# each answered with one JSON line with "ok" being true or false, and in
+# the latter case an "error" message:
+#
+#   {"command": "status"}
+#       -> {"ok": true, "printers": [{"name": ..., "port": ..., "state": ...,
+#           "job": {...} or null, "queue": [...], "finished": [...]}, ...]}
+#   {"command": "queue", "printer": NAME, "file": ABSOLUTE_PATH}
+#       -> {"ok": true, "job": ID}
+#   {"command": "cancel", "printer": NAME, "job": ID}
+#       -> {"ok": true}
+#
+# The state of a printer is "idle", "printing" or "error"; after an error of
+# the serial port the printer takes no more jobs. A job which fails for
+# another reason, such as a line which does not fit into the receive buffer,
+# only fails that job, and the next queued job is started. Cancelling the
+# running job stops sending it once the commands already sent have been
+# acknowledged.
+#
+# For example: echo '{"command": "status"}' | socat - UNIX-CONNECT:/tmp/farm.sock
+
+from __future__ import print_function
+import os
+import sys
+import json
+import time
+import argparse
+import collections
+import littlevent.close
+import littlevent.error
+import littlevent.loop
+import littlevent.serial
+import littlevent.framer
+import littlevent.unix_socket
+import littlevent.gcode_sender
+
+FinishedJobsKept = 16
+
+class Job (object):
+    def __init__ (self, job_id, file_name):
+        self.job_id = job_id
+        self.file_name = file_name
+        self.cancelled = False
+        self.result = None
+        self.start_time = None
+        self.end_time = None
+        self.sender = None
+        self.sent_count = 0
+        self.resent_count = 0
+        self.error_count = 0
+    
+    def status (self):
+        status = {'id': self.job_id, 'file': self.file_name}
+        if self.start_time is not None:
+            end_time = self.end_time if self.end_time is not None else time.time()
+            # While the job runs the counters are those of its sender.
+            counts = self.sender if self.sender is not None else self
+            status.update({
+                'time': end_time - self.start_time,
+                'sent': counts.sent_count,
+                'resent': counts.resent_count,
+                'errors': counts.error_count,
+            })
+        if self.result is not None:
+            status['result'] = self.result
+        return status
+
+class Printer (littlevent.close.Obj):
+    def __init__ (self, loop, name, port, baud, window_size):
+        self.name = name
+        self.port = port
+        self.window_size = window_size
+        littlevent.close.Obj.__init__(self)
+        try:
+            self.serial = littlevent.serial.Serial(loop, port, baud, self._error_handler)
+            def close_serial ():
+                if self.serial is not None:
+                    self.serial.close()
+            self.add(close_serial)
+            self.queue = collections.deque()
+            self.finished = collections.deque(maxlen=FinishedJobsKept)
+            self.job = None
+            self.input_file = None
+            self.sender = None
+            self.error = None
+            self.next_lifo_event = self.add(littlevent.loop.LifoEvent(loop, self._start_next))
+            self.add(self._end_job)
+        
+        except littlevent.error.Error:
+            self.close()
+            raise
+    
+    def queue_job (self, job):
+        if self.error is not None:
+            raise littlevent.error.Error('Printer {} has failed: {}'.format(self.name, self.error))
+        self.queue.append(job)
+        if self.job is None:
+            self.next_lifo_event.push()
+    
+    def cancel_job (self, job_id):
+        for job in self.queue:
+            if job.job_id == job_id:
+                self.queue.remove(job)
+                job.result = 'cancelled'
+                self.finished.append(job)
+                return
+        if self.job is not None and self.job.job_id == job_id:
+            self.job.cancelled = True
+            self.sender.stop()
+            return
+        raise littlevent.error.Error('No job {} on printer {}.'.format(job_id, self.name))
+    
+    def status (self):
+        if self.error is not None:
+            state = 'error'
+        elif self.job is not None:
+            state = 'printing'
+        else:
+            state = 'idle'
+        status = {
+            'name': self.name,
+            'port': self.port,
+            'state': state,
+            'job': self.job.status() if self.job is not None else None,
+            'queue': [job.status() for job in self.queue],
+            'finished': [job.status() for job in self.finished],
+        }
+        if self.error is not None:
+            status['error'] = self.error
+        return status
+    
+    def _start_next (self):
+        while self.job is None and self.error is None and len(self.queue) != 0:
+            job = self.queue.popleft()
+            try:
+                self.input_file = open(job.file_name, 'rb')
+            except IOError as e:
+                job.result = 'failed: {}'.format(e)
+                self.finished.append(job)
+                continue
+            self.job = job
+            self.sender = littlevent.gcode_sender.GcodeSender(self.serial, self.input_file, self.window_size, self._done_handler)
+            job.sender = self.sender
+            job.start_time = time.time()
+            self.sender.start()
+    
+    def _done_handler (self, err):
+        job = self.job
+        if err is not None:
+            job.result = 'failed: {}'.format(err)
+        elif job.cancelled:
+            job.result = 'cancelled'
+        else:
+            job.result = 'done'
+        self._end_job()
+        if err is not None and not isinstance(err, littlevent.error.Error):
+            self._fail(str(err))
+        else:
+            self.next_lifo_event.push()
+    
+    def _error_handler (self, returned_events):
+        if self.job is not None:
+            self.job.result = 'failed: unexpected event'
+            self._end_job()
+        self._fail('unexpected event')
+    
+    def _end_job (self):
+        if self.job is None:
+            return
+        job = self.job
+        job.end_time = time.time()
+        job.sent_count = self.sender.sent_count
+        job.resent_count = self.sender.resent_count
+        job.error_count = self.sender.error_count
+        job.sender = None
+        self.finished.append(job)
+        self.job = None
+        self.sender.close()
+        self.sender = None
+        self.input_file.close()
+        self.input_file = None
+    
+    def _fail (self, error):
+        print('{}: ERROR: {}'.format(self.name, error))
+        self.error = error
+        self.serial.close()
+        self.serial = None
+        for job in self.queue:
+            job.result = 'failed: printer error'
+            self.finished.append(job)
+        self.queue.clear()
+
+class ControlConnection (littlevent.close.Obj):
+    def __init__ (self, loop, sock, program):
+        self.program = program
+        littlevent.close.Obj.__init__(self)
+        try:
+            self.conn = self.add(littlevent.unix_socket.Connection(loop, sock, self._error_handler))
+            self.conn.read_io().read_set_handler(self._read_handler, buffered=True)
+            self.conn.write_io().write_set_handler(self._write_handler)
+            self.framer = littlevent.framer.LineFramer()
+            self.conn.read_io().read_start(4096)
+        
+        except littlevent.error.Error:
+            self.close()
+            raise
+    
+    def _error_handler (self, returned_events):
+        self.program.remove_connection(self)
+    
+    def _read_handler (self, data, err):
+        if err is not None:
+            return self.program.remove_connection(self)
+        self.conn.read_io().read_start(4096)
+        self.framer.feed(data)
+        try:
+            for line in self.framer.lines():
+                if len(line) != 0:
+                    response = self.program.handle_request(line.tobytes())
+                    self.conn.write_io().write_start((json.dumps(response) + '\n').encode('utf-8'))
+        except littlevent.error.Error as e:
+            return self.program.remove_connection(self)
+    
+    def _write_handler (self, err):
+        if err is not None:
+            return self.program.remove_connection(self)
+
+class Program (littlevent.close.Obj):
+    def __init__ (self):
+        littlevent.close.Obj.__init__ (self)
+        try:
+            parser = argparse.ArgumentParser(description='Send g-code jobs to a number of 3D printers.')
+            parser.add_argument('--socket', required=True, help='Path of the Unix socket for the control API.')
+            parser.add_argument('--printer', nargs=4, action='append', required=True, metavar=('NAME', 'PORT', 'BAUD', 'RECV_BUFFER_SIZE_EXP'), help='Printer to drive, with the serial port device, baud rate and RecvBufferSizeExp from the firmware configuration.')
+            parser.add_argument('--edge-triggered', action='store_true', help='Use edge-triggered epoll.')
+            args = parser.parse_args()
+            
+            self.loop = self.add(littlevent.loop.Loop(edge_triggered=args.edge_triggered))
+            self.connections = set()
+            def close_connections ():
+                for connection in list(self.connections):
+                    connection.close()
+                self.connections.clear()
+            self.add(close_connections)
+            self.printers = collections.OrderedDict()
+            for (name, port, baud, recv_buffer_size_exp) in args.printer:
+                if name in self.printers:
+                    raise littlevent.error.Error('Duplicate printer name {}.'.format(name))
+                try:
+                    baud = int(baud)
+                    window_size = littlevent.gcode_sender.window_for_recv_buffer(int(recv_buffer_size_exp))
+                except ValueError as e:
+                    raise littlevent.error.Error('Printer {}: {}'.format(name, e))
+                self.printers[name] = self.add(Printer(self.loop, name, port, baud, window_size))
+            self.listener = self.add(littlevent.unix_socket.Listener(self.loop, args.socket, self._accept_handler, self._listener_error_handler))
+            self.next_job_id = 1
+            print('Driving {} printers, control socket is {}.'.format(len(self.printers), args.socket))
+        
+        except littlevent.error.Error as e:
+            self.close()
+            print('ERROR: {}'.format(e))
+            sys.exit(1)
+    
+    def _accept_handler (self, sock):
+        try:
+            self.connections.add(ControlConnection(self.loop, sock, self))
+        except littlevent.error.Error as e:
+            print('ERROR: control connection: {}'.format(e))
+    
+    def _listener_error_handler (self, err):
+        print('ERROR: control socket: {}'.format(err))
+        self.loop.quit(1)
+    
+    def remove_connection (self, connection):
+        self.connections.discard(connection)
+        connection.close()
+    
+    def handle_request (self, data):
+        try:
+            try:
+                request = json.loads(data.decode('utf-8'))
+            except ValueError as e:
+                raise littlevent.error.Error('Invalid request: {}'.format(e))
+            if not isinstance(request, dict):
+                raise littlevent.error.Error('Invalid request: not an object')
+            command = request.get('command')
+            if command == 'status':
+                return {'ok': True, 'printers': [printer.status() for printer in self.printers.values()]}
+            printer = self.printers.get(request.get('printer'))
+            if printer is None:
+                raise littlevent.error.Error('Unknown printer {}.'.format(request.get('printer')))
+            if command == 'queue':
+                file_name = request.get('file')
+                if not isinstance(file_name, type(u'')) or not os.path.isabs(file_name):
+                    raise littlevent.error.Error('The file must be given as an absolute path.')
+                if not os.path.isfile(file_name):
+                    raise littlevent.error.Error('No such file {}.'.format(file_name))
+                job = Job(self.next_job_id, file_name)
+                printer.queue_job(job)
+                self.next_job_id += 1
+                return {'ok': True, 'job': job.job_id}
+            if command == 'cancel':
+                printer.cancel_job(request.get('job'))
+                return {'ok': True}
+            raise littlevent.error.Error('Unknown command {}.'.format(command))
+        except littlevent.error.Error as e:
+            return {'ok': False, 'error': str(e)}
+
+p = Program()
+ret = p.loop.run()
+p.close()
+sys.exit(ret)
@@ -0,0 +1,65 @@
+#!/usr/bin/python2.7 -B
+
+from __future__ import print_function
+import sys
+import argparse
+import time
+import littlevent.close
+import littlevent.error
+import littlevent.loop
+import littlevent.serial
+import littlevent.framer
+import littlevent.gcode_sender
+
+class Program (littlevent.close.Obj):
+    def __init__ (self):
+        littlevent.close.Obj.__init__ (self)
+        try:
+            parser = argparse.ArgumentParser(description='Send g-code to a 3D printer, keeping the receive buffer of the firmware filled.')
+            parser.add_argument('--port', required=True, help='Serial port device.')
+            parser.add_argument('--baud', type=int, required=True, help='Baud rate.')
+            parser.add_argument('--input', required=True, help='G-code file to send.')
+            parser.add_argument('--recv-buffer-size-exp', type=int, default=7, help='RecvBufferSizeExp in the firmware configuration (default: 7).')
+            parser.add_argument('--edge-triggered', action='store_true', help='Use edge-triggered epoll.')
+            args = parser.parse_args()
+            self.baud = args.baud
+            
+            try:
+                self.input_file = self.add(open(args.input, 'rb'))
+            except IOError as e:
+                raise littlevent.error.Error(e)
+            self.loop = self.add(littlevent.loop.Loop(edge_triggered=args.edge_triggered))
+            self.serial = self.add(littlevent.serial.Serial(self.loop, args.port, args.baud, self._error_handler))
+            window_size = littlevent.gcode_sender.window_for_recv_buffer(args.recv_buffer_size_exp)
+            self.sender = self.add(littlevent.gcode_sender.GcodeSender(self.serial, self.input_file, window_size, self._done_handler, self._reply_handler))
+            self.sender.start()
+        
+        except littlevent.error.Error as e:
+            self.close()
+            print('ERROR: {}'.format(e))
+            sys.exit(1)
+    
+    def _error_handler (self, returned_events):
+        print('ERROR: unexpected event.')
+        self.loop.quit(1)
+    
+    def _reply_handler (self, event):
+        if type(event) is littlevent.framer.Error:
+            print('Error: {}'.format(event.message.decode('ascii', 'replace')))
+        else:
+            print('Received: >{}<'.format(event.line.decode('ascii', 'replace')))
+    
+    def _done_handler (self, err):
+        if err is not None:
+            print('ERROR: {}'.format(err))
+            return self.loop.quit(1)
+        sender = self.sender
+        total_time = time.time() - sender.start_time
+        print('Sent {} commands ({} resent, {} errors) in {} seconds.'.format(sender.sent_count, sender.resent_count, sender.error_count, total_time))
+        print('Throughput is {:.0f} bytes/s, the baud rate allows {:.0f} bytes/s.'.format(sender.sent_bytes / total_time, self.baud / 10.0))
+        self.loop.quit(0)
+
+p = Program()
+ret = p.loop.run()
+p.close()
+sys.exit(ret)
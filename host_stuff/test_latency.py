@@ -9,6 +9,7 @@ import littlevent.error
 import littlevent.loop
 import littlevent.fd_io
 import littlevent.serial
+import littlevent.framer
 
 class Program (littlevent.close.Obj):
     def __init__ (self):
@@ -18,11 +19,12 @@ class Program (littlevent.close.Obj):
             parser.add_argument('--port', required=True, help='Serial port device.')
             parser.add_argument('--baud', type=int, required=True, help='Baud rate.')
             parser.add_argument('--count', type=int, default=5000, help='Number of commands.')
+            parser.add_argument('--edge-triggered', action='store_true', help='Use edge-triggered epoll.')
             args = parser.parse_args()
             print(args.port)
             print(args.baud)
             
-            self.loop = self.add(littlevent.loop.Loop())
+            self.loop = self.add(littlevent.loop.Loop(edge_triggered=args.edge_triggered))
             self.serial = self.add(littlevent.serial.Serial(self.loop, args.port, args.baud, self._error_handler))
             self.serial.read_io().read_set_handler(self._read_handler)
             self.serial.write_io().write_set_handler(self._write_handler)
@@ -31,7 +33,7 @@ class Program (littlevent.close.Obj):
             self.done_count = 0
             self.writing = False
             self.start_time = time.time()
-            self.frame = ''
+            self.framer = littlevent.framer.ResponseFramer()
             
             self._read()
             self._write()
@@ -50,18 +52,10 @@ class Program (littlevent.close.Obj):
             print('ERROR: read error: {}'.format(err))
             return self._quit()
         self._read()
-        while True:
-            newline_pos = data.find('\n')
-            if newline_pos < 0:
-                self.frame += data
-                return
-            response = self.frame + data[:newline_pos]
-            self.frame = ''
-            data = data[(newline_pos + 1):]
-            if len(response) > 0 and response[-1] == '\r':
-                response = response[:-1]
-            if not response.startswith('ok'):
-                print('Unknown line received: >{}<'.format(response))
+        self.framer.feed(data)
+        for event in self.framer.events():
+            if type(event) is not littlevent.framer.Ok:
+                print('Unknown response received: {}'.format(event))
             else:
                 if self.writing:
                     print('ERROR: early response')
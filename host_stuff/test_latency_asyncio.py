@@ -0,0 +1,59 @@
+#!/usr/bin/python3 -B
+
+# Port of test_latency.py to asyncio, using littlevent.aio. Several ports
+# can be given to test printers concurrently.
+
+import sys
+import argparse
+import asyncio
+import time
+import littlevent.error
+import littlevent.aio
+
+async def test_port (port, baud, count):
+    try:
+        reader, writer = await littlevent.aio.open_serial(port, baud)
+    except littlevent.error.Error as e:
+        print('{}: ERROR: {}'.format(port, e))
+        return False
+    try:
+        done_count = 0
+        start_time = time.time()
+        while done_count < count:
+            writer.write(b'G1\n')
+            while True:
+                try:
+                    line = await reader.readline()
+                except (OSError, ValueError) as e:
+                    print('{}: ERROR: read error: {}'.format(port, e))
+                    return False
+                if not line.endswith(b'\n'):
+                    print('{}: ERROR: read error: EOF encountered.'.format(port))
+                    return False
+                response = line.rstrip(b'\r\n').decode('ascii', 'replace')
+                if response.startswith('ok'):
+                    break
+                print('{}: Unknown line received: >{}<'.format(port, response))
+            done_count += 1
+        total_time = time.time() - start_time
+        print('{}: Done {} requests in {} seconds.'.format(port, done_count, total_time))
+        print('{}: Average request time is {} seconds.'.format(port, total_time / done_count))
+        return True
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+async def run (args):
+    results = await asyncio.gather(*[test_port(port, args.baud, args.count) for port in args.port])
+    return 0 if all(results) else 1
+
+def main ():
+    parser = argparse.ArgumentParser(description='Test 3D printer serial port latency, using asyncio.')
+    parser.add_argument('--port', required=True, nargs='+', help='Serial port devices.')
+    parser.add_argument('--baud', type=int, required=True, help='Baud rate.')
+    parser.add_argument('--count', type=int, default=5000, help='Number of commands.')
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args)))
+
+if __name__ == '__main__':
+    main()
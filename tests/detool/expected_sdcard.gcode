@@ -0,0 +1,1546 @@
+G90
+G92 U0.00000
+G92 E0.00000
+G0 F999999.0
+M190 S60.000000
+M104 T0 S210.000000
+M104 T1 S210.000000
+M109 T0 S210.000000
+G21        
+M82        
+G28 X0 Y0  
+G28 Z0     
+G1 F9000.0 Z15.20000
+G92 U0.00000
+G1 F200.0 U3.00000
+G92 U0.00000
+G1 F9000.0
+M117 Printing...
+G1 X10 Y10 E5
+T1
+M301 H1 PU 
+G92 E0 
+G92 U0.50000 X-5.00000
+G0 Y101.50000 X90.00000 Z0.50000
+G1 F1200.0 Y101.50000 X91.50000 U0.12340
+G1 Y103.00000 X91.50000 U0.24680
+G92 E0.24680
+G0 Y100.00000 X110.00000 Z0.30000
+G1 Y100.00000 X111.00000 E0.50000
+G1 F600.0 X112.00000 E0.60000
+G92 U0.60000
+G0 Y101.50000 X102.00000 Z0.50000 F7200.0
+G0 F600.0
+G1 Y91.50000 X80.00000 U1.00000
+G1 Z1.00000 U0.00000
+G1 Y86.50000 X85.00000
+G92 E0.00000
+G0 Y85.00000 X95.00000 Z0.80000 F7200.0
+G0 F600.0
+G0 F3000.0
+G1 Y50.00000 X50.00000 E2.00000
+G92 U2.00000
+G0 Y51.50000 X40.00000 Z1.20000
+G92 X-10.00000 Y1.50000
+G1 Y2.50000 X-9.00000 U2.50000
+G28 Z0
+G1 Z5.20000
+G28
+G1 Y1.50000 X-10.00000 Z0.50000
+G1 Y2.50000 X-9.00000
+G1 Y102.13300 X86.83500 U0.01099
+G0 F9000.0 Y86.40400 X8.14300
+G1 Y85.29700 X6.63800 U0.07374
+G1 Y87.20200 X6.22500 U0.07839
+G1 Y85.67300 X4.80200 U0.10924
+G0 Y129.28300 X106.32000
+G1 Y127.53400 X106.51100 U0.11520
+G1 Y126.79000 X106.22100 U0.17376
+G1 Y127.58600 X107.39900 U0.19817
+G1 Y128.50400 X108.89900 U0.22696
+G0 Y152.92800 X73.62500
+G0 Y9.34100 X87.79300
+G1 Y9.63400 X88.85100 U0.31451
+G1 Y9.95300 X89.22800 U0.36013
+G1 Y10.61000 X89.12500 U0.36620
+G1 Y11.89700 X91.09700 U0.39466
+G1 Y11.74400 X89.18700 U0.41146
+G0 Y27.36800 X143.64700
+G1 Y28.85400 X143.21000 U0.41952
+G1 Y30.13100 X144.74400 U0.50592
+G1 Y31.66800 X144.17900 U0.60169
+G0 Y48.16700 X36.39100
+G1 Y47.21800 X36.74800 U0.60210
+G1 Y49.03100 X37.01300 U0.67115
+G1 Y47.24700 X37.71800 U0.76110
+G1 Y46.81600 X38.91000 U0.80100
+G1 Y45.08500 X37.15900 U0.82188
+G1 Y43.08600 X35.36900 U0.83700
+G1 Y44.58400 X33.47100 U0.89841
+G1 Y44.04000 X32.86000 U0.91070
+G1 Y43.97600 X32.72400 U0.91928
+G1 F1800.0 Y45.29100 X31.78300 U0.93543
+G1 Y43.87800 X31.89600 U0.98975
+G1 Y45.33100 X33.81000 U1.05937
+G1 Y46.41900 X32.47900 U1.11262
+G1 Y47.66500 X31.37100 U1.21112
+G1 Y48.62400 X32.64400 U1.23379
+G1 Y46.73600 X30.76000 U1.26173
+G1 Y46.52500 X32.58600 U1.35543
+G1 Y45.40700 X32.04500 U1.37812
+G1 Y47.00800 X32.54100 U1.46216
+G1 Y45.34700 X33.73900 U1.52822
+G1 Y45.25900 X34.74000 U1.54607
+G1 Y47.14600 X35.94300 U1.58566
+G1 Y45.82600 X36.84200 U1.59836
+G1 Y44.41000 X38.06800 U1.68101
+G1 Y44.60500 X37.47000 U1.69411
+G1 Y44.71100 X38.06900 U1.78747
+G1 Y43.55600 X39.37300 U1.81266
+G1 Y42.59300 X39.71900 U1.85456
+G1 Y42.42600 X39.13400 U1.91289
+G1 Y42.43200 X40.80500 U1.96608
+G0 F9000.0 Y161.33400 X-9.21400
+G0 Y146.53900 X84.69900
+G1 Y146.61200 X84.00300 U2.02162
+G0 Y51.19900 X102.05900
+G1 Y51.23000 X103.14800 U2.07779
+G1 Y51.68000 X102.92100 U2.12835
+G1 Y51.81300 X102.73100 U2.17615
+G1 Y53.58200 X104.23700 U2.20211
+G1 Y52.13000 X105.59700 U2.21427
+G0 Y16.12400 X38.12800
+G1 Y17.71200 X39.26300 U2.22972
+G1 Y19.24400 X37.83500 U2.32647
+G1 Y19.19300 X37.42800 U2.42546
+G0 Y104.62100 X76.30400
+G1 F1800.0 Y103.89500 X75.08700 U2.49767
+G1 Y101.96700 X74.84900 U2.53082
+G1 Y103.90800 X73.10600 U2.60966
+G0 F9000.0 Y9.41800 X43.11300
+G1 Y7.93600 X42.19500 U2.65189
+G1 Y6.53300 X41.22900 U2.74380
+G1 Y4.76300 X39.58700 U2.81262
+G0 Y128.38800 X177.67000
+G1 Y129.81300 X176.00500 U2.81929
+G1 Y130.02500 X175.36200 U2.91195
+G0 Y49.18700 X95.38300
+G0 Y11.57600 X22.29000
+G1 Y10.79600 X21.53800 U2.98790
+G1 Y10.18400 X20.24900 U2.98972
+G1 Y10.08300 X19.00700 U3.08318
+G1 Y10.06300 X18.73600 U3.16664
+G1 Y11.99300 X19.48700 U3.20092
+G1 F1800.0 Y11.61200 X20.03100 U3.23567
+G0 F9000.0 Y149.67800 X4.14500
+G1 Y148.01600 X2.79800 U3.31980
+G1 Y146.98500 X1.92500 U3.34910
+G0 Y54.14900 X79.16500
+G1 Y54.33700 X81.05500 U3.37355
+G1 Y52.34100 X80.48200 U3.41171
+G1 Y52.36000 X79.28600 U3.41221
+G0 Y9.83300 X69.90200
+G0 Y48.06200 X50.84900
+G1 Y49.06400 X50.96600 U3.47796
+G1 Y48.36900 X50.52400 U3.57643
+G1 Y46.54400 X51.09700 U3.65996
+G1 Y47.79300 X52.03200 U3.67389
+G1 Y49.01100 X53.37200 U3.75653
+G1 F1800.0 Y49.78500 X54.10300 U3.77953
+G0 F9000.0 Y22.48300 X62.14100
+G1 Y22.99400 X62.37600 U3.84215
+G1 Y24.18500 X60.38900 U3.91698
+G1 Y22.44900 X61.02600 U3.99066
+G0 Y147.36700 X43.11200
+G1 Y149.27000 X44.07100 U4.04005
+G1 Y150.33800 X44.80600 U4.10175
+G0 Y52.28800 X19.48500
+G1 F1800.0 Y52.55900 X18.70300 U4.10299
+G1 Y53.32800 X19.39100 U4.17057
+G1 Y53.19300 X19.24900 U4.18242
+G0 F9000.0 Y188.75100 X185.62500
+G1 Y188.54900 X187.49800 U4.20928
+G1 Y188.87500 X186.34000 U4.22346
+G1 Y190.15500 X184.87100 U4.27433
+G1 F1800.0 Y191.74600 X183.79600 U4.32294
+G0 Z0.60000
+G1 Y190.95400 X183.59900 U4.33701
+G1 Y188.96100 X184.96000 U4.41209
+G0 F9000.0 Y144.10500 X175.28000
+G1 Y143.59400 X174.43900 U4.45138
+G1 F1800.0 Y143.30600 X173.88200 U4.47889
+G0 F9000.0 Y58.62500 X156.93500
+G1 Y57.68800 X155.93200 U4.52999
+G1 Y59.22500 X157.75700 U4.61119
+G1 F1800.0 Y59.42200 X159.52000 U4.68314
+G1 Y60.43200 X159.32300 U4.74759
+G0 F9000.0 Y26.96200 X175.35500
+G1 Y26.15300 X174.73000 U4.82150
+G1 Y25.35700 X175.35400 U4.87723
+G0 Y43.07500 X22.33100
+G1 Y41.95500 X22.32000 U4.96785
+G1 Y40.72400 X20.87800 U4.97693
+G0 Y53.17200 X37.82500
+G1 Y54.17000 X39.37400 U5.01820
+G1 Y53.52300 X38.88200 U5.02441
+G1 Y53.53700 X37.38500 U5.08737
+G1 Y52.53000 X36.46900 U5.12735
+G1 F1800.0 Y54.02200 X37.86400 U5.12953
+G1 Y53.91500 X39.44700 U5.18825
+G1 Y55.21700 X41.15400 U5.27379
+G1 Y53.83500 X39.59000 U5.32603
+G1 Y54.42400 X40.47700 U5.40251
+G1 Y55.55300 X38.63600 U5.42577
+G1 Y54.06500 X37.85100 U5.45095
+G1 Y52.34700 X36.29900 U5.50339
+G1 Y52.75100 X35.19300 U5.50444
+G1 Y53.32900 X37.02900 U5.59281
+G1 Y55.17200 X36.01700 U5.66328
+G1 Y54.85200 X36.71500 U5.68900
+G1 Y52.98800 X35.62200 U5.72281
+G1 Y54.17600 X34.41500 U5.79672
+G1 Y53.42300 X36.29400 U5.87872
+G1 Y52.60300 X37.33600 U5.97392
+G0 F9000.0 Y84.90600 X34.66500
+G1 Y83.49100 X36.46000 U6.01326
+G1 Y81.69900 X35.02800 U6.01928
+G1 Y82.63000 X36.56200 U6.11903
+G1 F1800.0 Y84.37300 X35.30400 U6.19366
+G1 Y83.86900 X34.81800 U6.22683
+G0 Z0.70000
+G1 Y85.69100 X34.22400 U6.23920
+G1 Y86.97700 X33.65100 U6.32140
+G0 F9000.0 Y76.04300 X84.69300
+G1 F1800.0 Y75.50000 X83.46500 U6.41110
+G1 Y76.56700 X84.71200 U6.41516
+G0 F9000.0 Y52.90300 X174.01500
+G1 Y52.25900 X175.61000 U6.44240
+G1 Y53.12600 X174.65800 U6.47404
+G0 Z0.80000
+G1 F1800.0 Y53.66200 X176.32400 U6.56837
+G1 Y55.48900 X176.22500 U6.66376
+G1 Y55.46300 X175.94500 U6.75657
+G1 Y56.75400 X176.89900 U6.83385
+G1 Y56.20100 X176.17700 U6.91208
+G0 F9000.0 Y50.96200 X140.57700
+G0 Y112.01900 X-3.22700
+G1 Y113.55300 X-1.30600 U7.01086
+G0 Y101.19500 X9.28500
+G1 Y100.13200 X9.07200 U7.05254
+G1 Y101.52000 X10.06400 U7.11899
+G1 Y101.78700 X9.23900 U7.15628
+G0 Y50.56800 X39.48600
+G0 Y117.15600 X166.83400
+G1 Y119.12600 X166.41800 U7.20701
+G1 Y121.09000 X167.03100 U7.21725
+G1 Y122.74700 X168.39300 U7.22128
+G0 Y196.09300 X27.91500
+G1 Y195.58200 X29.63500 U7.30790
+G1 Y197.36500 X30.74600 U7.31848
+G1 Y196.84000 X29.61700 U7.33261
+G1 F1800.0 Y197.44600 X30.01500 U7.35296
+G1 Y196.18700 X30.72800 U7.38418
+G1 Y194.44000 X30.92000 U7.39431
+G1 Y192.80400 X31.47700 U7.41068
+G1 Y192.03500 X30.61000 U7.50600
+G1 Y191.70100 X30.03900 U7.59243
+G1 Y192.61300 X28.82800 U7.61279
+G1 Y193.89400 X28.52300 U7.65342
+G1 Y191.95400 X27.17300 U7.70857
+G1 Y192.44200 X25.52900 U7.74565
+G0 F9000.0 Y105.73200 X46.65900
+G1 Y105.69400 X45.09400 U7.82614
+G0 Y190.11500 X15.33000
+G1 Y188.32900 X15.26100 U7.91875
+G1 Y189.62700 X15.74200 U7.93478
+G1 Y191.01200 X15.36000 U8.01770
+G1 Y191.08400 X14.95900 U8.05606
+G1 Y192.67300 X15.85900 U8.06017
+G1 Y194.02600 X14.01100 U8.07194
+G1 Y193.25100 X14.52000 U8.11395
+G1 F1800.0 Y193.03800 X15.15500 U8.15778
+G1 Y191.97900 X15.11300 U8.23414
+G1 Y191.87200 X13.83100 U8.24485
+G1 Y191.64000 X12.19800 U8.29586
+G1 Y192.57400 X10.52700 U8.37363
+G0 F9000.0 Y77.07300 X90.78500
+G1 Y78.50100 X89.33000 U8.47324
+G1 Y80.42800 X88.10400 U8.52243
+G1 F1800.0 Y81.58100 X86.76500 U8.61548
+G1 Y80.21600 X87.79000 U8.70514
+G1 Y80.22500 X86.36400 U8.79713
+G1 Y79.50100 X86.38800 U8.80081
+G0 F9000.0 Y137.43600 X177.28100
+G1 Y138.57500 X175.95600 U8.81232
+G1 Y140.06700 X175.39500 U8.86784
+G1 Y142.03900 X173.81300 U8.93082
+G1 Y144.00100 X172.87200 U8.98855
+G1 F1800.0 Y142.70800 X172.64100 U9.06291
+G1 Y143.26500 X171.65600 U9.16132
+G1 Y141.27200 X170.90700 U9.16470
+G1 Y141.32300 X170.63600 U9.25425
+G1 Y139.41200 X171.24800 U9.25451
+G0 F9000.0 Y46.35200 X61.43000
+G1 Y45.16900 X61.78700 U9.31690
+G0 Y50.21800 X177.31800
+G0 Y129.14200 X9.16100
+G1 F1800.0 Y128.75000 X10.29000 U9.34333
+G1 Y128.15100 X10.53900 U9.40789
+G1 Y127.14500 X11.47300 U9.49824
+G1 Y126.09600 X11.09700 U9.50408
+G92 E9.50408
+G0 Y124.59600 X21.09700 Z0.60000 F7200.0
+G0 F1800.0
+G1 Y123.39400 X19.66600 E9.56489
+G1 Y122.09200 X20.92000 E9.59582
+G0 F9000.0 Y156.59500 X177.87000
+G1 Y157.97300 X175.89600 E9.67034
+G1 Y156.87600 X175.70600 E9.68087
+G0 Y149.93100 X67.10300
+G1 Y150.77800 X68.48500 E9.70747
+G1 Y150.87100 X69.63800 E9.73400
+G1 Y152.39100 X68.50600 E9.73552
+G1 Y154.17000 X69.48200 E9.81014
+G1 Y153.12600 X68.79600 E9.90089
+G1 Y155.04200 X69.45700 E9.94784
+G1 Y154.79100 X70.88700 E10.02031
+G1 Y155.28200 X69.73500 E10.02809
+G0 Y21.33600 X5.38100
+G1 F1800.0 Y19.90300 X4.76000 E10.03096
+G1 Y20.69100 X5.29500 E10.10464
+G1 Y21.96100 X4.74900 E10.18659
+G0 F9000.0 Y182.88200 X173.55800
+G1 F1800.0 Y181.70500 X171.98700 E10.19779
+G1 Y182.24100 X173.23500 E10.28030
+G1 Y180.63300 X171.63500 E10.35603
+G1 Y178.71600 X171.33000 E10.38170
+G1 Y178.00000 X170.80200 E10.47810
+G1 Y176.12400 X171.27500 E10.51940
+G1 Y176.94200 X170.66200 E10.57318
+G1 Y178.22200 X169.02500 E10.59022
+G1 Y180.13300 X170.07400 E10.59066
+G1 Y178.87100 X171.26100 E10.64011
+G1 Y180.64700 X170.30400 E10.66849
+G1 Y179.08600 X170.29700 E10.73214
+G1 Y180.23400 X171.08500 E10.79493
+G1 Y181.79600 X170.66400 E10.80355
+G0 F9000.0 Y52.63900 X41.22300
+G1 Y52.15600 X41.22800 E10.89195
+G1 Y53.17400 X41.35400 E10.96725
+G1 Y51.79600 X40.66100 E11.05156
+G1 Y51.55100 X39.33900 E11.12890
+G0 Y177.02500 X92.40400
+G1 Y176.23100 X91.17000 E11.19922
+G0 Y49.51600 X31.19700
+G1 Y48.16000 X31.28600 E11.23203
+G1 Y46.56700 X32.20100 E11.32826
+G1 Y47.74700 X34.13600 E11.40159
+G0 Y21.37400 X127.59600
+G1 Y19.51000 X127.15000 E11.44150
+G1 Y20.03900 X127.15100 E11.48782
+G1 Y21.00300 X126.77000 E11.57862
+G1 Y20.68800 X127.76700 E11.60148
+G1 Y21.48800 X128.86300 E11.68673
+G1 F1800.0 Y20.74000 X128.67900 E11.74955
+G1 Y21.59300 X129.80800 E11.81251
+G1 Y22.07900 X129.62900 E11.85345
+G1 Y22.69700 X128.36100 E11.93127
+G1 Y20.84900 X130.26000 E11.98560
+G1 Y20.92600 X132.02200 E11.99571
+G1 Y20.97500 X132.89100 E12.05964
+G1 Y22.76700 X132.53200 E12.08065
+G1 Y21.25600 X133.58300 E12.17909
+G0 F9000.0 Y79.93700 X54.87100
+G92 U12.17909
+G0 Y81.43700 X44.87100 Z0.80000 F7200.0
+G0 F9000.0
+G1 Y80.84500 X45.66400 U12.20561
+G1 Y80.95400 X47.42400 U12.22750
+G1 Y79.47100 X46.27200 U12.30516
+G1 Y79.71900 X46.14900 U12.32776
+G1 Y80.99400 X46.70400 U12.40938
+G1 Y79.49500 X46.89700 U12.49275
+G1 Y78.99900 X45.96700 U12.51811
+G0 Y145.85800 X-9.46100
+G1 Y145.06500 X-10.48100 U12.56606
+G1 Y144.51500 X-9.84400 U12.65894
+G0 Y182.66100 X155.58000
+G1 F1800.0 Y183.98700 X154.14200 U12.72225
+G92 E12.72225
+G0 Y182.48700 X164.14200 Z0.60000 F7200.0
+G0 F1800.0
+G1 Y180.89300 X163.14200 E12.73652
+G1 Y179.50300 X162.52700 E12.82693
+G0 F9000.0 Y121.67300 X178.22700
+G1 Y123.24900 X178.90100 E12.90574
+G0 Y106.15900 X138.55900
+G1 Y107.69000 X138.31300 E12.96125
+G1 Y107.66200 X136.87000 E12.96709
+G0 Y99.63500 X98.27400
+G1 Y97.66200 X99.72600 E13.05117
+G1 Y99.02400 X100.38700 E13.08867
+G1 F1800.0 Y99.57200 X98.68900 E13.15228
+G1 Y101.29800 X99.41900 E13.18532
+G1 Y102.88800 X99.35800 E13.18871
+G1 Y104.33500 X98.71200 E13.22533
+G1 Y103.17800 X99.79500 E13.26885
+G1 Y102.34900 X101.10100 E13.35162
+G1 Y102.37500 X100.18800 E13.44912
+G1 Y101.64300 X99.51200 E13.47904
+G1 Y99.80400 X100.64900 E13.55131
+G1 Y99.00500 X98.84700 E13.55193
+G1 Y99.63700 X99.28200 E13.63083
+G1 Y100.14500 X99.74900 E13.70047
+G1 Y100.81300 X98.59900 E13.74626
+G0 F9000.0 Y7.39600 X36.26000
+G1 Y8.01800 X37.91600 E13.78315
+G1 Y7.05000 X38.16400 E13.81335
+G1 F1800.0 Y7.61700 X37.88700 E13.90674
+G1 Y6.09300 X36.04500 E13.98777
+G1 Y4.14900 X35.83000 E14.02649
+G1 Y4.05100 X37.75400 E14.06773
+G1 Y2.65800 X36.60300 E14.06928
+G1 Y4.52400 X35.08900 E14.07810
+G0 F9000.0 Y143.87000 X3.55500
+G1 Y142.62000 X4.49000 E14.08311
+G1 Y143.53900 X5.91200 E14.09154
+G1 Y145.26800 X5.75400 E14.11694
+G1 Y143.32700 X3.80000 E14.18201
+G0 Y145.88800 X62.21300
+G0 Y97.26600 X172.19400
+G0 Y114.99300 X73.51300
+G1 Y113.57200 X74.22100 E14.26175
+G1 Y113.24400 X74.73900 E14.30032
+G1 F1800.0 Y113.51100 X75.87800 E14.32956
+G1 Y114.82100 X76.69100 E14.36277
+G1 Y115.22600 X78.01600 E14.39363
+G1 Y115.96500 X77.52300 E14.45380
+G1 Y113.97200 X76.65600 E14.48011
+G1 Y115.52100 X77.92000 E14.48434
+G1 Y115.80900 X79.38900 E14.51172
+G1 Y117.46400 X80.12700 E14.54641
+G1 Y116.26600 X81.31700 E14.62143
+G1 Y116.97600 X81.74500 E14.66796
+G1 Y118.14300 X82.74900 E14.71393
+G1 Y117.07400 X83.83800 E14.77189
+G1 Y116.98100 X83.92500 E14.83082
+G0 F9000.0 Y140.21300 X36.13900
+G1 Y139.82300 X36.39600 E14.88254
+G0 Y74.80800 X199.42800
+G0 Y157.47000 X126.54800
+G0 Y68.98400 X119.44200
+G1 Y67.11900 X117.52500 E14.98158
+G1 Y66.16500 X117.79300 E15.05950
+G1 Y67.44000 X118.86200 E15.15585
+G0 Y36.14700 X40.19800
+G0 Y111.47600 X10.20000
+G1 F1800.0 Y113.26500 X10.03300 E15.24684
+G1 Y111.74500 X9.62200 E15.34277
+G1 Y113.57000 X10.18500 E15.40974
+G1 Y115.43300 X8.82400 E15.50892
+G0 F9000.0 Y70.40200 X51.17200
+G1 Y71.75100 X52.79100 E15.51362
+G1 Y73.69300 X53.37700 E15.51920
+G1 Y74.40000 X55.13500 E15.54908
+G1 Y73.69600 X53.55700 E15.57478
+G1 Y72.65000 X52.23100 E15.58909
+G0 Y185.53600 X7.20300
+G1 Y187.00300 X8.93800 E15.67796
+G1 Y188.71800 X7.32600 E15.76219
+G1 Y190.01000 X6.68500 E15.80994
+G0 Y11.34500 X44.33000
+G1 Y9.92400 X44.54400 E15.89701
+G1 Y9.00900 X43.16600 E15.98097
+G0 Y63.61300 X98.20100
+G1 Y65.52800 X96.65800 E15.98666
+G1 Y65.43800 X95.50300 E16.01528
+G1 Y67.40200 X94.96000 E16.11509
+G0 Y179.24000 X57.88600
+G0 Y58.70500 X145.29500
+G1 Y59.93300 X143.35900 E16.14918
+G0 Z0.70000
+G1 Y58.67600 X143.46500 E16.19270
+G1 Y57.22900 X143.75000 E16.21072
+G1 Y55.54600 X142.53700 E16.21946
+G1 Y54.37000 X141.63300 E16.28070
+G1 Y53.17900 X141.96500 E16.28727
+G1 Y51.40000 X142.85100 E16.36834
+G1 Y51.37200 X144.30900 E16.36988
+G1 Y50.43800 X145.79700 E16.38849
+G1 F1800.0 Y49.92200 X144.45100 E16.44797
+G1 Y49.98500 X144.23400 E16.46005
+G1 Y49.26900 X145.69600 E16.53117
+G1 Y50.76000 X143.94100 E16.62658
+G1 Y50.90900 X144.06300 E16.62864
+G1 Y49.32000 X142.79300 E16.65369
+G0 F9000.0 Y139.79300 X19.29400
+G0 Y119.88000 X3.53700
+G1 Y120.69000 X3.62900 E16.66398
+G1 Y119.18200 X1.81000 E16.71334
+G1 Y118.80500 X0.29800 E16.72703
+G1 Y119.09600 X-1.11300 E16.80169
+G1 Y118.65100 X0.63700 E16.84374
+G1 Y120.41700 X0.22000 E16.92143
+G1 Y120.15900 X-0.44000 E17.01955
+G1 Y121.54900 X0.82000 E17.02491
+G1 Y120.54700 X2.55800 E17.06712
+G1 Y118.82400 X2.68100 E17.11042
+G0 Y155.31600 X193.93900
+G1 Y156.55300 X194.47200 E17.19886
+G0 Y53.15400 X128.31500
+G1 Y53.32300 X127.40900 E17.29130
+G1 Y53.05800 X127.49000 E17.38639
+G1 Y51.54000 X128.08000 E17.44581
+G1 Y51.40500 X127.15400 E17.49920
+G0 Y58.72000 X26.27400
+G1 Y57.69300 X25.42700 E17.50798
+G1 Y57.97400 X25.86700 E17.57302
+G1 Y58.16600 X25.71000 E17.63430
+G1 Y57.05300 X24.67900 E17.68554
+G1 Y56.46300 X22.72700 E17.77173
+G1 Y55.60300 X22.69300 E17.87048
+G1 Y53.87000 X21.32700 E17.95761
+G0 Y87.97900 X77.57700
+G1 Y86.88000 X76.01400 E18.05354
+G0 Y70.49100 X67.40300
+G1 Y71.89100 X67.86800 E18.13566
+G1 Y72.93000 X68.84100 E18.18318
+G1 F1800.0 Y71.43900 X70.50000 E18.27026
+G1 Y71.43000 X70.84400 E18.36654
+G1 Y72.92100 X71.97800 E18.42727
+G1 Y73.81300 X71.81000 E18.45656
+G1 Y73.10100 X71.34800 E18.53527
+G1 Y71.83800 X71.12400 E18.56567
+G1 Y70.19000 X71.45000 E18.65769
+G1 Y72.02500 X72.80300 E18.67812
+G1 Y70.21500 X70.84600 E18.73462
+G1 Y70.36900 X71.94000 E18.83445
+G1 Y69.92700 X72.68100 E18.87022
+G1 Y70.63300 X74.47200 E18.92274
+G1 Y70.87800 X74.07600 E18.98015
+G1 Y70.63900 X74.02300 E19.04261
+G1 Y71.90200 X74.14300 E19.05968
+G1 Y71.95300 X75.44700 E19.07073
+G1 Y73.91400 X76.73000 E19.15955
+G0 F9000.0 Y102.32100 X57.98500
+G1 Y101.05100 X56.73800 E19.22256
+G1 Y101.59700 X58.71300 E19.22679
+G1 Y102.36000 X57.94000 E19.22718
+G1 Y103.03200 X58.28400 E19.24685
+G1 Y103.61900 X57.34900 E19.29999
+G1 Y102.10500 X56.99300 E19.31567
+G0 Y34.10700 X20.02100
+G1 F1800.0 Y34.55900 X21.31300 E19.39633
+G1 Y33.97500 X22.17500 E19.41327
+G0 F9000.0 Y116.45200 X180.77100
+G1 Y115.99400 X180.57000 E19.41874
+G1 Y115.75300 X182.40900 E19.48076
+G0 Y170.94300 X186.16500
+G1 Y172.20700 X187.76000 E19.51113
+G1 Y174.00600 X187.74200 E19.53542
+G1 Y173.24200 X186.62800 E19.62295
+G1 Y171.93600 X185.60100 E19.65879
+G1 Y172.18200 X184.76400 E19.67028
+G1 Y170.44400 X184.37700 E19.68261
+G1 Y169.20900 X183.35700 E19.71097
+G0 Y68.28400 X132.85500
+G0 Y18.52600 X141.17400
+G1 Y17.03700 X142.51400 E19.75530
+G1 Y16.44900 X141.15100 E19.82754
+G1 Y18.25300 X139.98300 E19.87803
+G1 Y19.07900 X138.50700 E19.90410
+G1 Y18.06400 X137.97900 E19.96492
+G1 Y18.11600 X136.47000 E20.01918
+G1 Y18.74600 X136.01000 E20.07595
+G1 Y17.45400 X134.35400 E20.16105
+G1 Y17.70200 X132.79000 E20.19720
+G1 Y16.94700 X131.05300 E20.21984
+G1 Y16.56100 X130.18300 E20.31073
+G1 F1800.0 Y15.08900 X131.62800 E20.33839
+G1 Y14.49500 X132.28200 E20.37964
+G1 Y15.88200 X131.27600 E20.41485
+G0 F9000.0 Y182.53700 X23.04600
+G1 Y180.69900 X23.89700 E20.41885
+G0 Y76.14800 X60.61500
+G0 Y127.66300 X62.18300
+G0 Y114.03300 X167.89300
+G1 Y113.77300 X166.91200 E20.48729
+G0 Z0.80000
+G1 Y112.91800 X168.01800 E20.49158
+G1 Y111.89600 X166.20700 E20.50270
+G1 Y112.89400 X167.86500 E20.51131
+G1 F1800.0 Y114.20900 X168.85500 E20.53943
+G1 Y115.93000 X168.55100 E20.60859
+G1 Y115.74100 X169.06400 E20.61402
+G1 Y117.45300 X169.11100 E20.62679
+G0 F9000.0 Y161.14700 X140.54800
+G1 Y163.02400 X140.73400 E20.69054
+G1 Y162.45600 X138.97100 E20.73170
+G1 Y163.28400 X137.51700 E20.79874
+G1 Y163.06400 X137.57900 E20.89232
+G1 Y161.63100 X139.11800 E20.94865
+G1 Y162.67300 X139.31100 E20.96557
+G1 Y163.73800 X139.15500 E21.04869
+G1 Y162.56400 X138.59700 E21.05472
+G0 Y89.60400 X140.32500
+G0 Y93.73200 X64.89400
+G1 Y92.01900 X63.56700 E21.05580
+G1 Y92.88800 X61.90200 E21.15382
+G0 Y86.84800 X97.77500
+G0 Y1.66000 X108.61400
+G1 Y2.17100 X109.19200 E21.24735
+G1 Y0.72600 X108.17600 E21.25011
+G1 Y-0.53100 X107.36200 E21.31392
+G1 Y0.60700 X106.03500 E21.39696
+G1 Y1.90900 X104.77400 E21.42898
+G1 F1800.0 Y3.23400 X104.25100 E21.45292
+G1 Y4.51300 X104.76400 E21.52347
+G1 Y4.51100 X104.74100 E21.53922
+G1 Y5.26300 X103.06200 E21.55559
+G1 Y3.42300 X101.42100 E21.59954
+G1 Y4.78600 X99.43200 E21.68507
+G1 Y5.43300 X98.56500 E21.73653
+G1 Y6.09700 X98.32000 E21.81914
+G0 F9000.0 Y88.63100 X59.14800
+G1 Y87.41300 X58.54000 E21.82764
+G1 Y89.04800 X60.42600 E21.91419
+G1 Y90.29200 X60.90500 E21.92019
+G1 Y90.57700 X60.09300 E22.01547
+G1 F1800.0 Y89.95000 X59.29100 E22.10398
+G0 F9000.0 Y89.46900 X135.73700
+G0 Y74.40200 X132.09600
+G1 Y74.52200 X131.76200 E22.16046
+G0 Y177.99900 X36.10000
+G1 F1800.0 Y179.44700 X34.54900 E22.18581
+G1 Y179.40400 X33.55600 E22.24121
+G1 Y179.45700 X32.00800 E22.30006
+G1 Y179.21500 X30.30200 E22.38640
+G1 Y177.67400 X31.32900 E22.48547
+G0 F9000.0 Y78.39300 X166.04200
+G0 Y112.60700 X192.00700
+G1 Y113.71100 X190.55400 E22.49122
+G1 Y114.08900 X188.61500 E22.51254
+G1 Y115.64300 X188.31800 E22.57465
+G1 Y117.12600 X189.98800 E22.59146
+G1 Y117.84800 X191.04300 E22.67402
+G1 F1800.0 Y119.64000 X191.99200 E22.74620
+G1 Y119.83600 X190.39100 E22.82650
+G1 Y118.85400 X191.09100 E22.84581
+G1 Y117.30800 X191.41700 E22.84791
+G1 Y117.52500 X190.15800 E22.87691
+G1 Y119.02700 X188.73500 E22.93076
+G1 Y117.08200 X190.53000 E22.96499
+G1 Y118.28400 X192.02200 E22.96854
+G1 Y117.85400 X192.74000 E23.01611
+G1 Y119.34600 X192.31400 E23.07720
+G1 Y120.92200 X191.17900 E23.13612
+G0 F9000.0 Y93.55200 X72.19700
+G1 Y92.96700 X71.74900 E23.13672
+G1 F1800.0 Y92.80400 X69.83100 E23.23536
+G0 F9000.0 Y54.53300 X134.19500
+G1 Y53.58200 X134.19500 E23.29226
+G1 Y51.71800 X136.16400 E23.34832
+G1 Y52.25000 X137.26100 E23.41178
+G1 Y53.74200 X138.44200 E23.50565
+G1 Y54.70000 X139.49500 E23.55654
+G1 Y54.32400 X139.69800 E23.56258
+G1 Y54.25000 X141.65200 E23.59931
+G1 Y52.79200 X141.04900 E23.60003
+G1 Y53.06700 X140.83100 E23.63027
+G0 Y61.69900 X60.29800
+G1 Y63.44900 X60.50300 E23.66432
+G1 Y62.16400 X58.82300 E23.72237
+G1 F1800.0 Y61.87700 X59.92100 E23.80920
+G1 Y60.98100 X61.51700 E23.83495
+G0 F9000.0 Y140.87900 X53.61000
+G1 Y139.68000 X53.20900 E23.89524
+G1 Y140.61600 X51.99500 E23.99156
+G0 Y175.10300 X161.89400
+G1 Y173.85600 X160.44100 E24.04525
+G1 Y172.70500 X162.13200 E24.07793
+G1 F1800.0 Y173.42100 X161.75400 E24.11170
+G1 Y173.92600 X159.93500 E24.14516
+G1 Y173.77900 X158.96300 E24.14652
+G1 Y172.00400 X160.91400 E24.20791
+G1 Y170.62800 X159.28700 E24.22218
+G0 F9000.0 Y84.64600 X162.80300
+G1 Y84.86600 X163.15700 E24.28791
+G1 Y83.89800 X164.12200 E24.35906
+G1 Y84.98800 X163.35900 E24.45680
+G1 F1800.0 Y86.75200 X163.45200 E24.46998
+G1 Y87.84800 X164.07300 E24.50623
+G1 Y86.20800 X165.10000 E24.50903
+G0 F9000.0 Y111.05000 X100.37000
+G0 Y73.12200 X187.94900
+G0 Y147.54900 X35.48600
+G1 Y145.66600 X34.13400 E24.58684
+G1 Y146.21000 X34.13000 E24.62126
+G1 Y147.82400 X33.42500 E24.63204
+G0 Y80.37100 X129.09200
+G1 Y80.62800 X127.33200 E24.67303
+G1 Y79.52400 X127.84000 E24.69823
+G1 Y78.33700 X126.76600 E24.77414
+G1 Y77.20300 X128.74300 E24.83110
+G1 Y76.27200 X130.22000 E24.90625
+G1 Y76.21400 X129.54600 E24.99535
+G1 Y76.02700 X129.93700 E25.05327
+G1 Y75.46800 X131.47100 E25.13125
+G0 Y198.96500 X172.79300
+G1 F1800.0 Y197.41100 X170.89100 E25.22868
+G1 Y198.35500 X169.49400 E25.23844
+G1 Y197.71300 X167.85500 E25.33029
+G1 Y195.84500 X169.77400 E25.35375
+G1 Y195.86400 X167.92500 E25.37691
+G0 F9000.0 Y198.15600 X3.98700
+G1 Y196.63800 X5.50100 E25.42565
+G1 Y197.37900 X4.21700 E25.44044
+G1 Y196.79400 X2.66700 E25.49007
+G1 Y198.66400 X1.52700 E25.57838
+G1 F1800.0 Y197.72200 X0.23600 E25.58528
+G1 Y197.94900 X-0.13100 E25.62154
+G1 Y198.12500 X0.48100 E25.67642
+G1 Y198.99600 X1.97700 E25.71635
+G1 Y198.54400 X3.86900 E25.75489
+G0 F9000.0 Y1.05000 X199.67100
+G1 Y0.06900 X201.37600 E25.81598
+G1 Y-1.46600 X200.17000 E25.90028
+G1 Y-0.69000 X198.36800 E25.93272
+G1 Y1.19700 X197.63000 E25.93282
+G1 Y1.56600 X197.67100 E26.03229
+G1 Y1.08100 X198.64400 E26.10351
+G1 Y1.79000 X199.09500 E26.13572
+G1 Y2.24000 X197.98800 E26.16221
+G1 Y2.32800 X198.87500 E26.20988
+G0 Y105.75000 X185.46600
+G1 Y107.00300 X185.57600 E26.23374
+G1 Y107.56500 X185.41700 E26.31648
+G1 Y107.09100 X183.59000 E26.39970
+G0 Y50.29600 X30.76900
+G0 Y160.64300 X71.32900
+G1 Y158.99500 X71.14100 E26.43925
+G1 Y158.90800 X70.93800 E26.51908
+G0 Y73.38500 X136.03600
+G1 Y72.86800 X134.98700 E26.55309
+G1 Y71.58200 X133.21700 E26.62491
+G1 Y72.91800 X132.18500 E26.63404
+G1 Y72.61100 X130.99200 E26.71327
+G1 Y72.38100 X129.16700 E26.74999
+G1 Y72.97400 X128.79900 E26.83107
+G1 Y74.67300 X129.11400 E26.85023
+G1 F1800.0 Y75.33600 X128.60300 E26.88318
+G1 Y75.43900 X128.12100 E26.93284
+G1 Y75.81000 X126.22300 E26.97909
+G1 Y75.70400 X125.88300 E27.06813
+G1 Y77.00300 X125.93000 E27.13516
+G1 Y77.72200 X124.09200 E27.19055
+G1 Y76.60500 X122.56500 E27.19826
+G0 F9000.0 Y150.66200 X17.65000
+G1 Y151.38600 X15.87000 E27.26937
+G0 Y83.58500 X138.20300
+G1 Y84.85200 X140.19500 E27.35656
+G1 Y82.87600 X140.26800 E27.45543
+G1 Y81.89600 X139.52000 E27.54132
+G1 Y80.10100 X139.20100 E27.57177
+G1 F1800.0 Y79.12900 X140.62800 E27.59197
+G1 Y78.98600 X140.12300 E27.64087
+G1 Y77.78700 X141.32900 E27.73280
+G0 F9000.0 Y106.61600 X62.85300
+G1 Y105.91000 X63.11300 E27.76016
+G1 Y107.12000 X63.95500 E27.81937
+G1 Y108.63200 X63.73500 E27.82514
+G1 Y110.08300 X61.93100 E27.83233
+G0 Y112.21200 X184.48000
+G1 Y112.90700 X184.47300 E27.89983
+G1 Y111.49000 X185.82600 E27.99162
+G0 Y156.85100 X19.04700
+G1 Y157.48600 X18.70600 E28.01737
+G1 F1800.0 Y155.71300 X17.32500 E28.08695
+G1 Y154.64300 X16.50000 E28.14515
+G1 Y156.29100 X15.11600 E28.17759
+G0 F9000.0 Y196.02000 X159.87400
+G1 Y195.53900 X158.00600 E28.24167
+G1 Y195.39700 X156.38100 E28.31449
+G1 Y196.71100 X154.83800 E28.32671
+G1 Y196.81700 X156.59600 E28.35578
+G1 Y198.53600 X156.58200 E28.36508
+G1 Y198.69900 X156.97300 E28.37392
+G1 Y200.08000 X158.54500 E28.39664
+G0 Y193.47100 X119.75900
+G1 Y194.09700 X121.53600 E28.40165
+G1 Y195.06600 X120.52600 E28.41953
+G1 Y195.30300 X118.80400 E28.42910
+G1 Y195.14900 X119.18600 E28.43247
+G0 Y26.39400 X129.36200
+G1 Y25.89300 X128.77400 E28.49879
+G0 Y66.32600 X188.30900
+G1 F1800.0 Y66.24700 X189.80300 E28.51369
+G1 Y66.23200 X188.27100 E28.56729
+G1 Y66.37400 X186.92700 E28.61797
+G0 F9000.0 Y40.69200 X80.74400
+G0 Y174.30500 X47.97700
+G1 Y172.36600 X49.53900 E28.71230
+G1 Y173.12200 X49.82100 E28.73523
+G0 Y6.18400 X52.83500
+G1 F1800.0 Y5.35200 X52.90700 E28.82428
+G1 Y5.73300 X51.84300 E28.90268
+G0 F9000.0 Y119.83600 X49.15000
+G1 Y120.30900 X47.31500 E28.97186
+G1 F1800.0 Y120.15600 X48.55700 E29.06395
+G1 Y119.78400 X48.20500 E29.07275
+G1 Y118.38900 X48.92000 E29.10718
+G0 F9000.0 Y66.21200 X43.92900
+G1 Y67.37800 X45.91800 E29.15515
+G1 Y68.38400 X47.55000 E29.21879
+G1 Y69.53100 X48.93300 E29.22803
+G1 Y71.39400 X47.58200 E29.29530
+G0 Y187.42700 X165.68600
+G1 Y188.75600 X166.66600 E29.37552
+G1 Y189.89400 X167.96600 E29.46260
+G1 Y191.67800 X168.09300 E29.47419
+G1 Y193.03100 X167.10100 E29.49740
+G1 Y193.00200 X166.04800 E29.58821
+G1 Y194.13700 X165.61600 E29.66757
+G1 Y193.76200 X166.91900 E29.67628
+G1 Y194.14200 X166.27700 E29.75991
+G0 Z0.90000
+G1 Y192.58400 X164.34300 E29.84115
+G1 Y191.92600 X164.17200 E29.86252
+G1 Y191.09400 X164.65000 E29.87131
+G1 Y191.73800 X164.41800 E29.95203
+G1 Y193.03000 X162.58400 E29.97044
+G1 Y191.92700 X162.03300 E30.05942
+G1 Y191.92500 X161.61100 E30.15500
+G1 Y193.24800 X160.36800 E30.17122
+G0 Z1.00000
+G0 Y90.91400 X189.00100
+G1 Y90.32300 X188.00400 E30.18131
+G1 Y89.83000 X188.06000 E30.27418
+G1 Y90.32600 X186.36300 E30.31859
+G1 Y90.85400 X187.00800 E30.35617
+G1 Y90.84600 X188.63700 E30.39254
+G0 Y136.70700 X166.96300
+G1 Y137.71100 X166.75400 E30.48165
+G1 Y137.01200 X164.89400 E30.49535
+G1 F1800.0 Y137.36200 X163.47200 E30.55303
+G1 Y137.92800 X164.46200 E30.58112
+G1 Y137.61100 X164.63900 E30.67893
+G1 Y137.13300 X165.34500 E30.77524
+G1 Y135.78000 X164.45500 E30.83275
+G1 Y134.34000 X163.84400 E30.88435
+G0 F9000.0 Y34.13500 X147.66900
+G1 Y33.32600 X145.88300 E30.92265
+G1 Y32.56400 X144.63100 E31.01702
+G1 Y30.99700 X144.38500 E31.04304
+G1 Y30.06500 X146.23900 E31.06344
+G1 Y30.61300 X147.58800 E31.14130
+G0 Y94.04400 X151.41500
+G1 Y95.05400 X152.09800 E31.16884
+G1 Y94.20800 X152.21500 E31.23186
+G1 Y95.51400 X150.38100 E31.28851
+G1 Y94.48800 X149.44300 E31.29550
+G1 Y94.13900 X150.15500 E31.37627
+G1 Y96.00800 X150.73400 E31.43966
+G1 Y97.76900 X150.31200 E31.51391
+G1 Y97.16800 X151.53500 E31.53248
+G1 Y97.84600 X151.62000 E31.62263
+G1 Y97.49900 X149.88400 E31.67285
+G1 Y97.11400 X150.19500 E31.73022
+G1 Y98.46700 X151.34900 E31.74533
+G1 Y100.06100 X151.35100 E31.83522
+G1 Y101.57500 X151.94600 E31.84834
+G1 Y100.67600 X152.39600 E31.85507
+G1 F1800.0 Y99.52800 X151.48800 E31.87746
+G1 Y100.73600 X153.38700 E31.91343
+G0 F9000.0 Y65.02800 X167.71900
+G0 Z1.10000
+G1 Y64.12900 X166.27400 E31.91934
+G1 Y62.28700 X167.50400 E32.00208
+G1 Y61.64700 X168.02100 E32.03519
+G1 Y60.48300 X169.19500 E32.11913
+G1 Y61.59600 X167.31700 E32.12196
+G1 Y62.11600 X165.56900 E32.19442
+G1 Y62.47100 X165.61800 E32.21704
+G1 Y64.31600 X166.83500 E32.24999
+G0 Y26.74900 X95.57500
+G1 Y27.58200 X96.30600 E32.29545
+G0 Y56.51600 X80.57500
+G0 Y103.24200 X147.19900
+G1 Y104.05700 X145.99000 E32.31513
+G1 Y105.94900 X146.79500 E32.38989
+G1 Y106.82700 X147.68500 E32.39616
+G1 Y105.88200 X148.20500 E32.43170
+G1 Y105.10500 X150.17100 E32.43613
+G1 Y106.32300 X151.76700 E32.48163
+G0 Y155.49400 X30.77500
+G1 Y157.14100 X32.73700 E32.56111
+G1 Y155.57600 X31.25100 E32.61745
+G1 Y153.66100 X30.25800 E32.70834
+G1 Y153.40800 X32.18100 E32.78158
+G1 Y151.94400 X33.54600 E32.78286
+G1 Y149.98000 X33.06200 E32.86590
+G1 F1800.0 Y151.53600 X31.23500 E32.91931
+G1 Y153.07700 X31.73300 E32.96777
+G1 Y154.70100 X30.70700 E33.00603
+G1 Y153.50000 X29.21200 E33.05167
+G1 Y153.25900 X30.04000 E33.05842
+G0 F9000.0 Y80.04300 X94.13200
+G1 Y79.00200 X94.98700 E33.12338
+G1 F1800.0 Y80.63800 X93.55400 E33.18329
+G1 Y79.55300 X95.50100 E33.22252
+G1 Y80.52000 X96.03700 E33.22634
+G1 Y78.67200 X97.24800 E33.23121
+G1 Y79.36000 X96.12600 E33.32425
+G1 Y77.97300 X95.17800 E33.32607
+G0 F9000.0 Y141.99600 X194.63100
+G0 Y32.56300 X161.41300
+G1 Y33.71100 X159.83600 E33.41504
+G0 Z1.20000
+G1 Y34.99700 X160.06000 E33.46528
+G1 Y33.30700 X161.25800 E33.47071
+G1 F1800.0 Y31.33800 X160.84500 E33.54521
+G1 Y31.17000 X162.09200 E33.55742
+G1 Y29.61100 X161.80800 E33.65507
+G1 Y30.53200 X160.18400 E33.74004
+G0 F9000.0 Y60.54500 X73.51700
+G1 Y60.97000 X72.10900 E33.83790
+G0 Z1.30000
+G0 Y138.49300 X22.73400
+G1 Y138.31500 X22.81400 E33.87864
+G1 Y139.24600 X24.48000 E33.95829
+G1 Y137.36800 X25.34700 E34.02638
+G1 Y136.08700 X26.85900 E34.12065
+G1 Y135.29000 X25.87000 E34.15550
+G0 Y196.17500 X88.57600
+G1 Y197.22400 X90.30500 E34.23918
+G1 F1800.0 Y196.22300 X89.40200 E34.28043
+G1 Y197.90700 X90.94700 E34.31330
+G1 Y199.08500 X92.50600 E34.36650
+G1 Y199.59300 X91.76100 E34.40321
+G1 Y199.71700 X90.40500 E34.46821
+G1 Y201.37200 X90.03500 E34.53719
+G0 F9000.0 Y57.47800 X42.47400
+G1 Y56.51900 X40.52900 E34.60877
+G0 Y137.37600 X87.59800
+G1 Y138.38800 X88.58300 E34.63361
+G0 Y41.84300 X138.22900
+G1 Y42.41600 X140.08700 E34.69273
+G1 F1800.0 Y41.63200 X140.86600 E34.69912
+G92 U34.69912
+G0 F9000.0 Y100.23900 X12.57300 Z1.50000
+G1 Y99.33200 X13.32300 U34.77607
+G0 Y83.28900 X50.63300
+G1 Y84.20200 X50.41300 U34.78555
+G1 Y82.32500 X51.74200 U34.86843
+G1 F1800.0 Y83.00800 X52.95300 U34.89619
+G0 F9000.0 Y33.10700 X170.97700
+G1 Y33.75200 X171.32500 U34.91425
+G0 Y78.10200 X186.54000
+G1 F1800.0 Y76.99500 X186.81900 U34.92073
+G1 Y78.84800 X185.33900 U34.95710
+G0 F9000.0 Y51.82900 X147.59600
+G1 Y50.27500 X147.68800 U34.98192
+G1 Y51.33400 X147.21100 U35.00432
+G1 Y50.79600 X146.74800 U35.06847
+G1 Y51.45000 X144.95000 U35.15211
+G0 Y24.66900 X77.66900
+G1 Y23.04400 X78.51500 U35.16388
+G0 Y89.55300 X36.14900
+G0 Y73.72800 X3.58100
+G1 Y73.94700 X5.32700 U35.17104
+G1 Y75.42800 X5.57900 U35.26728
+G0 Y106.46800 X178.73900
+G1 F1800.0 Y107.92700 X177.42100 U35.28852
+G1 Y107.77000 X179.11800 U35.36165
+G1 Y106.59200 X178.38900 U35.42795
+G0 F9000.0 Y97.81600 X186.83600
+G0 Y132.09400 X-7.82400
+G1 Y131.97600 X-9.72600 U35.50199
+G1 Y132.39500 X-9.73000 U35.56711
+G1 Y133.35700 X-7.94800 U35.65284
+G1 Y132.26400 X-9.22100 U35.71263
+G0 Y8.68200 X33.39400
+G1 Y7.44800 X31.95600 U35.78753
+G1 Y8.16400 X31.56300 U35.78879
+G1 Y8.21100 X31.47200 U35.88362
+G1 Y7.07600 X31.95700 U35.96701
+G1 Y5.98200 X31.78300 U36.06313
+G1 Y6.65600 X31.15600 U36.06543
+G0 Y1.53200 X155.60600
+G1 Y1.34800 X154.63700 U36.12161
+G0 Y25.60700 X38.08800
+G1 Y24.15500 X36.68500 U36.17384
+G1 Y23.09300 X34.91200 U36.19059
+G1 Y24.64600 X34.54800 U36.25676
+G1 F1800.0 Y26.41400 X33.62400 U36.29753
+G1 Y24.48400 X32.04000 U36.32649
+G1 Y24.16500 X33.52200 U36.37943
+G1 Y24.21600 X34.13600 U36.39109
+G1 Y25.42000 X34.48100 U36.48097
+G0 F9000.0 Y181.00800 X5.20400
+G1 Y181.77700 X3.93000 U36.50654
+G1 Y182.48600 X4.02600 U36.51388
+G1 F1800.0 Y183.17500 X3.91300 U36.59384
+G1 Y184.01100 X4.62400 U36.65859
+G1 Y182.94300 X5.76700 U36.70165
+G1 Y184.78900 X5.40400 U36.79166
+G1 Y185.44300 X4.84200 U36.86835
+G1 Y184.50700 X3.70200 U36.87192
+G1 Y182.81800 X3.38500 U36.93015
+G1 Y183.63600 X2.80800 U36.97388
+G1 Y184.34000 X0.87800 U36.98997
+G1 Y185.68200 X1.94600 U37.05418
+G1 Y184.46700 X3.81100 U37.13080
+G1 Y184.87100 X5.09700 U37.21576
+G1 Y182.93200 X3.89000 U37.26925
+G1 Y180.95100 X2.17100 U37.28657
+G0 Z1.60000
+G1 Y181.79500 X1.23100 U37.38529
+G0 F9000.0 Y195.49200 X176.92200
+G0 Y105.96500 X57.07100
+G1 F1800.0 Y105.88000 X56.74100 U37.41114
+G0 F9000.0 Y19.77900 X22.49200
+G1 Y18.83100 X23.27800 U37.49032
+G1 Y17.58400 X23.24600 U37.58321
+G0 Y140.02600 X20.78400
+G1 Y138.94400 X21.65200 U37.66293
+G0 Y39.75900 X107.24300
+G1 F1800.0 Y40.92400 X108.45900 U37.68605
+G1 Y39.47700 X108.71900 U37.70532
+G0 F9000.0 Y49.68500 X116.79200
+G1 F1800.0 Y49.81700 X116.48600 U37.77777
+G1 Y48.98000 X115.37000 U37.84175
+G1 Y47.79900 X116.97700 U37.87286
+G1 Y46.70400 X115.60700 U37.94999
+G1 Y47.88200 X117.44100 U37.98096
+G1 Y48.31800 X115.66400 U37.98987
+G1 Y50.04500 X114.26900 U38.07760
+G0 F9000.0 Y102.86000 X13.91700
+G1 Y103.72500 X13.36800 U38.13053
+G0 Y78.90500 X4.01100
+G1 Y79.58000 X3.02100 U38.15272
+G1 Y80.66100 X3.87100 U38.18988
+G1 Y81.13600 X5.60600 U38.20038
+G1 Y79.28500 X4.72100 U38.29849
+G0 Y125.36900 X83.17400
+G1 Y126.37200 X81.44800 U38.37557
+G0 Y20.30800 X68.77200
+G1 Y19.46000 X66.97700 U38.45236
+G0 Y34.29700 X4.12800
+G1 Y32.97300 X5.46000 U38.46973
+G1 Y31.46600 X4.81200 U38.49401
+G0 Y149.63100 X41.91400
+G1 Y149.52200 X43.53100 U38.58965
+G1 Y150.38600 X43.39200 U38.66305
+G0 Y22.90000 X181.64900
+G1 Y21.89200 X181.00400 U38.68857
+G1 Y23.31000 X179.59800 U38.72069
+G1 Y22.06000 X178.96400 U38.76253
+G1 Y20.10200 X179.26400 U38.83888
+G1 Y19.41000 X181.07200 U38.92373
+G1 Y18.90800 X180.53500 U38.95901
+G0 Y183.40700 X35.42900
+G1 Y184.95600 X35.97200 U39.03457
+G1 Y186.91900 X37.18900 U39.10738
+G1 Y187.54200 X36.20100 U39.14545
+G0 Y68.78200 X97.82500
+G1 Y70.15700 X97.20600 U39.23023
+G0 Y150.35000 X177.65000
+G1 Y148.54200 X178.26000 U39.31725
+G1 Y149.67400 X177.61700 U39.39547
+G1 Y148.67100 X176.97900 U39.40551
+G0 Y46.91900 X149.31000
+G0 Y149.72100 X3.53200
+G0 Y81.86900 X82.41400
+G1 Y81.10800 X84.23000 U39.46874
+G1 Y82.04300 X85.82900 U39.49990
+G1 Y82.39300 X84.25200 U39.58282
+G1 Y83.91500 X83.91800 U39.64937
+G1 Y85.75000 X83.37100 U39.71896
+G1 Y86.11300 X81.51000 U39.76220
+G1 Y86.20800 X79.88000 U39.84424
+G1 Y87.18700 X78.76900 U39.92441
+G1 Y86.92100 X80.73900 U39.96247
+G1 Y86.12800 X79.54600 U39.99537
+G0 Y101.56200 X99.37400
+G1 Y103.38800 X97.94700 U40.09537
+G1 Y105.02900 X96.68000 U40.15051
+G1 F1800.0 Y106.72500 X96.12700 U40.17125
+G1 Y108.32700 X97.72200 U40.26674
+G1 Y106.90200 X97.96100 U40.32985
+G1 Y105.93800 X98.37000 U40.35745
+G1 Y104.30800 X98.24300 U40.35802
+G1 Y103.25600 X99.23600 U40.38358
+G0 F9000.0 Y182.32800 X110.58400
+G1 Y183.21100 X110.92600 U40.45850
+G1 F1800.0 Y184.56500 X110.01700 U40.55101
+G1 Y182.91000 X109.78700 U40.55798
+G1 Y182.75000 X108.35500 U40.62185
+G1 Y181.73000 X109.42200 U40.64173
+G1 Y180.94300 X109.89500 U40.65793
+G0 F9000.0 Y64.65800 X28.62400
+G1 Y64.57700 X27.35900 U40.70191
+G1 Y64.46300 X29.13800 U40.72171
+G0 Y16.15800 X23.83800
+G1 Y15.77100 X25.70600 U40.75711
+G1 Y15.33900 X26.46900 U40.77235
+G1 Y16.73700 X24.49400 U40.84519
+G1 Y16.34400 X26.17500 U40.88845
+G1 Y17.28400 X26.82600 U40.98338
+G1 Y18.44800 X28.23300 U41.04238
+G1 Y18.64500 X30.01200 U41.08264
+G0 Y161.59900 X169.50500
+G0 Y97.42400 X54.64300
+G1 Y99.00500 X54.09600 U41.11762
+G1 Y98.91200 X54.65300 U41.15088
+G1 Y97.95500 X55.79700 U41.18793
+G1 Y98.11100 X57.44900 U41.21551
+G1 Y98.87000 X56.09000 U41.21769
+G0 Y30.87800 X151.11500
+G1 Y29.93300 X149.34600 U41.29103
+G1 F1800.0 Y30.13700 X151.13300 U41.38322
+G1 Y28.90900 X150.87000 U41.45803
+G1 Y30.40000 X149.24200 U41.53338
+G1 Y28.62400 X147.39500 U41.54581
+G1 Y27.07400 X147.91500 U41.56201
+G1 Y28.95200 X148.60500 U41.59807
+G1 Y27.96500 X148.16900 U41.62134
+G1 Y26.66500 X148.99200 U41.63933
+G1 Y24.90100 X149.94100 U41.69235
+G0 F9000.0 Y159.68300 X77.91600
+G1 Y161.20900 X77.72200 U41.75245
+G1 Y162.64600 X79.49600 U41.84393
+G0 Y78.16300 X25.00900
+G1 Y79.37100 X23.02800 U41.92253
+G0 Z1.70000
+G1 Y80.04900 X22.68400 U41.97952
+G1 Y81.87100 X24.52400 U42.07241
+G1 Y80.94600 X24.03000 U42.16279
+G1 Y82.90900 X25.31500 U42.23159
+G1 Y83.35300 X24.36400 U42.24744
+G1 Y85.04500 X23.46500 U42.25573
+G1 Y86.08900 X22.06100 U42.31307
+G1 Y87.82200 X21.77000 U42.32179
+G0 Y24.23800 X45.32700
+G1 Y25.14300 X45.09400 U42.34745
+G1 Y25.11900 X43.48500 U42.41963
+G1 Y24.60100 X42.59600 U42.51163
+G1 Y24.88800 X42.30300 U42.59248
+G1 Y24.49300 X43.75800 U42.68748
+G0 Y30.47900 X139.82200
+G1 Y32.43200 X138.03600 U42.74157
+G0 Y76.80300 X117.37200
+G1 F1800.0 Y74.93600 X118.63200 U42.78936
+G1 Y73.07400 X120.20500 U42.83582
+G1 Y72.44600 X121.12100 U42.92910
+G0 F9000.0 Y25.51800 X152.93900
+G0 Y68.76800 X90.02900
+G0 Y96.27800 X175.98200
+G1 Y97.92900 X174.98300 U42.95121
+G1 Y99.01400 X176.86700 U43.01429
+G1 Y97.40700 X176.64100 U43.10567
+G1 Y96.33500 X177.62000 U43.15200
+G1 Y94.97700 X179.31300 U43.22039
+G1 Y93.52500 X177.98400 U43.26742
+G1 Y93.74200 X177.45500 U43.34360
+G0 Y75.03600 X167.21600
+G1 Y73.59700 X169.14200 U43.40183
+G1 Y72.85200 X169.33200 U43.40470
+G0 Y127.39600 X46.84700
+G1 Y128.13800 X48.64000 U43.44093
+G1 Y129.58800 X48.81300 U43.50792
+G1 Y131.46500 X48.01400 U43.53234
+G0 Y112.13200 X-8.03200
+G1 Y110.60500 X-8.00200 U43.61603
+G1 Y112.57300 X-6.29500 U43.68385
+G0 Z1.80000
+G0 Y195.31300 X75.30900
+G1 Y193.34800 X75.58300 U43.72542
+G1 Y191.40100 X76.88100 U43.74569
+G1 Y193.12900 X75.28700 U43.77244
+G1 Y194.99500 X74.58100 U43.81295
+G0 Y197.74300 X156.08200
+G0 Y55.58100 X139.25000
+G0 Y133.86500 X62.84500
+G1 Y135.83900 X64.82100 U43.87528
+G0 Y111.75300 X135.21300
+G1 Y110.77300 X136.81400 U43.88944
+G0 Y161.67300 X107.70700
+G0 Y116.38700 X90.56100
+G1 F1800.0 Y116.56100 X90.21100 U43.89095
+G1 Y117.58800 X89.15800 U43.91515
+G1 Y117.49800 X87.52900 U43.95390
+G1 Y118.17800 X86.41800 U44.03737
+G1 Y118.59400 X88.11300 U44.05546
+G0 F9000.0 Y19.27000 X56.32700
+G1 Y18.50400 X56.02200 U44.10668
+G1 Y17.72500 X54.64000 U44.13911
+G1 Y16.38900 X54.35600 U44.14365
+G1 F1800.0 Y15.01500 X54.94800 U44.20617
+G1 Y13.42500 X54.28900 U44.28042
+G1 Y14.10300 X52.96200 U44.32375
+G0 F9000.0 Y2.21400 X170.52000
+G1 Y1.00700 X170.11400 U44.33253
+G1 Y0.07200 X169.45400 U44.39959
+G1 F1800.0 Y-0.20500 X170.20700 U44.41517
+G1 Y1.47500 X172.17000 U44.42516
+G1 Y2.15400 X170.94600 U44.47472
+G1 Y3.41200 X172.68100 U44.52207
+G1 Y4.15500 X171.19000 U44.59181
+G1 Y5.01600 X169.37100 U44.67190
+G1 Y5.34800 X167.58600 U44.74420
+G1 Y6.19700 X167.05200 U44.77190
+G1 Y4.56300 X165.06700 U44.84451
+G1 Y6.05100 X163.68800 U44.91619
+G1 Y4.06600 X164.37400 U44.92042
+G1 Y3.33900 X166.36000 U45.01131
+G1 Y5.21600 X166.71300 U45.07572
+G1 Y5.29100 X165.49900 U45.12402
+G1 Y5.64300 X165.54100 U45.14627
+G1 Y5.31900 X165.55600 U45.21269
+G1 Y6.39900 X164.65900 U45.28306
+G1 Y8.10100 X163.65500 U45.33414
+G1 Y8.93600 X163.26300 U45.41600
+G1 Y8.74400 X162.11500 U45.45179
+G1 Y9.67800 X163.13400 U45.47253
+G1 Y10.38200 X163.75200 U45.53605
+G1 Y9.82500 X161.99600 U45.53929
+G1 Y11.69100 X162.67700 U45.61973
+G1 Y12.87300 X161.11100 U45.69344
+G1 Y12.82200 X160.19000 U45.76465
+G1 Y12.57900 X161.66100 U45.80677
+G1 Y11.21000 X160.39400 U45.83486
+G1 Y12.61700 X159.72000 U45.92393
+G0 F9000.0 Y76.42900 X144.54700
+G0 Y89.40600 X170.55800
+G1 Y88.42700 X170.93900 U45.92596
+G1 Y87.91400 X168.98300 U46.00208
+G1 Y86.66800 X169.48200 U46.00412
+G1 Y85.46900 X168.65700 U46.08966
+G1 F1800.0 Y85.76700 X169.00100 U46.12186
+G1 Y86.17500 X169.57800 U46.17286
+G1 Y85.84100 X168.82400 U46.20918
+G0 F9000.0 Y49.57600 X187.27800
+G1 F1800.0 Y49.92500 X186.25200 U46.24690
+G1 Y49.00100 X187.49400 U46.32452
+G1 Y48.52300 X185.71100 U46.34730
+G1 Y48.71600 X187.08000 U46.38602
+G0 F9000.0 Y152.03700 X41.99800
+G1 Y150.40100 X43.96900 U46.43221
+G0 Z1.90000
+G0 Y75.28600 X8.19600
+G1 Y74.44300 X8.22700 U46.50241
+G1 Y74.48500 X6.90400 U46.55178
+G1 Y75.99600 X5.74200 U46.58756
+G1 Y75.13200 X5.99500 U46.59600
+G1 Y75.75800 X4.45300 U46.64920
+G1 Y75.11200 X5.83300 U46.69094
+G1 Y73.76000 X5.44100 U46.75719
+G1 Y72.69100 X5.06500 U46.83619
+G1 Y73.62500 X4.56400 U46.83906
+G1 Y74.32800 X5.29400 U46.88877
+G0 Y130.54800 X24.59800
+G1 Y131.12600 X23.63300 U46.90238
+G0 Y64.29700 X91.90700
+G1 Y64.23100 X90.44300 U46.96404
+G1 Y64.41600 X91.15700 U47.02571
+G1 Y64.18600 X90.04600 U47.10873
+G1 Y63.98000 X89.50200 U47.20571
+G1 Y64.42700 X87.92800 U47.20902
+G1 Y63.49700 X88.84000 U47.29361
+G1 Y61.56000 X88.92300 U47.38263
+G1 Y61.69100 X89.67700 U47.46887
+G1 F1800.0 Y59.79600 X89.03200 U47.50253
+G0 F9000.0 Y25.66200 X114.83000
+G0 Y57.24900 X48.51600
+G1 Y58.72900 X50.13800 U47.60151
+G1 Y60.43500 X49.26200 U47.68258
+G1 Y62.13600 X47.62800 U47.73780
+G1 Y62.93300 X46.20200 U47.78420
+G1 Y64.75800 X44.98900 U47.81231
+G1 Y65.53800 X43.98000 U47.85192
+G1 Y65.01100 X45.79600 U47.90291
+G0 Y150.52900 X140.71000
+G1 Y149.36800 X140.13800 U47.93765
+G1 Y149.46600 X139.76200 U47.95306
+G1 Y150.61400 X139.78900 U47.97285
+G1 Y148.99200 X141.03900 U48.00044
+G1 Y149.30600 X140.54700 U48.02222
+G0 Z2.00000
+G1 Y150.62900 X139.56200 U48.07743
+G1 Y151.73800 X138.06400 U48.10664
+G1 Y152.99900 X138.77700 U48.15031
+G1 Y151.40200 X137.53300 U48.19150
+G0 Y174.81200 X34.23800
+G1 Y173.54300 X32.83400 U48.24925
+G1 Y173.30200 X32.98400 U48.29962
+G0 Y155.00900 X-2.33800
+G1 Y153.88000 X-2.18700 U48.37773
+G1 Y154.17100 X-3.27400 U48.44255
+G1 Y154.74400 X-5.01300 U48.51168
+G1 Y153.14900 X-4.08000 U48.59557
+G0 Y18.31300 X39.68200
+G1 Y18.27000 X38.02700 U48.62060
+G1 Y19.42400 X37.51400 U48.69288
+G1 Y18.74100 X35.54700 U48.70369
+G1 Y17.57700 X37.53000 U48.70736
+G1 F1800.0 Y17.14700 X39.25400 U48.73860
+G1 Y16.91000 X39.30300 U48.78231
+G1 Y15.62300 X39.20700 U48.82294
+G1 Y15.86200 X39.85000 U48.86908
+G1 Y17.32100 X40.08000 U48.87706
+G1 Y15.37400 X41.99300 U48.93977
+G1 Y13.89800 X41.87300 U48.96979
+G1 Y14.46800 X40.69100 U49.03547
+G1 Y14.85700 X39.99100 U49.06914
+G1 Y16.01900 X39.13900 U49.09971
+G1 Y16.94400 X37.60100 U49.10652
+G0 F9000.0 Y75.24100 X134.80900
+G0 Y101.76500 X68.99100
+G1 Y101.85600 X67.48000 U49.13653
+G1 Y100.76800 X67.22200 U49.23341
+G1 Y100.34100 X68.55200 U49.30895
+G0 Y91.29200 X-1.56100
+G1 Y91.05400 X-2.74900 U49.38523
+G0 Y86.57600 X93.85000
+G1 Y85.52800 X95.43900 U49.44131
+G0 Y184.62400 X78.86900
+G1 Y185.46600 X79.21300 U49.44762
+G0 Y144.67200 X50.30800
+G0 Y4.66100 X84.67300
+G0 Y17.79800 X34.49000
+G0 Y105.03200 X28.89600
+G0 Y84.87300 X154.22700
+G1 Y86.23200 X153.19100 U49.45231
+G0 Y83.14500 X178.91100
+G1 Y81.54700 X180.36400 U49.45871
+G1 Y80.65800 X181.24800 U49.50840
+G1 Y81.00100 X180.37400 U49.53831
+G1 Y82.20500 X178.71700 U49.58788
+G0 Y102.27600 X91.75600
+G1 Y101.92500 X91.25200 U49.67714
+G1 Y103.88600 X92.82200 U49.77147
+G1 Y102.70200 X93.27000 U49.87122
+G1 Y101.02000 X93.50200 U49.95755
+G1 Y99.79600 X93.96700 U50.00381
+G0 Y22.39800 X122.13200
+G1 Y23.14700 X122.73000 U50.00812
+G1 Y22.84700 X122.29400 U50.04558
+G1 Y22.45600 X122.89500 U50.10253
+G0 Y194.47300 X179.88600
+G1 Y194.33600 X181.85600 U50.18644
+G1 Y196.09000 X182.71600 U50.26978
+G1 Y195.99100 X183.86600 U50.30103
+G1 Y197.37000 X185.23700 U50.36798
+G0 Y43.90400 X103.59800
+G1 Y42.52300 X102.00800 U50.43968
+G1 Y43.91800 X101.32500 U50.46994
+G1 F1800.0 Y43.66000 X99.37300 U50.50793
+G1 Y41.66200 X98.87400 U50.60397
+G1 Y40.06000 X96.97100 U50.67495
+G1 Y39.20700 X95.95600 U50.77196
+G1 Y37.70500 X97.50200 U50.85677
+G1 Y38.48700 X98.74100 U50.91175
+G0 F9000.0 Y54.67000 X97.95800
+G1 Y55.50300 X96.72300 U50.96906
+G1 Y57.19100 X97.12000 U51.05031
+G1 Y56.67500 X98.83100 U51.06052
+G1 Y57.25800 X100.55700 U51.12677
+G1 Y57.10500 X100.33800 U51.20273
+G0 Y163.29400 X113.93100
+G1 Y164.86400 X114.66600 U51.21550
+G1 Y166.66200 X114.00300 U51.31517
+G1 Y165.35600 X114.53000 U51.41235
+G0 Y5.06600 X80.51000
+G1 Y6.88400 X80.15800 U51.45371
+G1 Y5.83500 X80.50300 U51.48420
+G1 Y5.85600 X81.08600 U51.51650
+G1 F1800.0 Y5.19900 X79.89600 U51.51770
+G0 F9000.0 Y168.80400 X74.57600
+G1 Y170.15200 X76.44100 U51.57629
+G1 Y168.41400 X76.92400 U51.63052
+G1 Y166.82300 X76.54100 U51.70367
+G1 Y167.21900 X75.00400 U51.79077
+G1 Y168.73300 X73.18700 U51.85727
+G1 Y170.31400 X74.49200 U51.88202
+G1 Y171.35900 X73.67600 U51.94368
+G1 Y171.62600 X75.38900 U52.03503
+G1 Y171.46500 X73.50500 U52.09025
+G1 Y171.37700 X73.99900 U52.15368
+G1 Y169.43300 X75.78600 U52.18572
+G0 Y7.67800 X148.05800
+G1 Y6.63000 X149.25900 U52.22384
+G1 Y7.05200 X149.37400 U52.25639
+G1 Y8.85900 X150.49100 U52.28111
+G1 Y10.07300 X149.87500 U52.29861
+G1 Y8.14800 X151.61700 U52.32568
+G1 Y9.51100 X150.27000 U52.36540
+G1 Y8.82900 X148.52700 U52.38098
+G1 Y9.15000 X149.33000 U52.39316
+G1 Y10.43200 X147.90300 U52.47523
+G1 Y9.34900 X149.14400 U52.47533
+G1 Y10.41400 X147.53400 U52.55265
+G1 Y9.72600 X149.47400 U52.63604
+G1 Y10.46300 X150.20800 U52.72093
+G1 Y10.63400 X149.21400 U52.73446
+G1 Y11.42300 X148.18300 U52.80178
+G1 Y10.64800 X149.24900 U52.81160
+G1 Y11.91000 X149.11500 U52.82756
+G1 Y10.55700 X150.63500 U52.83490
+G0 Y18.19200 X123.55400
+G1 Y19.68600 X124.20900 U52.87582
+G0 Y49.91100 X58.13000
+G1 Y51.04800 X58.98700 U52.92899
+G0 Y60.08800 X67.01300
+G1 Y58.94500 X67.97000 U52.96152
+G1 Y58.86700 X68.52400 U52.99951
+G1 Y59.13500 X68.32200 U53.08576
+G1 Y59.14300 X66.73500 U53.16261
+G1 Y59.06700 X68.69700 U53.20084
+G1 Y57.56100 X68.20200 U53.26450
+G1 Y56.79200 X68.84200 U53.31600
+G1 Y58.44100 X68.71500 U53.40659
+G1 Y56.99700 X70.57200 U53.49870
+G1 Y58.96100 X70.22500 U53.50120
+G1 Y60.27500 X69.72200 U53.52256
+G1 Y59.06200 X69.36700 U53.60257
+G0 Y45.75700 X185.60400
+G1 Y46.06300 X185.26300 U53.69160
+G1 Y44.49200 X184.72500 U53.69848
+G1 Y46.42200 X184.51400 U53.73984
+G1 Y48.17900 X183.20100 U53.79894
+G1 Y47.44000 X182.20100 U53.84830
+G1 Y46.26800 X182.45400 U53.85367
+G1 Y47.82500 X183.58300 U53.87731
+G1 F1800.0 Y47.95700 X183.73300 U53.88156
+G1 Y47.47800 X184.49000 U53.97347
+G1 Y47.69200 X182.75800 U54.03890
+G0 F9000.0 Y8.33600 X87.41800
+G1 Y7.45300 X87.92100 U54.08347
+G0 Y164.63200 X26.28800
+G1 Y164.02200 X27.15000 U54.16415
+G1 Y164.26900 X26.72100 U54.18322
+G1 Y164.82400 X26.85100 U54.19323
+G1 Y162.87600 X28.22300 U54.23770
+G1 Y162.08200 X29.09800 U54.26093
+G1 Y161.48200 X29.99100 U54.33699
+G1 F1800.0 Y160.99600 X31.93300 U54.43564
+G1 Y161.17700 X30.05200 U54.47447
+G1 Y162.31300 X28.88500 U54.52950
+G1 Y163.39800 X27.03200 U54.55131
+G0 Z2.10000
+G1 Y164.45500 X27.69400 U54.61496
+G1 Y163.27900 X28.37000 U54.66847
+G1 Y162.52200 X27.16100 U54.70277
+G1 Y162.83200 X28.07900 U54.72006
+G0 F9000.0 Y31.04400 X140.24400
+G0 Y104.49900 X40.34600
+G1 Y106.25200 X41.88200 U54.74840
+G1 Y105.27200 X42.12700 U54.84336
+G1 F1800.0 Y104.99300 X40.92000 U54.93317
+G1 Y103.04700 X40.15600 U55.02314
+G1 Y102.51600 X38.62300 U55.03510
+G1 Y102.30100 X38.93600 U55.06560
+G1 Y101.67500 X39.83300 U55.15740
+G1 Y100.99300 X39.73500 U55.17081
+G1 Y102.69500 X38.12900 U55.25952
+G1 Y102.83800 X37.08200 U55.34294
+G1 Y101.60700 X37.74300 U55.40559
+G1 Y102.45100 X36.49400 U55.40971
+G0 F9000.0 Y107.14900 X19.78200
+G0 Y20.76300 X148.95500
+G1 Y19.27000 X150.39900 U55.43145
+G1 Y18.62100 X152.12800 U55.47125
+G1 Y20.18600 X153.99300 U55.49128
+G1 Y21.58100 X152.46200 U55.56870
+G1 Y23.41400 X150.86200 U55.57894
+G1 Y24.15300 X150.13200 U55.62000
+G0 Y78.38900 X176.68700
+G1 Y79.63900 X176.57400 U55.65011
+G0 Y17.33700 X87.85200
+G1 Y17.03700 X88.56100 U55.74754
+G1 Y17.85400 X86.89100 U55.82030
+G1 F1800.0 Y19.11200 X87.27100 U55.84782
+G1 Y17.27700 X86.35300 U55.86148
+G1 Y15.86300 X85.19300 U55.95126
+G1 Y15.51600 X83.71800 U56.04591
+G1 Y17.50700 X81.94600 U56.05634
+G1 Y15.67600 X82.87300 U56.12588
+G1 Y15.72500 X81.45300 U56.20609
+G1 Y14.79000 X81.13300 U56.23001
+G1 Y16.35000 X81.41300 U56.28115
+G1 Y14.41600 X80.27300 U56.31400
+G0 F9000.0 Y8.42700 X73.63200
+G1 Y9.94300 X73.56900 U56.38375
+G1 Y10.85900 X72.77600 U56.40436
+G1 Y9.53000 X73.87800 U56.43877
+G1 Y8.00300 X75.78900 U56.45978
+G1 Y8.59600 X76.77100 U56.53774
+G1 Y9.18900 X78.45500 U56.60334
+G1 Y9.47900 X79.48300 U56.61624
+G1 Y9.72300 X79.21200 U56.65241
+G1 F1800.0 Y11.61100 X78.69800 U56.66144
+G1 Y11.40600 X78.27800 U56.72062
+G1 Y12.90200 X76.34000 U56.81452
+G1 Y11.13500 X75.63500 U56.90379
+G1 Y11.92800 X74.65400 U56.98346
+G1 Y13.12100 X73.58900 U57.06981
+G0 F9000.0 Y198.54000 X108.74900
+G1 Y197.12100 X108.58600 U57.07586
+G0 Y134.63100 X151.79000
+G1 F1800.0 Y136.36100 X153.35600 U57.13752
+G1 Y135.36000 X153.04000 U57.23039
+G0 F9000.0 Y70.02300 X35.78700
+G1 Y69.78200 X35.08600 U57.31173
+G1 Y71.56000 X34.40900 U57.40691
+G1 Y71.20200 X32.85200 U57.46924
+G1 Y69.69900 X30.98700 U57.52528
+G1 Y71.30200 X31.46100 U57.57681
+G1 Y72.43100 X30.56400 U57.59241
+G1 Y71.09200 X32.19600 U57.61165
+G1 Y70.67300 X31.52500 U57.68761
+G1 Y71.77000 X31.11100 U57.77793
+G1 Y73.68100 X30.11300 U57.83047
+G1 Y72.22200 X29.20000 U57.91900
+G1 Y72.32800 X29.04300 U57.93969
+G1 Y72.50200 X29.76900 U57.93993
+G1 Y71.54100 X28.04400 U57.96109
+G1 Y70.53500 X27.35200 U57.99021
+G1 Y71.69000 X28.51400 U58.06002
+G1 Y69.86800 X26.96800 U58.07645
+G1 Y70.21100 X28.25700 U58.11942
+G1 Y69.57600 X29.27000 U58.12402
+G1 Y68.04500 X30.66100 U58.18932
+G1 Y66.44800 X29.84900 U58.20921
+G1 Y67.17500 X30.42100 U58.23742
+G0 Y10.17800 X186.95700
+G1 Y8.92500 X186.35600 U58.28102
+G1 Y9.44300 X185.01500 U58.34672
+G0 Y23.66800 X164.83500
+G0 Y104.26100 X38.35300
+G1 Y105.16900 X38.56800 U58.43613
+G0 Y5.19300 X156.17200
+G1 Y5.60100 X154.74400 U58.51432
+G1 Y6.35800 X156.14800 U58.52516
+G1 Y4.97900 X155.78300 U58.59106
+G0 Y81.99900 X22.94200
+G0 Y111.78300 X67.02300
+G1 Y112.98400 X66.63800 U58.59985
+G1 Y114.66700 X68.09500 U58.67638
+G1 F1800.0 Y113.13700 X68.38500 U58.70191
+G1 Y112.76700 X67.67300 U58.75574
+G1 Y113.95200 X68.85600 U58.84384
+G0 F9000.0 Y140.13800 X142.31700
+G1 Y138.75200 X141.69000 U58.92703
+G1 Y138.03700 X141.04900 U58.97835
+G1 Y138.81100 X140.46200 U59.01872
+G1 Y138.26100 X140.68300 U59.04610
+G1 Y136.60000 X139.90400 U59.06561
+G0 Y107.28500 X151.99800
+G1 F1800.0 Y106.92600 X152.15600 U59.12134
+G1 Y105.48100 X150.56800 U59.18859
+M140 S0
+G1 F300.0 U58.18859
+G1 F9000.0 Y85.48100 X130.56800 Z2.60000 U53.18859
+M84
+M84
+EOF
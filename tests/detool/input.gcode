@@ -0,0 +1,1578 @@
+;Generated with Cura_SteamEngine 15.04
+;Sliced at: Sat 17-10-2015 12:00:00
+M190 S60.000000
+M104 T0 S210.000000
+M104 T1 S210.000000
+M109 T0 S210.000000
+G21        ;metric values
+G90        ;absolute positioning
+M82        ;set extruder to absolute mode
+M107       ;start with the fan off
+G28 X0 Y0  ;move X/Y to min endstops
+G28 Z0     ;move Z to min endstops
+G1 Z15.0 F9000 ;move the platform down 15mm
+G92 E0                  ;zero the extruded length
+G1 F200 E3              ;extrude 3mm of feed stock
+G92 E0                  ;zero the extruded length again
+G1 F9000
+;Put printing message on LCD screen
+M117 Printing...
+
+;DeToolIgnoreSection
+G1 X10 Y10 E5
+T1
+;DeToolEndIgnoreSection
+M301 H1 P{T0Axis} ; placeholder {T1Axis} and ?T0Axis?
+G92 ?T1Axis?0 ;DeToolKeep
+G92 E0.5 X5
+;LAYER:0
+M106 S127
+G0 F9000 X100.0 Y100.0 Z0.3
+G1 F1200 X101.5 Y100.0 E0.1234
+G1 X101.5 Y101.5 E0.2468
+T1
+M106 S255
+G0 X110.0 Y100.0
+G1 X111.0 Y100.0 E0.5
+G1 F600 X112.0 E0.6
+T0
+G1 X90.0 Y90.0 E1.0
+G91
+G1 Z0.5 E-1.0
+G1 X5.0 Y-5.0
+G90
+T1
+G0 F3000
+G1 X50 Y50 E2
+M107
+T0
+G0 Z1.0
+G92 X0 Y0
+G1 X1.0 Y1.0 E2.5
+G28 Z0
+G1 Z5.0
+G28
+G1 X0 Y0 Z0.3
+   G1 X1 Y1   ; spaced
+G1 X96.835 Y100.633 E0.01099
+G0 F9000 X18.143 Y84.904
+G1 X16.638 Y83.797 E0.07374
+G1 X16.225 Y85.702 E0.07839
+G1 X14.802 Y84.173 E0.10924
+G0 F9000 X116.320 Y127.783
+G1 X116.511 Y126.034 E0.11520
+G1 X116.221 Y125.290 E0.17376
+G1 X117.399 Y126.086 E0.19817
+G1 X118.899 Y127.004 E0.22696
+G0 F9000 X83.625 Y151.428
+G0 F9000 X97.793 Y7.841
+G1 X98.851 Y8.134 E0.31451
+G1 X99.228 Y8.453 E0.36013
+G1 X99.125 Y9.110 E0.36620
+G1 X101.097 Y10.397 E0.39466
+G1 X99.187 Y10.244 E0.41146
+G0 F9000 X153.647 Y25.868
+G1 X153.210 Y27.354 E0.41952
+G1 X154.744 Y28.631 E0.50592
+G1 X154.179 Y30.168 E0.60169
+G0 F9000 X46.391 Y46.667
+G1 X46.748 Y45.718 E0.60210
+G1 X47.013 Y47.531 E0.67115
+G1 X47.718 Y45.747 E0.76110
+G1 X48.910 Y45.316 E0.80100
+G1 X47.159 Y43.585 E0.82188
+G1 X45.369 Y41.586 E0.83700
+G1 X43.471 Y43.084 E0.89841
+G1 X42.860 Y42.540 E0.91070
+G1 X42.724 Y42.476 E0.91928
+G1 F1800 X41.783 Y43.791 E0.93543 ; extrude
+G1 F1800 X41.896 Y42.378 E0.98975 ; extrude
+G1 X43.810 Y43.831 E1.05937
+G1 X42.479 Y44.919 E1.11262
+G1 X41.371 Y46.165 E1.21112
+G1 X42.644 Y47.124 E1.23379
+G1 X40.760 Y45.236 E1.26173
+G1 X42.586 Y45.025 E1.35543
+G1 X42.045 Y43.907 E1.37812
+G1 X42.541 Y45.508 E1.46216
+G1 X43.739 Y43.847 E1.52822
+G1 X44.740 Y43.759 E1.54607
+G1 X45.943 Y45.646 E1.58566
+G1 X46.842 Y44.326 E1.59836
+G1 X48.068 Y42.910 E1.68101
+G1 F1800 X47.470 Y43.105 E1.69411 ; extrude
+G1 X48.069 Y43.211 E1.78747
+G1 X49.373 Y42.056 E1.81266
+G1 X49.719 Y41.093 E1.85456
+G1 X49.134 Y40.926 E1.91289
+G1 X50.805 Y40.932 E1.96608
+M106 S112
+G0 F9000 X0.786 Y159.834
+G0 F9000 X94.699 Y145.039
+G1 X94.003 Y145.112 E2.02162
+G0 F9000 X112.059 Y49.699
+G1 X113.148 Y49.730 E2.07779
+G1 X112.921 Y50.180 E2.12835
+G1 X112.731 Y50.313 E2.17615
+G1 X114.237 Y52.082 E2.20211
+G1 X115.597 Y50.630 E2.21427
+G0 F9000 X48.128 Y14.624
+G1 X49.263 Y16.212 E2.22972
+G1 X47.835 Y17.744 E2.32647
+G1 X47.428 Y17.693 E2.42546
+G0 F9000 X86.304 Y103.121
+G1 F1800 X85.087 Y102.395 E2.49767 ; extrude
+G1 X84.849 Y100.467 E2.53082
+G1 X83.106 Y102.408 E2.60966
+G0 F9000 X53.113 Y7.918
+G1 X52.195 Y6.436 E2.65189
+G1 X51.229 Y5.033 E2.74380
+G1 X49.587 Y3.263 E2.81262
+G0 F9000 X187.670 Y126.888
+G1 X186.005 Y128.313 E2.81929
+G1 X185.362 Y128.525 E2.91195
+G0 F9000 X105.383 Y47.687
+G0 F9000 X32.290 Y10.076
+G1 X31.538 Y9.296 E2.98790
+G1 X30.249 Y8.684 E2.98972
+M106 S187
+G1 X29.007 Y8.583 E3.08318
+G1 X28.736 Y8.563 E3.16664
+G1 X29.487 Y10.493 E3.20092
+G1 F1800 X30.031 Y10.112 E3.23567 ; extrude
+G0 F9000 X14.145 Y148.178
+G1 X12.798 Y146.516 E3.31980
+G1 X11.925 Y145.485 E3.34910
+G0 F9000 X89.165 Y52.649
+G1 X91.055 Y52.837 E3.37355
+G1 X90.482 Y50.841 E3.41171
+G1 X89.286 Y50.860 E3.41221
+G0 F9000 X79.902 Y8.333
+G0 F9000 X60.849 Y46.562
+G1 X60.966 Y47.564 E3.47796
+G1 X60.524 Y46.869 E3.57643
+G1 X61.097 Y45.044 E3.65996
+G1 X62.032 Y46.293 E3.67389
+G1 X63.372 Y47.511 E3.75653
+G1 F1800 X64.103 Y48.285 E3.77953 ; extrude
+G0 F9000 X72.141 Y20.983
+G1 X72.376 Y21.494 E3.84215
+G1 X70.389 Y22.685 E3.91698
+G1 X71.026 Y20.949 E3.99066
+G0 F9000 X53.112 Y145.867
+G1 X54.071 Y147.770 E4.04005
+G1 X54.806 Y148.838 E4.10175
+G0 F9000 X29.485 Y50.788
+G1 F1800 X28.703 Y51.059 E4.10299 ; extrude
+G1 X29.391 Y51.828 E4.17057
+G1 X29.249 Y51.693 E4.18242
+G0 F9000 X195.625 Y187.251
+M106 S117
+G1 X197.498 Y187.049 E4.20928
+G1 X196.340 Y187.375 E4.22346
+G1 X194.871 Y188.655 E4.27433
+G1 F1800 X193.796 Y190.246 E4.32294 ; extrude
+;LAYER:119
+G0 Z0.400
+G1 X193.599 Y189.454 E4.33701
+G1 X194.960 Y187.461 E4.41209
+G0 F9000 X185.280 Y142.605
+G1 X184.439 Y142.094 E4.45138
+G1 F1800 X183.882 Y141.806 E4.47889 ; extrude
+G0 F9000 X166.935 Y57.125
+G1 X165.932 Y56.188 E4.52999
+G1 X167.757 Y57.725 E4.61119
+G1 F1800 X169.520 Y57.922 E4.68314 ; extrude
+G1 X169.323 Y58.932 E4.74759
+G0 F9000 X185.355 Y25.462
+G1 X184.730 Y24.653 E4.82150
+G1 X185.354 Y23.857 E4.87723
+G0 F9000 X32.331 Y41.575
+G1 X32.320 Y40.455 E4.96785
+G1 X30.878 Y39.224 E4.97693
+G0 F9000 X47.825 Y51.672
+G1 X49.374 Y52.670 E5.01820
+G1 X48.882 Y52.023 E5.02441
+G1 X47.385 Y52.037 E5.08737
+G1 X46.469 Y51.030 E5.12735
+G1 F1800 X47.864 Y52.522 E5.12953 ; extrude
+G1 F1800 X49.447 Y52.415 E5.18825 ; extrude
+G1 X51.154 Y53.717 E5.27379
+G1 X49.590 Y52.335 E5.32603
+G1 X50.477 Y52.924 E5.40251
+G1 X48.636 Y54.053 E5.42577
+G1 X47.851 Y52.565 E5.45095
+G1 X46.299 Y50.847 E5.50339
+G1 X45.193 Y51.251 E5.50444
+G1 X47.029 Y51.829 E5.59281
+G1 X46.017 Y53.672 E5.66328
+M107
+G1 X46.715 Y53.352 E5.68900
+G1 X45.622 Y51.488 E5.72281
+G1 X44.415 Y52.676 E5.79672
+G1 X46.294 Y51.923 E5.87872
+G1 X47.336 Y51.103 E5.97392
+G0 F9000 X44.665 Y83.406
+G1 X46.460 Y81.991 E6.01326
+G1 X45.028 Y80.199 E6.01928
+G1 X46.562 Y81.130 E6.11903
+G1 F1800 X45.304 Y82.873 E6.19366 ; extrude
+G1 X44.818 Y82.369 E6.22683
+;LAYER:164
+G0 Z0.500
+G1 X44.224 Y84.191 E6.23920
+G1 X43.651 Y85.477 E6.32140
+G0 F9000 X94.693 Y74.543
+G1 F1800 X93.465 Y74.000 E6.41110 ; extrude
+G1 F1800 X94.712 Y75.067 E6.41516 ; extrude
+G0 F9000 X184.015 Y51.403
+G1 X185.610 Y50.759 E6.44240
+G1 X184.658 Y51.626 E6.47404
+;LAYER:173
+G0 Z0.600
+G1 F1800 X186.324 Y52.162 E6.56837 ; extrude
+G1 X186.225 Y53.989 E6.66376
+G1 X185.945 Y53.963 E6.75657
+G1 X186.899 Y55.254 E6.83385
+G1 F1800 X186.177 Y54.701 E6.91208 ; extrude
+G0 F9000 X150.577 Y49.462
+G0 F9000 X6.773 Y110.519
+G1 X8.694 Y112.053 E7.01086
+G0 F9000 X19.285 Y99.695
+G1 X19.072 Y98.632 E7.05254
+G1 X20.064 Y100.020 E7.11899
+G1 X19.239 Y100.287 E7.15628
+G0 F9000 X49.486 Y49.068
+G0 F9000 X176.834 Y115.656
+G1 X176.418 Y117.626 E7.20701
+G1 X177.031 Y119.590 E7.21725
+G1 X178.393 Y121.247 E7.22128
+G0 F9000 X37.915 Y194.593
+G1 X39.635 Y194.082 E7.30790
+G1 X40.746 Y195.865 E7.31848
+G1 X39.617 Y195.340 E7.33261
+G1 F1800 X40.015 Y195.946 E7.35296 ; extrude
+G1 X40.728 Y194.687 E7.38418
+G1 X40.920 Y192.940 E7.39431
+G1 X41.477 Y191.304 E7.41068
+G1 X40.610 Y190.535 E7.50600
+G1 X40.039 Y190.201 E7.59243
+G1 F1800 X38.828 Y191.113 E7.61279 ; extrude
+G1 X38.523 Y192.394 E7.65342
+G1 X37.173 Y190.454 E7.70857
+G1 X35.529 Y190.942 E7.74565
+G0 F9000 X56.659 Y104.232
+G1 X55.094 Y104.194 E7.82614
+G0 F9000 X25.330 Y188.615
+G1 X25.261 Y186.829 E7.91875
+G1 X25.742 Y188.127 E7.93478
+G1 X25.360 Y189.512 E8.01770
+G1 X24.959 Y189.584 E8.05606
+G1 X25.859 Y191.173 E8.06017
+G1 X24.011 Y192.526 E8.07194
+G1 X24.520 Y191.751 E8.11395
+G1 F1800 X25.155 Y191.538 E8.15778 ; extrude
+G1 X25.113 Y190.479 E8.23414
+G1 X23.831 Y190.372 E8.24485
+G1 F1800 X22.198 Y190.140 E8.29586 ; extrude
+G1 X20.527 Y191.074 E8.37363
+G0 F9000 X100.785 Y75.573
+G1 X99.330 Y77.001 E8.47324
+G1 X98.104 Y78.928 E8.52243
+G1 F1800 X96.765 Y80.081 E8.61548 ; extrude
+G1 X97.790 Y78.716 E8.70514
+G1 X96.364 Y78.725 E8.79713
+G1 X96.388 Y78.001 E8.80081
+G0 F9000 X187.281 Y135.936
+G1 X185.956 Y137.075 E8.81232
+G1 X185.395 Y138.567 E8.86784
+G1 X183.813 Y140.539 E8.93082
+G1 X182.872 Y142.501 E8.98855
+G1 F1800 X182.641 Y141.208 E9.06291 ; extrude
+G1 X181.656 Y141.765 E9.16132
+G1 X180.907 Y139.772 E9.16470
+G1 X180.636 Y139.823 E9.25425
+G1 X181.248 Y137.912 E9.25451
+G0 F9000 X71.430 Y44.852
+G1 X71.787 Y43.669 E9.31690
+G0 F9000 X187.318 Y48.718
+G0 F9000 X19.161 Y127.642
+G1 F1800 X20.290 Y127.250 E9.34333 ; extrude
+G1 X20.539 Y126.651 E9.40789
+G1 F1800 X21.473 Y125.645 E9.49824 ; extrude
+G1 X21.097 Y124.596 E9.50408
+T1
+G1 X19.666 Y123.394 E9.56489
+G1 X20.920 Y122.092 E9.59582
+G0 F9000 X177.870 Y156.595
+G1 X175.896 Y157.973 E9.67034
+G1 X175.706 Y156.876 E9.68087
+G0 F9000 X67.103 Y149.931
+G1 X68.485 Y150.778 E9.70747
+G1 X69.638 Y150.871 E9.73400
+G1 X68.506 Y152.391 E9.73552
+G1 X69.482 Y154.170 E9.81014
+G1 X68.796 Y153.126 E9.90089
+G1 X69.457 Y155.042 E9.94784
+G1 X70.887 Y154.791 E10.02031
+G1 X69.735 Y155.282 E10.02809
+G0 F9000 X5.381 Y21.336
+G1 F1800 X4.760 Y19.903 E10.03096 ; extrude
+G1 F1800 X5.295 Y20.691 E10.10464 ; extrude
+G1 X4.749 Y21.961 E10.18659
+G0 F9000 X173.558 Y182.882
+G1 F1800 X171.987 Y181.705 E10.19779 ; extrude
+G1 X173.235 Y182.241 E10.28030
+G1 X171.635 Y180.633 E10.35603
+G1 X171.330 Y178.716 E10.38170
+G1 X170.802 Y178.000 E10.47810
+G1 X171.275 Y176.124 E10.51940
+G1 X170.662 Y176.942 E10.57318
+G1 F1800 X169.025 Y178.222 E10.59022 ; extrude
+G1 X170.074 Y180.133 E10.59066
+G1 X171.261 Y178.871 E10.64011
+G1 X170.304 Y180.647 E10.66849
+G1 F1800 X170.297 Y179.086 E10.73214 ; extrude
+G1 X171.085 Y180.234 E10.79493
+G1 X170.664 Y181.796 E10.80355
+G0 F9000 X41.223 Y52.639
+G1 X41.228 Y52.156 E10.89195
+G1 X41.354 Y53.174 E10.96725
+G1 X40.661 Y51.796 E11.05156
+G1 X39.339 Y51.551 E11.12890
+G0 F9000 X92.404 Y177.025
+G1 X91.170 Y176.231 E11.19922
+G0 F9000 X31.197 Y49.516
+G1 X31.286 Y48.160 E11.23203
+G1 X32.201 Y46.567 E11.32826
+G1 X34.136 Y47.747 E11.40159
+G0 F9000 X127.596 Y21.374
+G1 X127.150 Y19.510 E11.44150
+G1 X127.151 Y20.039 E11.48782
+G1 X126.770 Y21.003 E11.57862
+G1 X127.767 Y20.688 E11.60148
+G1 X128.863 Y21.488 E11.68673
+G1 F1800 X128.679 Y20.740 E11.74955 ; extrude
+G1 X129.808 Y21.593 E11.81251
+G1 X129.629 Y22.079 E11.85345
+G1 X128.361 Y22.697 E11.93127
+G1 X130.260 Y20.849 E11.98560
+G1 X132.022 Y20.926 E11.99571
+G1 X132.891 Y20.975 E12.05964
+G1 X132.532 Y22.767 E12.08065
+G1 X133.583 Y21.256 E12.17909
+G0 F9000 X54.871 Y79.937
+T0
+G1 X55.664 Y79.345 E12.20561
+G1 X57.424 Y79.454 E12.22750
+G1 X56.272 Y77.971 E12.30516
+G1 X56.149 Y78.219 E12.32776
+G1 X56.704 Y79.494 E12.40938
+G1 X56.897 Y77.995 E12.49275
+G1 X55.967 Y77.499 E12.51811
+G0 F9000 X0.539 Y144.358
+G1 X-0.481 Y143.565 E12.56606
+G1 X0.156 Y143.015 E12.65894
+G0 F9000 X165.580 Y181.161
+G1 F1800 X164.142 Y182.487 E12.72225 ; extrude
+T1
+G1 X163.142 Y180.893 E12.73652
+G1 X162.527 Y179.503 E12.82693
+G0 F9000 X178.227 Y121.673
+G1 X178.901 Y123.249 E12.90574
+G0 F9000 X138.559 Y106.159
+G1 X138.313 Y107.690 E12.96125
+G1 X136.870 Y107.662 E12.96709
+G0 F9000 X98.274 Y99.635
+G1 X99.726 Y97.662 E13.05117
+G1 X100.387 Y99.024 E13.08867
+G1 F1800 X98.689 Y99.572 E13.15228 ; extrude
+G1 X99.419 Y101.298 E13.18532
+G1 X99.358 Y102.888 E13.18871
+G1 X98.712 Y104.335 E13.22533
+G1 X99.795 Y103.178 E13.26885
+G1 X101.101 Y102.349 E13.35162
+G1 X100.188 Y102.375 E13.44912
+G1 X99.512 Y101.643 E13.47904
+G1 X100.649 Y99.804 E13.55131
+G1 X98.847 Y99.005 E13.55193
+G1 X99.282 Y99.637 E13.63083
+G1 X99.749 Y100.145 E13.70047
+G1 X98.599 Y100.813 E13.74626
+G0 F9000 X36.260 Y7.396
+G1 X37.916 Y8.018 E13.78315
+G1 X38.164 Y7.050 E13.81335
+G1 F1800 X37.887 Y7.617 E13.90674 ; extrude
+G1 X36.045 Y6.093 E13.98777
+G1 X35.830 Y4.149 E14.02649
+G1 X37.754 Y4.051 E14.06773
+G1 F1800 X36.603 Y2.658 E14.06928 ; extrude
+G1 X35.089 Y4.524 E14.07810
+G0 F9000 X3.555 Y143.870
+G1 X4.490 Y142.620 E14.08311
+G1 X5.912 Y143.539 E14.09154
+G1 X5.754 Y145.268 E14.11694
+G1 X3.800 Y143.327 E14.18201
+G0 F9000 X62.213 Y145.888
+G0 F9000 X172.194 Y97.266
+G0 F9000 X73.513 Y114.993
+G1 X74.221 Y113.572 E14.26175
+G1 X74.739 Y113.244 E14.30032
+G1 F1800 X75.878 Y113.511 E14.32956 ; extrude
+G1 X76.691 Y114.821 E14.36277
+G1 X78.016 Y115.226 E14.39363
+G1 X77.523 Y115.965 E14.45380
+G1 X76.656 Y113.972 E14.48011
+G1 X77.920 Y115.521 E14.48434
+G1 X79.389 Y115.809 E14.51172
+G1 F1800 X80.127 Y117.464 E14.54641 ; extrude
+G1 X81.317 Y116.266 E14.62143
+G1 X81.745 Y116.976 E14.66796
+G1 F1800 X82.749 Y118.143 E14.71393 ; extrude
+G1 X83.838 Y117.074 E14.77189
+G1 X83.925 Y116.981 E14.83082
+G0 F9000 X36.139 Y140.213
+G1 X36.396 Y139.823 E14.88254
+G0 F9000 X199.428 Y74.808
+G0 F9000 X126.548 Y157.470
+G0 F9000 X119.442 Y68.984
+G1 X117.525 Y67.119 E14.98158
+G1 X117.793 Y66.165 E15.05950
+G1 X118.862 Y67.440 E15.15585
+G0 F9000 X40.198 Y36.147
+G0 F9000 X10.200 Y111.476
+G1 F1800 X10.033 Y113.265 E15.24684 ; extrude
+G1 X9.622 Y111.745 E15.34277
+G1 X10.185 Y113.570 E15.40974
+G1 X8.824 Y115.433 E15.50892
+G0 F9000 X51.172 Y70.402
+G1 X52.791 Y71.751 E15.51362
+G1 X53.377 Y73.693 E15.51920
+G1 X55.135 Y74.400 E15.54908
+G1 X53.557 Y73.696 E15.57478
+G1 X52.231 Y72.650 E15.58909
+T1
+G0 F9000 X7.203 Y185.536
+G1 X8.938 Y187.003 E15.67796
+G1 X7.326 Y188.718 E15.76219
+G1 X6.685 Y190.010 E15.80994
+G0 F9000 X44.330 Y11.345
+G1 X44.544 Y9.924 E15.89701
+G1 X43.166 Y9.009 E15.98097
+G0 F9000 X98.201 Y63.613
+G1 X96.658 Y65.528 E15.98666
+G1 X95.503 Y65.438 E16.01528
+G1 X94.960 Y67.402 E16.11509
+G0 F9000 X57.886 Y179.240
+G0 F9000 X145.295 Y58.705
+G1 X143.359 Y59.933 E16.14918
+;LAYER:410
+G0 Z0.700
+G1 X143.465 Y58.676 E16.19270
+G1 X143.750 Y57.229 E16.21072
+G1 X142.537 Y55.546 E16.21946
+G1 X141.633 Y54.370 E16.28070
+G1 X141.965 Y53.179 E16.28727
+G1 X142.851 Y51.400 E16.36834
+G1 X144.309 Y51.372 E16.36988
+G1 X145.797 Y50.438 E16.38849
+G1 F1800 X144.451 Y49.922 E16.44797 ; extrude
+G1 X144.234 Y49.985 E16.46005
+G1 X145.696 Y49.269 E16.53117
+G1 X143.941 Y50.760 E16.62658
+G1 X144.063 Y50.909 E16.62864
+G1 X142.793 Y49.320 E16.65369
+G0 F9000 X19.294 Y139.793
+G0 F9000 X3.537 Y119.880
+G1 X3.629 Y120.690 E16.66398
+G1 X1.810 Y119.182 E16.71334
+G1 X0.298 Y118.805 E16.72703
+G1 X-1.113 Y119.096 E16.80169
+G1 X0.637 Y118.651 E16.84374
+G1 X0.220 Y120.417 E16.92143
+G1 X-0.440 Y120.159 E17.01955
+G1 X0.820 Y121.549 E17.02491
+G1 X2.558 Y120.547 E17.06712
+G1 X2.681 Y118.824 E17.11042
+M107
+G0 F9000 X193.939 Y155.316
+G1 X194.472 Y156.553 E17.19886
+G0 F9000 X128.315 Y53.154
+G1 X127.409 Y53.323 E17.29130
+G1 X127.490 Y53.058 E17.38639
+G1 X128.080 Y51.540 E17.44581
+G1 X127.154 Y51.405 E17.49920
+G0 F9000 X26.274 Y58.720
+G1 X25.427 Y57.693 E17.50798
+G1 X25.867 Y57.974 E17.57302
+G1 X25.710 Y58.166 E17.63430
+G1 X24.679 Y57.053 E17.68554
+G1 X22.727 Y56.463 E17.77173
+G1 X22.693 Y55.603 E17.87048
+G1 X21.327 Y53.870 E17.95761
+G0 F9000 X77.577 Y87.979
+G1 X76.014 Y86.880 E18.05354
+G0 F9000 X67.403 Y70.491
+G1 X67.868 Y71.891 E18.13566
+G1 X68.841 Y72.930 E18.18318
+G1 F1800 X70.500 Y71.439 E18.27026 ; extrude
+G1 X70.844 Y71.430 E18.36654
+G1 X71.978 Y72.921 E18.42727
+G1 X71.810 Y73.813 E18.45656
+G1 X71.348 Y73.101 E18.53527
+G1 X71.124 Y71.838 E18.56567
+G1 X71.450 Y70.190 E18.65769
+G1 X72.803 Y72.025 E18.67812
+G1 X70.846 Y70.215 E18.73462
+G1 X71.940 Y70.369 E18.83445
+G1 X72.681 Y69.927 E18.87022
+G1 F1800 X74.472 Y70.633 E18.92274 ; extrude
+G1 X74.076 Y70.878 E18.98015
+G1 X74.023 Y70.639 E19.04261
+G1 X74.143 Y71.902 E19.05968
+G1 X75.447 Y71.953 E19.07073
+G1 X76.730 Y73.914 E19.15955
+G0 F9000 X57.985 Y102.321
+G1 X56.738 Y101.051 E19.22256
+G1 X58.713 Y101.597 E19.22679
+G1 X57.940 Y102.360 E19.22718
+G1 X58.284 Y103.032 E19.24685
+G1 X57.349 Y103.619 E19.29999
+G1 X56.993 Y102.105 E19.31567
+G0 F9000 X20.021 Y34.107
+G1 F1800 X21.313 Y34.559 E19.39633 ; extrude
+T1
+G1 X22.175 Y33.975 E19.41327
+G0 F9000 X180.771 Y116.452
+G1 X180.570 Y115.994 E19.41874
+G1 X182.409 Y115.753 E19.48076
+G0 F9000 X186.165 Y170.943
+G1 X187.760 Y172.207 E19.51113
+G1 X187.742 Y174.006 E19.53542
+G1 X186.628 Y173.242 E19.62295
+G1 X185.601 Y171.936 E19.65879
+G1 X184.764 Y172.182 E19.67028
+G1 X184.377 Y170.444 E19.68261
+G1 X183.357 Y169.209 E19.71097
+G0 F9000 X132.855 Y68.284
+G0 F9000 X141.174 Y18.526
+G1 X142.514 Y17.037 E19.75530
+G1 X141.151 Y16.449 E19.82754
+G1 X139.983 Y18.253 E19.87803
+G1 X138.507 Y19.079 E19.90410
+G1 X137.979 Y18.064 E19.96492
+G1 X136.470 Y18.116 E20.01918
+G1 X136.010 Y18.746 E20.07595
+G1 X134.354 Y17.454 E20.16105
+G1 X132.790 Y17.702 E20.19720
+G1 X131.053 Y16.947 E20.21984
+G1 X130.183 Y16.561 E20.31073
+G1 F1800 X131.628 Y15.089 E20.33839 ; extrude
+G1 X132.282 Y14.495 E20.37964
+G1 X131.276 Y15.882 E20.41485
+G0 F9000 X23.046 Y182.537
+G1 X23.897 Y180.699 E20.41885
+G0 F9000 X60.615 Y76.148
+G0 F9000 X62.183 Y127.663
+G0 F9000 X167.893 Y114.033
+G1 X166.912 Y113.773 E20.48729
+;LAYER:519
+G0 Z0.800
+G1 X168.018 Y112.918 E20.49158
+G1 X166.207 Y111.896 E20.50270
+G1 X167.865 Y112.894 E20.51131
+G1 F1800 X168.855 Y114.209 E20.53943 ; extrude
+G1 X168.551 Y115.930 E20.60859
+G1 X169.064 Y115.741 E20.61402
+G1 X169.111 Y117.453 E20.62679
+G0 F9000 X140.548 Y161.147
+G1 X140.734 Y163.024 E20.69054
+G1 X138.971 Y162.456 E20.73170
+G1 X137.517 Y163.284 E20.79874
+G1 X137.579 Y163.064 E20.89232
+G1 X139.118 Y161.631 E20.94865
+G1 X139.311 Y162.673 E20.96557
+G1 X139.155 Y163.738 E21.04869
+G1 X138.597 Y162.564 E21.05472
+G0 F9000 X140.325 Y89.604
+G0 F9000 X64.894 Y93.732
+G1 X63.567 Y92.019 E21.05580
+G1 X61.902 Y92.888 E21.15382
+G0 F9000 X97.775 Y86.848
+G0 F9000 X108.614 Y1.660
+G1 X109.192 Y2.171 E21.24735
+G1 X108.176 Y0.726 E21.25011
+G1 X107.362 Y-0.531 E21.31392
+G1 X106.035 Y0.607 E21.39696
+G1 X104.774 Y1.909 E21.42898
+G1 F1800 X104.251 Y3.234 E21.45292 ; extrude
+G1 X104.764 Y4.513 E21.52347
+G1 X104.741 Y4.511 E21.53922
+G1 X103.062 Y5.263 E21.55559
+G1 X101.421 Y3.423 E21.59954
+G1 X99.432 Y4.786 E21.68507
+G1 X98.565 Y5.433 E21.73653
+G1 X98.320 Y6.097 E21.81914
+G0 F9000 X59.148 Y88.631
+G1 X58.540 Y87.413 E21.82764
+G1 X60.426 Y89.048 E21.91419
+G1 X60.905 Y90.292 E21.92019
+G1 X60.093 Y90.577 E22.01547
+G1 F1800 X59.291 Y89.950 E22.10398 ; extrude
+G0 F9000 X135.737 Y89.469
+G0 F9000 X132.096 Y74.402
+G1 X131.762 Y74.522 E22.16046
+G0 F9000 X36.100 Y177.999
+G1 F1800 X34.549 Y179.447 E22.18581 ; extrude
+G1 X33.556 Y179.404 E22.24121
+G1 F1800 X32.008 Y179.457 E22.30006 ; extrude
+G1 X30.302 Y179.215 E22.38640
+G1 X31.329 Y177.674 E22.48547
+G0 F9000 X166.042 Y78.393
+G0 F9000 X192.007 Y112.607
+G1 X190.554 Y113.711 E22.49122
+G1 X188.615 Y114.089 E22.51254
+G1 X188.318 Y115.643 E22.57465
+G1 X189.988 Y117.126 E22.59146
+G1 X191.043 Y117.848 E22.67402
+G1 F1800 X191.992 Y119.640 E22.74620 ; extrude
+G1 X190.391 Y119.836 E22.82650
+G1 X191.091 Y118.854 E22.84581
+G1 X191.417 Y117.308 E22.84791
+G1 X190.158 Y117.525 E22.87691
+G1 X188.735 Y119.027 E22.93076
+G1 X190.530 Y117.082 E22.96499
+G1 X192.022 Y118.284 E22.96854
+G1 X192.740 Y117.854 E23.01611
+G1 F1800 X192.314 Y119.346 E23.07720 ; extrude
+G1 F1800 X191.179 Y120.922 E23.13612 ; extrude
+G0 F9000 X72.197 Y93.552
+G1 X71.749 Y92.967 E23.13672
+G1 F1800 X69.831 Y92.804 E23.23536 ; extrude
+G0 F9000 X134.195 Y54.533
+G1 X134.195 Y53.582 E23.29226
+G1 X136.164 Y51.718 E23.34832
+G1 X137.261 Y52.250 E23.41178
+G1 X138.442 Y53.742 E23.50565
+G1 X139.495 Y54.700 E23.55654
+G1 X139.698 Y54.324 E23.56258
+G1 X141.652 Y54.250 E23.59931
+G1 X141.049 Y52.792 E23.60003
+G1 X140.831 Y53.067 E23.63027
+G0 F9000 X60.298 Y61.699
+G1 X60.503 Y63.449 E23.66432
+G1 X58.823 Y62.164 E23.72237
+G1 F1800 X59.921 Y61.877 E23.80920 ; extrude
+G1 F1800 X61.517 Y60.981 E23.83495 ; extrude
+G0 F9000 X53.610 Y140.879
+G1 X53.209 Y139.680 E23.89524
+G1 X51.995 Y140.616 E23.99156
+G0 F9000 X161.894 Y175.103
+G1 X160.441 Y173.856 E24.04525
+G1 X162.132 Y172.705 E24.07793
+G1 F1800 X161.754 Y173.421 E24.11170 ; extrude
+G1 X159.935 Y173.926 E24.14516
+G1 X158.963 Y173.779 E24.14652
+G1 X160.914 Y172.004 E24.20791
+G1 X159.287 Y170.628 E24.22218
+G0 F9000 X162.803 Y84.646
+G1 X163.157 Y84.866 E24.28791
+G1 X164.122 Y83.898 E24.35906
+G1 X163.359 Y84.988 E24.45680
+G1 F1800 X163.452 Y86.752 E24.46998 ; extrude
+G1 X164.073 Y87.848 E24.50623
+G1 X165.100 Y86.208 E24.50903
+G0 F9000 X100.370 Y111.050
+G0 F9000 X187.949 Y73.122
+G0 F9000 X35.486 Y147.549
+G1 X34.134 Y145.666 E24.58684
+G1 X34.130 Y146.210 E24.62126
+G1 X33.425 Y147.824 E24.63204
+G0 F9000 X129.092 Y80.371
+G1 X127.332 Y80.628 E24.67303
+G1 X127.840 Y79.524 E24.69823
+G1 X126.766 Y78.337 E24.77414
+G1 X128.743 Y77.203 E24.83110
+G1 X130.220 Y76.272 E24.90625
+G1 X129.546 Y76.214 E24.99535
+G1 X129.937 Y76.027 E25.05327
+G1 X131.471 Y75.468 E25.13125
+G0 F9000 X172.793 Y198.965
+G1 F1800 X170.891 Y197.411 E25.22868 ; extrude
+G1 X169.494 Y198.355 E25.23844
+G1 X167.855 Y197.713 E25.33029
+G1 X169.774 Y195.845 E25.35375
+G1 X167.925 Y195.864 E25.37691
+G0 F9000 X3.987 Y198.156
+G1 X5.501 Y196.638 E25.42565
+G1 X4.217 Y197.379 E25.44044
+G1 X2.667 Y196.794 E25.49007
+G1 X1.527 Y198.664 E25.57838
+G1 F1800 X0.236 Y197.722 E25.58528 ; extrude
+G1 F1800 X-0.131 Y197.949 E25.62154 ; extrude
+G1 X0.481 Y198.125 E25.67642
+G1 X1.977 Y198.996 E25.71635
+G1 X3.869 Y198.544 E25.75489
+G0 F9000 X199.671 Y1.050
+G1 X201.376 Y0.069 E25.81598
+G1 X200.170 Y-1.466 E25.90028
+G1 X198.368 Y-0.690 E25.93272
+G1 X197.630 Y1.197 E25.93282
+G1 X197.671 Y1.566 E26.03229
+G1 X198.644 Y1.081 E26.10351
+G1 X199.095 Y1.790 E26.13572
+G1 X197.988 Y2.240 E26.16221
+G1 X198.875 Y2.328 E26.20988
+G0 F9000 X185.466 Y105.750
+G1 X185.576 Y107.003 E26.23374
+G1 X185.417 Y107.565 E26.31648
+G1 X183.590 Y107.091 E26.39970
+G0 F9000 X30.769 Y50.296
+G0 F9000 X71.329 Y160.643
+G1 X71.141 Y158.995 E26.43925
+G1 X70.938 Y158.908 E26.51908
+G0 F9000 X136.036 Y73.385
+G1 X134.987 Y72.868 E26.55309
+M106 S51
+G1 X133.217 Y71.582 E26.62491
+G1 X132.185 Y72.918 E26.63404
+G1 X130.992 Y72.611 E26.71327
+G1 X129.167 Y72.381 E26.74999
+G1 X128.799 Y72.974 E26.83107
+G1 X129.114 Y74.673 E26.85023
+G1 F1800 X128.603 Y75.336 E26.88318 ; extrude
+G1 X128.121 Y75.439 E26.93284
+G1 X126.223 Y75.810 E26.97909
+G1 X125.883 Y75.704 E27.06813
+G1 X125.930 Y77.003 E27.13516
+G1 X124.092 Y77.722 E27.19055
+G1 X122.565 Y76.605 E27.19826
+G0 F9000 X17.650 Y150.662
+G1 X15.870 Y151.386 E27.26937
+G0 F9000 X138.203 Y83.585
+G1 X140.195 Y84.852 E27.35656
+G1 X140.268 Y82.876 E27.45543
+G1 X139.520 Y81.896 E27.54132
+G1 X139.201 Y80.101 E27.57177
+G1 F1800 X140.628 Y79.129 E27.59197 ; extrude
+G1 X140.123 Y78.986 E27.64087
+G1 X141.329 Y77.787 E27.73280
+G0 F9000 X62.853 Y106.616
+G1 X63.113 Y105.910 E27.76016
+G1 X63.955 Y107.120 E27.81937
+G1 X63.735 Y108.632 E27.82514
+G1 X61.931 Y110.083 E27.83233
+G0 F9000 X184.480 Y112.212
+G1 X184.473 Y112.907 E27.89983
+G1 X185.826 Y111.490 E27.99162
+G0 F9000 X19.047 Y156.851
+G1 X18.706 Y157.486 E28.01737
+G1 F1800 X17.325 Y155.713 E28.08695 ; extrude
+G1 X16.500 Y154.643 E28.14515
+G1 X15.116 Y156.291 E28.17759
+G0 F9000 X159.874 Y196.020
+G1 X158.006 Y195.539 E28.24167
+G1 X156.381 Y195.397 E28.31449
+G1 X154.838 Y196.711 E28.32671
+G1 X156.596 Y196.817 E28.35578
+G1 X156.582 Y198.536 E28.36508
+G1 X156.973 Y198.699 E28.37392
+G1 X158.545 Y200.080 E28.39664
+G0 F9000 X119.759 Y193.471
+G1 X121.536 Y194.097 E28.40165
+G1 X120.526 Y195.066 E28.41953
+G1 X118.804 Y195.303 E28.42910
+G1 X119.186 Y195.149 E28.43247
+G0 F9000 X129.362 Y26.394
+G1 X128.774 Y25.893 E28.49879
+G0 F9000 X188.309 Y66.326
+G1 F1800 X189.803 Y66.247 E28.51369 ; extrude
+G1 X188.271 Y66.232 E28.56729
+G1 X186.927 Y66.374 E28.61797
+G0 F9000 X80.744 Y40.692
+G0 F9000 X47.977 Y174.305
+G1 X49.539 Y172.366 E28.71230
+G1 X49.821 Y173.122 E28.73523
+G0 F9000 X52.835 Y6.184
+G1 F1800 X52.907 Y5.352 E28.82428 ; extrude
+G1 X51.843 Y5.733 E28.90268
+G0 F9000 X49.150 Y119.836
+G1 X47.315 Y120.309 E28.97186
+G1 F1800 X48.557 Y120.156 E29.06395 ; extrude
+G1 X48.205 Y119.784 E29.07275
+G1 X48.920 Y118.389 E29.10718
+G0 F9000 X43.929 Y66.212
+G1 X45.918 Y67.378 E29.15515
+G1 X47.550 Y68.384 E29.21879
+G1 X48.933 Y69.531 E29.22803
+G1 X47.582 Y71.394 E29.29530
+G0 F9000 X165.686 Y187.427
+G1 X166.666 Y188.756 E29.37552
+G1 X167.966 Y189.894 E29.46260
+G1 X168.093 Y191.678 E29.47419
+G1 X167.101 Y193.031 E29.49740
+G1 X166.048 Y193.002 E29.58821
+G1 X165.616 Y194.137 E29.66757
+G1 X166.919 Y193.762 E29.67628
+G1 X166.277 Y194.142 E29.75991
+;LAYER:757
+G0 Z0.900
+G1 X164.343 Y192.584 E29.84115
+G1 X164.172 Y191.926 E29.86252
+G1 X164.650 Y191.094 E29.87131
+G1 X164.418 Y191.738 E29.95203
+G1 X162.584 Y193.030 E29.97044
+G1 X162.033 Y191.927 E30.05942
+G1 X161.611 Y191.925 E30.15500
+G1 X160.368 Y193.248 E30.17122
+;LAYER:766
+G0 Z1.000
+G0 F9000 X189.001 Y90.914
+G1 X188.004 Y90.323 E30.18131
+G1 X188.060 Y89.830 E30.27418
+G1 X186.363 Y90.326 E30.31859
+G1 X187.008 Y90.854 E30.35617
+G1 X188.637 Y90.846 E30.39254
+G0 F9000 X166.963 Y136.707
+G1 X166.754 Y137.711 E30.48165
+G1 X164.894 Y137.012 E30.49535
+G1 F1800 X163.472 Y137.362 E30.55303 ; extrude
+G1 X164.462 Y137.928 E30.58112
+G1 X164.639 Y137.611 E30.67893
+G1 X165.345 Y137.133 E30.77524
+G1 X164.455 Y135.780 E30.83275
+G1 X163.844 Y134.340 E30.88435
+G0 F9000 X147.669 Y34.135
+G1 X145.883 Y33.326 E30.92265
+G1 X144.631 Y32.564 E31.01702
+G1 X144.385 Y30.997 E31.04304
+G1 X146.239 Y30.065 E31.06344
+G1 X147.588 Y30.613 E31.14130
+G0 F9000 X151.415 Y94.044
+G1 X152.098 Y95.054 E31.16884
+G1 X152.215 Y94.208 E31.23186
+G1 X150.381 Y95.514 E31.28851
+G1 X149.443 Y94.488 E31.29550
+G1 X150.155 Y94.139 E31.37627
+G1 X150.734 Y96.008 E31.43966
+G1 X150.312 Y97.769 E31.51391
+G1 X151.535 Y97.168 E31.53248
+G1 X151.620 Y97.846 E31.62263
+G1 X149.884 Y97.499 E31.67285
+G1 X150.195 Y97.114 E31.73022
+G1 X151.349 Y98.467 E31.74533
+G1 X151.351 Y100.061 E31.83522
+G1 X151.946 Y101.575 E31.84834
+G1 X152.396 Y100.676 E31.85507
+G1 F1800 X151.488 Y99.528 E31.87746 ; extrude
+G1 X153.387 Y100.736 E31.91343
+G0 F9000 X167.719 Y65.028
+;LAYER:807
+G0 Z1.100
+G1 X166.274 Y64.129 E31.91934
+G1 X167.504 Y62.287 E32.00208
+G1 X168.021 Y61.647 E32.03519
+G1 X169.195 Y60.483 E32.11913
+G1 X167.317 Y61.596 E32.12196
+G1 X165.569 Y62.116 E32.19442
+G1 X165.618 Y62.471 E32.21704
+G1 X166.835 Y64.316 E32.24999
+G0 F9000 X95.575 Y26.749
+G1 X96.306 Y27.582 E32.29545
+G0 F9000 X80.575 Y56.516
+G0 F9000 X147.199 Y103.242
+G1 X145.990 Y104.057 E32.31513
+G1 X146.795 Y105.949 E32.38989
+G1 X147.685 Y106.827 E32.39616
+T1
+G1 X148.205 Y105.882 E32.43170
+G1 X150.171 Y105.105 E32.43613
+G1 X151.767 Y106.323 E32.48163
+G0 F9000 X30.775 Y155.494
+G1 X32.737 Y157.141 E32.56111
+G1 X31.251 Y155.576 E32.61745
+G1 X30.258 Y153.661 E32.70834
+G1 X32.181 Y153.408 E32.78158
+G1 X33.546 Y151.944 E32.78286
+G1 X33.062 Y149.980 E32.86590
+G1 F1800 X31.235 Y151.536 E32.91931 ; extrude
+G1 X31.733 Y153.077 E32.96777
+G1 X30.707 Y154.701 E33.00603
+G1 X29.212 Y153.500 E33.05167
+G1 X30.040 Y153.259 E33.05842
+G0 F9000 X94.132 Y80.043
+G1 X94.987 Y79.002 E33.12338
+G1 F1800 X93.554 Y80.638 E33.18329 ; extrude
+G1 X95.501 Y79.553 E33.22252
+G1 F1800 X96.037 Y80.520 E33.22634 ; extrude
+G1 X97.248 Y78.672 E33.23121
+G1 X96.126 Y79.360 E33.32425
+G1 X95.178 Y77.973 E33.32607
+G0 F9000 X194.631 Y141.996
+G0 F9000 X161.413 Y32.563
+G1 X159.836 Y33.711 E33.41504
+;LAYER:850
+G0 Z1.200
+G1 X160.060 Y34.997 E33.46528
+G1 X161.258 Y33.307 E33.47071
+G1 F1800 X160.845 Y31.338 E33.54521 ; extrude
+G1 X162.092 Y31.170 E33.55742
+G1 X161.808 Y29.611 E33.65507
+G1 X160.184 Y30.532 E33.74004
+G0 F9000 X73.517 Y60.545
+G1 X72.109 Y60.970 E33.83790
+;LAYER:859
+G0 Z1.300
+G0 F9000 X22.734 Y138.493
+G1 X22.814 Y138.315 E33.87864
+G1 X24.480 Y139.246 E33.95829
+G1 X25.347 Y137.368 E34.02638
+G1 X26.859 Y136.087 E34.12065
+G1 X25.870 Y135.290 E34.15550
+G0 F9000 X88.576 Y196.175
+G1 X90.305 Y197.224 E34.23918
+G1 F1800 X89.402 Y196.223 E34.28043 ; extrude
+G1 X90.947 Y197.907 E34.31330
+G1 X92.506 Y199.085 E34.36650
+G1 X91.761 Y199.593 E34.40321
+G1 X90.405 Y199.717 E34.46821
+G1 X90.035 Y201.372 E34.53719
+G0 F9000 X42.474 Y57.478
+G1 X40.529 Y56.519 E34.60877
+G0 F9000 X87.598 Y137.376
+G1 X88.583 Y138.388 E34.63361
+G0 F9000 X138.229 Y41.843
+G1 X140.087 Y42.416 E34.69273
+G1 F1800 X140.866 Y41.632 E34.69912 ; extrude
+T0
+G0 F9000 X22.573 Y98.739
+G1 X23.323 Y97.832 E34.77607
+G0 F9000 X60.633 Y81.789
+G1 X60.413 Y82.702 E34.78555
+G1 X61.742 Y80.825 E34.86843
+G1 F1800 X62.953 Y81.508 E34.89619 ; extrude
+G0 F9000 X180.977 Y31.607
+G1 X181.325 Y32.252 E34.91425
+G0 F9000 X196.540 Y76.602
+G1 F1800 X196.819 Y75.495 E34.92073 ; extrude
+G1 X195.339 Y77.348 E34.95710
+G0 F9000 X157.596 Y50.329
+G1 X157.688 Y48.775 E34.98192
+G1 X157.211 Y49.834 E35.00432
+G1 X156.748 Y49.296 E35.06847
+G1 X154.950 Y49.950 E35.15211
+G0 F9000 X87.669 Y23.169
+G1 X88.515 Y21.544 E35.16388
+G0 F9000 X46.149 Y88.053
+G0 F9000 X13.581 Y72.228
+G1 X15.327 Y72.447 E35.17104
+G1 X15.579 Y73.928 E35.26728
+G0 F9000 X188.739 Y104.968
+G1 F1800 X187.421 Y106.427 E35.28852 ; extrude
+G1 F1800 X189.118 Y106.270 E35.36165 ; extrude
+G1 X188.389 Y105.092 E35.42795
+G0 F9000 X196.836 Y96.316
+G0 F9000 X2.176 Y130.594
+G1 X0.274 Y130.476 E35.50199
+G1 X0.270 Y130.895 E35.56711
+G1 X2.052 Y131.857 E35.65284
+G1 X0.779 Y130.764 E35.71263
+G0 F9000 X43.394 Y7.182
+G1 X41.956 Y5.948 E35.78753
+G1 X41.563 Y6.664 E35.78879
+G1 X41.472 Y6.711 E35.88362
+G1 X41.957 Y5.576 E35.96701
+G1 X41.783 Y4.482 E36.06313
+G1 X41.156 Y5.156 E36.06543
+G0 F9000 X165.606 Y0.032
+G1 X164.637 Y-0.152 E36.12161
+G0 F9000 X48.088 Y24.107
+G1 X46.685 Y22.655 E36.17384
+G1 X44.912 Y21.593 E36.19059
+G1 X44.548 Y23.146 E36.25676
+G1 F1800 X43.624 Y24.914 E36.29753 ; extrude
+G1 X42.040 Y22.984 E36.32649
+G1 X43.522 Y22.665 E36.37943
+G1 X44.136 Y22.716 E36.39109
+G1 X44.481 Y23.920 E36.48097
+G0 F9000 X15.204 Y179.508
+G1 X13.930 Y180.277 E36.50654
+G1 X14.026 Y180.986 E36.51388
+G1 F1800 X13.913 Y181.675 E36.59384 ; extrude
+G1 X14.624 Y182.511 E36.65859
+G1 X15.767 Y181.443 E36.70165
+G1 X15.404 Y183.289 E36.79166
+G1 X14.842 Y183.943 E36.86835
+G1 X13.702 Y183.007 E36.87192
+G1 X13.385 Y181.318 E36.93015
+G1 X12.808 Y182.136 E36.97388
+G1 X10.878 Y182.840 E36.98997
+G1 X11.946 Y184.182 E37.05418
+G1 X13.811 Y182.967 E37.13080
+G1 X15.097 Y183.371 E37.21576
+G1 X13.890 Y181.432 E37.26925
+G1 X12.171 Y179.451 E37.28657
+;LAYER:949
+G0 Z1.400
+G1 F1800 X11.231 Y180.295 E37.38529 ; extrude
+G0 F9000 X186.922 Y193.992
+G0 F9000 X67.071 Y104.465
+G1 F1800 X66.741 Y104.380 E37.41114 ; extrude
+G0 F9000 X32.492 Y18.279
+G1 X33.278 Y17.331 E37.49032
+G1 X33.246 Y16.084 E37.58321
+G0 F9000 X30.784 Y138.526
+G1 X31.652 Y137.444 E37.66293
+G0 F9000 X117.243 Y38.259
+G1 F1800 X118.459 Y39.424 E37.68605 ; extrude
+G1 X118.719 Y37.977 E37.70532
+G0 F9000 X126.792 Y48.185
+G1 F1800 X126.486 Y48.317 E37.77777 ; extrude
+G1 X125.370 Y47.480 E37.84175
+G1 X126.977 Y46.299 E37.87286
+G1 X125.607 Y45.204 E37.94999
+G1 X127.441 Y46.382 E37.98096
+G1 F1800 X125.664 Y46.818 E37.98987 ; extrude
+G1 X124.269 Y48.545 E38.07760
+G0 F9000 X23.917 Y101.360
+G1 X23.368 Y102.225 E38.13053
+G0 F9000 X14.011 Y77.405
+G1 X13.021 Y78.080 E38.15272
+G1 X13.871 Y79.161 E38.18988
+G1 X15.606 Y79.636 E38.20038
+G1 X14.721 Y77.785 E38.29849
+G0 F9000 X93.174 Y123.869
+G1 X91.448 Y124.872 E38.37557
+G0 F9000 X78.772 Y18.808
+G1 X76.977 Y17.960 E38.45236
+G0 F9000 X14.128 Y32.797
+G1 X15.460 Y31.473 E38.46973
+G1 X14.812 Y29.966 E38.49401
+G0 F9000 X51.914 Y148.131
+G1 X53.531 Y148.022 E38.58965
+G1 X53.392 Y148.886 E38.66305
+G0 F9000 X191.649 Y21.400
+G1 X191.004 Y20.392 E38.68857
+G1 X189.598 Y21.810 E38.72069
+G1 X188.964 Y20.560 E38.76253
+G1 X189.264 Y18.602 E38.83888
+G1 X191.072 Y17.910 E38.92373
+G1 X190.535 Y17.408 E38.95901
+G0 F9000 X45.429 Y181.907
+G1 X45.972 Y183.456 E39.03457
+G1 X47.189 Y185.419 E39.10738
+G1 X46.201 Y186.042 E39.14545
+G0 F9000 X107.825 Y67.282
+G1 X107.206 Y68.657 E39.23023
+G0 F9000 X187.650 Y148.850
+G1 X188.260 Y147.042 E39.31725
+G1 X187.617 Y148.174 E39.39547
+G1 X186.979 Y147.171 E39.40551
+G0 F9000 X159.310 Y45.419
+G0 F9000 X13.532 Y148.221
+G0 F9000 X92.414 Y80.369
+G1 X94.230 Y79.608 E39.46874
+G1 X95.829 Y80.543 E39.49990
+G1 X94.252 Y80.893 E39.58282
+G1 X93.918 Y82.415 E39.64937
+G1 X93.371 Y84.250 E39.71896
+G1 X91.510 Y84.613 E39.76220
+G1 X89.880 Y84.708 E39.84424
+G1 X88.769 Y85.687 E39.92441
+G1 X90.739 Y85.421 E39.96247
+G1 X89.546 Y84.628 E39.99537
+G0 F9000 X109.374 Y100.062
+G1 X107.947 Y101.888 E40.09537
+G1 X106.680 Y103.529 E40.15051
+G1 F1800 X106.127 Y105.225 E40.17125 ; extrude
+G1 X107.722 Y106.827 E40.26674
+G1 X107.961 Y105.402 E40.32985
+G1 X108.370 Y104.438 E40.35745
+G1 X108.243 Y102.808 E40.35802
+G1 X109.236 Y101.756 E40.38358
+G0 F9000 X120.584 Y180.828
+G1 X120.926 Y181.711 E40.45850
+G1 F1800 X120.017 Y183.065 E40.55101 ; extrude
+G1 X119.787 Y181.410 E40.55798
+G1 X118.355 Y181.250 E40.62185
+G1 X119.422 Y180.230 E40.64173
+G1 X119.895 Y179.443 E40.65793
+G0 F9000 X38.624 Y63.158
+G1 X37.359 Y63.077 E40.70191
+G1 X39.138 Y62.963 E40.72171
+G0 F9000 X33.838 Y14.658
+G1 X35.706 Y14.271 E40.75711
+G1 X36.469 Y13.839 E40.77235
+G1 X34.494 Y15.237 E40.84519
+G1 X36.175 Y14.844 E40.88845
+G1 X36.826 Y15.784 E40.98338
+G1 X38.233 Y16.948 E41.04238
+G1 X40.012 Y17.145 E41.08264
+G0 F9000 X179.505 Y160.099
+G0 F9000 X64.643 Y95.924
+G1 X64.096 Y97.505 E41.11762
+G1 X64.653 Y97.412 E41.15088
+G1 X65.797 Y96.455 E41.18793
+G1 X67.449 Y96.611 E41.21551
+G1 X66.090 Y97.370 E41.21769
+G0 F9000 X161.115 Y29.378
+G1 X159.346 Y28.433 E41.29103
+G1 F1800 X161.133 Y28.637 E41.38322 ; extrude
+G1 X160.870 Y27.409 E41.45803
+G1 X159.242 Y28.900 E41.53338
+G1 F1800 X157.395 Y27.124 E41.54581 ; extrude
+G1 X157.915 Y25.574 E41.56201
+G1 X158.605 Y27.452 E41.59807
+G1 X158.169 Y26.465 E41.62134
+G1 X158.992 Y25.165 E41.63933
+G1 X159.941 Y23.401 E41.69235
+G0 F9000 X87.916 Y158.183
+G1 X87.722 Y159.709 E41.75245
+G1 X89.496 Y161.146 E41.84393
+G0 F9000 X35.009 Y76.663
+G1 X33.028 Y77.871 E41.92253
+;LAYER:1067
+G0 Z1.500
+G1 X32.684 Y78.549 E41.97952
+G1 X34.524 Y80.371 E42.07241
+G1 X34.030 Y79.446 E42.16279
+G1 X35.315 Y81.409 E42.23159
+G1 X34.364 Y81.853 E42.24744
+G1 X33.465 Y83.545 E42.25573
+G1 X32.061 Y84.589 E42.31307
+G1 X31.770 Y86.322 E42.32179
+G0 F9000 X55.327 Y22.738
+G1 X55.094 Y23.643 E42.34745
+G1 X53.485 Y23.619 E42.41963
+G1 X52.596 Y23.101 E42.51163
+G1 X52.303 Y23.388 E42.59248
+G1 X53.758 Y22.993 E42.68748
+G0 F9000 X149.822 Y28.979
+G1 X148.036 Y30.932 E42.74157
+G0 F9000 X127.372 Y75.303
+G1 F1800 X128.632 Y73.436 E42.78936 ; extrude
+G1 X130.205 Y71.574 E42.83582
+G1 X131.121 Y70.946 E42.92910
+G0 F9000 X162.939 Y24.018
+G0 F9000 X100.029 Y67.268
+G0 F9000 X185.982 Y94.778
+G1 X184.983 Y96.429 E42.95121
+G1 X186.867 Y97.514 E43.01429
+G1 X186.641 Y95.907 E43.10567
+G1 X187.620 Y94.835 E43.15200
+G1 X189.313 Y93.477 E43.22039
+G1 X187.984 Y92.025 E43.26742
+G1 X187.455 Y92.242 E43.34360
+G0 F9000 X177.216 Y73.536
+G1 X179.142 Y72.097 E43.40183
+G1 X179.332 Y71.352 E43.40470
+G0 F9000 X56.847 Y125.896
+G1 X58.640 Y126.638 E43.44093
+G1 X58.813 Y128.088 E43.50792
+G1 X58.014 Y129.965 E43.53234
+G0 F9000 X1.968 Y110.632
+G1 X1.998 Y109.105 E43.61603
+G1 X3.705 Y111.073 E43.68385
+;LAYER:1108
+G0 Z1.600
+G0 F9000 X85.309 Y193.813
+G1 X85.583 Y191.848 E43.72542
+G1 X86.881 Y189.901 E43.74569
+G1 X85.287 Y191.629 E43.77244
+G1 X84.581 Y193.495 E43.81295
+G0 F9000 X166.082 Y196.243
+G0 F9000 X149.250 Y54.081
+G0 F9000 X72.845 Y132.365
+G1 X74.821 Y134.339 E43.87528
+G0 F9000 X145.213 Y110.253
+G1 X146.814 Y109.273 E43.88944
+G0 F9000 X117.707 Y160.173
+G0 F9000 X100.561 Y114.887
+G1 F1800 X100.211 Y115.061 E43.89095 ; extrude
+G1 X99.158 Y116.088 E43.91515
+G1 X97.529 Y115.998 E43.95390
+G1 X96.418 Y116.678 E44.03737
+G1 F1800 X98.113 Y117.094 E44.05546 ; extrude
+G0 F9000 X66.327 Y17.770
+G1 X66.022 Y17.004 E44.10668
+G1 X64.640 Y16.225 E44.13911
+G1 X64.356 Y14.889 E44.14365
+G1 F1800 X64.948 Y13.515 E44.20617 ; extrude
+G1 X64.289 Y11.925 E44.28042
+G1 X62.962 Y12.603 E44.32375
+G0 F9000 X180.520 Y0.714
+G1 X180.114 Y-0.493 E44.33253
+G1 X179.454 Y-1.428 E44.39959
+G1 F1800 X180.207 Y-1.705 E44.41517 ; extrude
+G1 X182.170 Y-0.025 E44.42516
+G1 X180.946 Y0.654 E44.47472
+G1 X182.681 Y1.912 E44.52207
+G1 X181.190 Y2.655 E44.59181
+G1 X179.371 Y3.516 E44.67190
+G1 X177.586 Y3.848 E44.74420
+G1 X177.052 Y4.697 E44.77190
+G1 X175.067 Y3.063 E44.84451
+G1 X173.688 Y4.551 E44.91619
+G1 X174.374 Y2.566 E44.92042
+G1 X176.360 Y1.839 E45.01131
+G1 X176.713 Y3.716 E45.07572
+G1 X175.499 Y3.791 E45.12402
+G1 X175.541 Y4.143 E45.14627
+G1 X175.556 Y3.819 E45.21269
+G1 X174.659 Y4.899 E45.28306
+G1 X173.655 Y6.601 E45.33414
+G1 X173.263 Y7.436 E45.41600
+G1 X172.115 Y7.244 E45.45179
+G1 X173.134 Y8.178 E45.47253
+G1 X173.752 Y8.882 E45.53605
+G1 X171.996 Y8.325 E45.53929
+G1 X172.677 Y10.191 E45.61973
+G1 X171.111 Y11.373 E45.69344
+G1 X170.190 Y11.322 E45.76465
+G1 X171.661 Y11.079 E45.80677
+G1 X170.394 Y9.710 E45.83486
+G1 X169.720 Y11.117 E45.92393
+G0 F9000 X154.547 Y74.929
+G0 F9000 X180.558 Y87.906
+G1 X180.939 Y86.927 E45.92596
+G1 X178.983 Y86.414 E46.00208
+G1 X179.482 Y85.168 E46.00412
+G1 X178.657 Y83.969 E46.08966
+G1 F1800 X179.001 Y84.267 E46.12186 ; extrude
+G1 X179.578 Y84.675 E46.17286
+G1 X178.824 Y84.341 E46.20918
+G0 F9000 X197.278 Y48.076
+G1 F1800 X196.252 Y48.425 E46.24690 ; extrude
+G1 X197.494 Y47.501 E46.32452
+G1 X195.711 Y47.023 E46.34730
+G1 X197.080 Y47.216 E46.38602
+G0 F9000 X51.998 Y150.537
+G1 X53.969 Y148.901 E46.43221
+;LAYER:1182
+G0 Z1.700
+G0 F9000 X18.196 Y73.786
+G1 X18.227 Y72.943 E46.50241
+G1 X16.904 Y72.985 E46.55178
+G1 X15.742 Y74.496 E46.58756
+G1 X15.995 Y73.632 E46.59600
+G1 X14.453 Y74.258 E46.64920
+G1 X15.833 Y73.612 E46.69094
+G1 X15.441 Y72.260 E46.75719
+G1 X15.065 Y71.191 E46.83619
+G1 X14.564 Y72.125 E46.83906
+G1 X15.294 Y72.828 E46.88877
+G0 F9000 X34.598 Y129.048
+G1 X33.633 Y129.626 E46.90238
+G0 F9000 X101.907 Y62.797
+G1 X100.443 Y62.731 E46.96404
+G1 X101.157 Y62.916 E47.02571
+G1 X100.046 Y62.686 E47.10873
+G1 X99.502 Y62.480 E47.20571
+G1 X97.928 Y62.927 E47.20902
+G1 X98.840 Y61.997 E47.29361
+G1 X98.923 Y60.060 E47.38263
+G1 X99.677 Y60.191 E47.46887
+G1 F1800 X99.032 Y58.296 E47.50253 ; extrude
+G0 F9000 X124.830 Y24.162
+G0 F9000 X58.516 Y55.749
+G1 X60.138 Y57.229 E47.60151
+G1 X59.262 Y58.935 E47.68258
+G1 X57.628 Y60.636 E47.73780
+G1 X56.202 Y61.433 E47.78420
+G1 X54.989 Y63.258 E47.81231
+G1 X53.980 Y64.038 E47.85192
+G1 X55.796 Y63.511 E47.90291
+G0 F9000 X150.710 Y149.029
+G1 X150.138 Y147.868 E47.93765
+G1 X149.762 Y147.966 E47.95306
+G1 X149.789 Y149.114 E47.97285
+G1 X151.039 Y147.492 E48.00044
+G1 X150.547 Y147.806 E48.02222
+;LAYER:1221
+G0 Z1.800
+G1 X149.562 Y149.129 E48.07743
+G1 X148.064 Y150.238 E48.10664
+G1 X148.777 Y151.499 E48.15031
+G1 X147.533 Y149.902 E48.19150
+G0 F9000 X44.238 Y173.312
+G1 X42.834 Y172.043 E48.24925
+G1 X42.984 Y171.802 E48.29962
+M106 S238
+G0 F9000 X7.662 Y153.509
+G1 X7.813 Y152.380 E48.37773
+G1 X6.726 Y152.671 E48.44255
+G1 X4.987 Y153.244 E48.51168
+G1 X5.920 Y151.649 E48.59557
+G0 F9000 X49.682 Y16.813
+G1 X48.027 Y16.770 E48.62060
+G1 X47.514 Y17.924 E48.69288
+G1 X45.547 Y17.241 E48.70369
+G1 X47.530 Y16.077 E48.70736
+G1 F1800 X49.254 Y15.647 E48.73860 ; extrude
+G1 X49.303 Y15.410 E48.78231
+G1 X49.207 Y14.123 E48.82294
+G1 X49.850 Y14.362 E48.86908
+G1 X50.080 Y15.821 E48.87706
+G1 X51.993 Y13.874 E48.93977
+G1 X51.873 Y12.398 E48.96979
+G1 X50.691 Y12.968 E49.03547
+M107
+G1 X49.991 Y13.357 E49.06914
+G1 X49.139 Y14.519 E49.09971
+G1 X47.601 Y15.444 E49.10652
+G0 F9000 X144.809 Y73.741
+G0 F9000 X78.991 Y100.265
+G1 X77.480 Y100.356 E49.13653
+G1 X77.222 Y99.268 E49.23341
+G1 X78.552 Y98.841 E49.30895
+G0 F9000 X8.439 Y89.792
+G1 X7.251 Y89.554 E49.38523
+G0 F9000 X103.850 Y85.076
+G1 X105.439 Y84.028 E49.44131
+G0 F9000 X88.869 Y183.124
+G1 X89.213 Y183.966 E49.44762
+G0 F9000 X60.308 Y143.172
+M106 S96
+G0 F9000 X94.673 Y3.161
+G0 F9000 X44.490 Y16.298
+G0 F9000 X38.896 Y103.532
+G0 F9000 X164.227 Y83.373
+G1 X163.191 Y84.732 E49.45231
+G0 F9000 X188.911 Y81.645
+G1 X190.364 Y80.047 E49.45871
+G1 X191.248 Y79.158 E49.50840
+G1 X190.374 Y79.501 E49.53831
+G1 X188.717 Y80.705 E49.58788
+G0 F9000 X101.756 Y100.776
+G1 X101.252 Y100.425 E49.67714
+G1 X102.822 Y102.386 E49.77147
+G1 X103.270 Y101.202 E49.87122
+G1 X103.502 Y99.520 E49.95755
+G1 X103.967 Y98.296 E50.00381
+G0 F9000 X132.132 Y20.898
+G1 X132.730 Y21.647 E50.00812
+G1 X132.294 Y21.347 E50.04558
+G1 X132.895 Y20.956 E50.10253
+G0 F9000 X189.886 Y192.973
+G1 X191.856 Y192.836 E50.18644
+G1 X192.716 Y194.590 E50.26978
+G1 X193.866 Y194.491 E50.30103
+G1 X195.237 Y195.870 E50.36798
+G0 F9000 X113.598 Y42.404
+G1 X112.008 Y41.023 E50.43968
+G1 X111.325 Y42.418 E50.46994
+G1 F1800 X109.373 Y42.160 E50.50793 ; extrude
+G1 X108.874 Y40.162 E50.60397
+G1 X106.971 Y38.560 E50.67495
+G1 X105.956 Y37.707 E50.77196
+G1 F1800 X107.502 Y36.205 E50.85677 ; extrude
+G1 X108.741 Y36.987 E50.91175
+G0 F9000 X107.958 Y53.170
+G1 X106.723 Y54.003 E50.96906
+G1 X107.120 Y55.691 E51.05031
+G1 X108.831 Y55.175 E51.06052
+G1 X110.557 Y55.758 E51.12677
+G1 X110.338 Y55.605 E51.20273
+G0 F9000 X123.931 Y161.794
+G1 X124.666 Y163.364 E51.21550
+G1 X124.003 Y165.162 E51.31517
+G1 X124.530 Y163.856 E51.41235
+G0 F9000 X90.510 Y3.566
+G1 X90.158 Y5.384 E51.45371
+G1 X90.503 Y4.335 E51.48420
+G1 X91.086 Y4.356 E51.51650
+G1 F1800 X89.896 Y3.699 E51.51770 ; extrude
+G0 F9000 X84.576 Y167.304
+G1 X86.441 Y168.652 E51.57629
+T0
+G1 X86.924 Y166.914 E51.63052
+G1 X86.541 Y165.323 E51.70367
+G1 X85.004 Y165.719 E51.79077
+G1 X83.187 Y167.233 E51.85727
+G1 X84.492 Y168.814 E51.88202
+G1 X83.676 Y169.859 E51.94368
+G1 X85.389 Y170.126 E52.03503
+G1 X83.505 Y169.965 E52.09025
+G1 X83.999 Y169.877 E52.15368
+G1 X85.786 Y167.933 E52.18572
+G0 F9000 X158.058 Y6.178
+G1 X159.259 Y5.130 E52.22384
+G1 X159.374 Y5.552 E52.25639
+G1 X160.491 Y7.359 E52.28111
+G1 X159.875 Y8.573 E52.29861
+G1 X161.617 Y6.648 E52.32568
+G1 X160.270 Y8.011 E52.36540
+G1 X158.527 Y7.329 E52.38098
+G1 X159.330 Y7.650 E52.39316
+G1 X157.903 Y8.932 E52.47523
+G1 X159.144 Y7.849 E52.47533
+G1 X157.534 Y8.914 E52.55265
+G1 X159.474 Y8.226 E52.63604
+G1 X160.208 Y8.963 E52.72093
+G1 X159.214 Y9.134 E52.73446
+G1 X158.183 Y9.923 E52.80178
+G1 X159.249 Y9.148 E52.81160
+G1 X159.115 Y10.410 E52.82756
+G1 X160.635 Y9.057 E52.83490
+G0 F9000 X133.554 Y16.692
+G1 X134.209 Y18.186 E52.87582
+G0 F9000 X68.130 Y48.411
+G1 X68.987 Y49.548 E52.92899
+G0 F9000 X77.013 Y58.588
+G1 X77.970 Y57.445 E52.96152
+G1 X78.524 Y57.367 E52.99951
+G1 X78.322 Y57.635 E53.08576
+G1 X76.735 Y57.643 E53.16261
+G1 X78.697 Y57.567 E53.20084
+G1 X78.202 Y56.061 E53.26450
+G1 X78.842 Y55.292 E53.31600
+G1 X78.715 Y56.941 E53.40659
+G1 X80.572 Y55.497 E53.49870
+G1 X80.225 Y57.461 E53.50120
+G1 X79.722 Y58.775 E53.52256
+G1 X79.367 Y57.562 E53.60257
+G0 F9000 X195.604 Y44.257
+G1 X195.263 Y44.563 E53.69160
+G1 X194.725 Y42.992 E53.69848
+G1 X194.514 Y44.922 E53.73984
+G1 X193.201 Y46.679 E53.79894
+G1 X192.201 Y45.940 E53.84830
+G1 X192.454 Y44.768 E53.85367
+G1 X193.583 Y46.325 E53.87731
+G1 F1800 X193.733 Y46.457 E53.88156 ; extrude
+G1 X194.490 Y45.978 E53.97347
+G1 X192.758 Y46.192 E54.03890
+G0 F9000 X97.418 Y6.836
+G1 X97.921 Y5.953 E54.08347
+G0 F9000 X36.288 Y163.132
+G1 X37.150 Y162.522 E54.16415
+G1 X36.721 Y162.769 E54.18322
+G1 X36.851 Y163.324 E54.19323
+G1 X38.223 Y161.376 E54.23770
+G1 X39.098 Y160.582 E54.26093
+G1 X39.991 Y159.982 E54.33699
+G1 F1800 X41.933 Y159.496 E54.43564 ; extrude
+G1 X40.052 Y159.677 E54.47447
+G1 X38.885 Y160.813 E54.52950
+G1 X37.032 Y161.898 E54.55131
+;LAYER:1387
+G0 Z1.900
+G1 X37.694 Y162.955 E54.61496
+G1 X38.370 Y161.779 E54.66847
+G1 F1800 X37.161 Y161.022 E54.70277 ; extrude
+G1 X38.079 Y161.332 E54.72006
+G0 F9000 X150.244 Y29.544
+G0 F9000 X50.346 Y102.999
+G1 X51.882 Y104.752 E54.74840
+G1 X52.127 Y103.772 E54.84336
+T0
+G1 F1800 X50.920 Y103.493 E54.93317 ; extrude
+G1 X50.156 Y101.547 E55.02314
+G1 X48.623 Y101.016 E55.03510
+G1 X48.936 Y100.801 E55.06560
+G1 X49.833 Y100.175 E55.15740
+G1 X49.735 Y99.493 E55.17081
+G1 F1800 X48.129 Y101.195 E55.25952 ; extrude
+G1 X47.082 Y101.338 E55.34294
+G1 X47.743 Y100.107 E55.40559
+G1 X46.494 Y100.951 E55.40971
+G0 F9000 X29.782 Y105.649
+G0 F9000 X158.955 Y19.263
+G1 X160.399 Y17.770 E55.43145
+G1 X162.128 Y17.121 E55.47125
+G1 X163.993 Y18.686 E55.49128
+G1 X162.462 Y20.081 E55.56870
+G1 X160.862 Y21.914 E55.57894
+G1 X160.132 Y22.653 E55.62000
+G0 F9000 X186.687 Y76.889
+G1 X186.574 Y78.139 E55.65011
+G0 F9000 X97.852 Y15.837
+G1 X98.561 Y15.537 E55.74754
+G1 X96.891 Y16.354 E55.82030
+M106 S236
+G1 F1800 X97.271 Y17.612 E55.84782 ; extrude
+G1 X96.353 Y15.777 E55.86148
+G1 X95.193 Y14.363 E55.95126
+G1 F1800 X93.718 Y14.016 E56.04591 ; extrude
+G1 X91.946 Y16.007 E56.05634
+G1 X92.873 Y14.176 E56.12588
+G1 X91.453 Y14.225 E56.20609
+G1 X91.133 Y13.290 E56.23001
+G1 X91.413 Y14.850 E56.28115
+G1 X90.273 Y12.916 E56.31400
+G0 F9000 X83.632 Y6.927
+G1 X83.569 Y8.443 E56.38375
+G1 X82.776 Y9.359 E56.40436
+G1 X83.878 Y8.030 E56.43877
+G1 X85.789 Y6.503 E56.45978
+G1 X86.771 Y7.096 E56.53774
+G1 X88.455 Y7.689 E56.60334
+G1 X89.483 Y7.979 E56.61624
+G1 X89.212 Y8.223 E56.65241
+G1 F1800 X88.698 Y10.111 E56.66144 ; extrude
+G1 X88.278 Y9.906 E56.72062
+G1 X86.340 Y11.402 E56.81452
+G1 X85.635 Y9.635 E56.90379
+G1 X84.654 Y10.428 E56.98346
+G1 X83.589 Y11.621 E57.06981
+G0 F9000 X118.749 Y197.040
+G1 X118.586 Y195.621 E57.07586
+G0 F9000 X161.790 Y133.131
+G1 F1800 X163.356 Y134.861 E57.13752 ; extrude
+G1 X163.040 Y133.860 E57.23039
+G0 F9000 X45.787 Y68.523
+G1 X45.086 Y68.282 E57.31173
+G1 X44.409 Y70.060 E57.40691
+G1 X42.852 Y69.702 E57.46924
+G1 X40.987 Y68.199 E57.52528
+G1 X41.461 Y69.802 E57.57681
+G1 X40.564 Y70.931 E57.59241
+G1 X42.196 Y69.592 E57.61165
+G1 X41.525 Y69.173 E57.68761
+G1 X41.111 Y70.270 E57.77793
+G1 X40.113 Y72.181 E57.83047
+G1 X39.200 Y70.722 E57.91900
+G1 X39.043 Y70.828 E57.93969
+G1 X39.769 Y71.002 E57.93993
+G1 X38.044 Y70.041 E57.96109
+G1 X37.352 Y69.035 E57.99021
+G1 X38.514 Y70.190 E58.06002
+G1 X36.968 Y68.368 E58.07645
+G1 X38.257 Y68.711 E58.11942
+G1 X39.270 Y68.076 E58.12402
+G1 X40.661 Y66.545 E58.18932
+G1 X39.849 Y64.948 E58.20921
+G1 X40.421 Y65.675 E58.23742
+G0 F9000 X196.957 Y8.678
+G1 X196.356 Y7.425 E58.28102
+G1 X195.015 Y7.943 E58.34672
+G0 F9000 X174.835 Y22.168
+G0 F9000 X48.353 Y102.761
+G1 X48.568 Y103.669 E58.43613
+G0 F9000 X166.172 Y3.693
+G1 X164.744 Y4.101 E58.51432
+G1 X166.148 Y4.858 E58.52516
+G1 X165.783 Y3.479 E58.59106
+G0 F9000 X32.942 Y80.499
+G0 F9000 X77.023 Y110.283
+G1 X76.638 Y111.484 E58.59985
+G1 X78.095 Y113.167 E58.67638
+G1 F1800 X78.385 Y111.637 E58.70191 ; extrude
+G1 X77.673 Y111.267 E58.75574
+G1 X78.856 Y112.452 E58.84384
+G0 F9000 X152.317 Y138.638
+G1 X151.690 Y137.252 E58.92703
+G1 X151.049 Y136.537 E58.97835
+G1 X150.462 Y137.311 E59.01872
+G1 X150.683 Y136.761 E59.04610
+G1 X149.904 Y135.100 E59.06561
+G0 F9000 X161.998 Y105.785
+G1 F1800 X162.156 Y105.426 E59.12134 ; extrude
+G1 X160.568 Y103.981 E59.18859
+M140 S0
+G91
+G1 E-1 F300
+G1 Z+0.5 E-5 X-20 Y-20 F9000
+G90
+M84
+M84
@@ -0,0 +1,20 @@
+;Relative extrusion with repeated extrude-only moves
+G28
+G92 X0 Y0 Z0 E0
+M83
+G1 X10 Y10 E1.0 F1200
+G1 E2.0
+G1 E2.0
+G1 E2.0
+G1 X20 E1.0
+G1 X20 E1.0
+T1
+G1 E-1.0
+G1 E1.0
+G1 E1.0
+T0
+M82
+G92 E0
+G1 X30 E1.0
+G1 E1.0
+G1 E2.0
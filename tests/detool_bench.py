@@ -0,0 +1,82 @@
+#!/usr/bin/env python2.7
+# Measures the throughput of DeTool.py on generated two-tool g-code made of
+# moves, and checks that all given versions of the script produce the same
+# output. To compare against an older version, extract it with e.g.
+# "git show HEAD~1:DeTool.py > /tmp/DeTool_old.py" and pass both files.
+
+from __future__ import print_function
+import os
+import sys
+import time
+import random
+import filecmp
+import argparse
+import tempfile
+import subprocess
+
+repo_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+detool_args = ['--tool-travel-speed', '120', '--physical', 'E', '0.0', '0.0', '0.0',
+               '--physical', 'U', '-10.0', '1.5', '0.2', '--tool', '0', '1', '--tool', '1', '0',
+               '--fan', 'M106', '0', '1.0', '--fan', 'M406', '1', '0.8']
+
+def write_moves(f, count):
+    rng = random.Random(1)
+    x, y, z, e = 100.0, 100.0, 0.3, 0.0
+    f.write('G28\nG90\nG92 E0\nG0 F9000 X{:.3f} Y{:.3f} Z{:.3f}\nM106 S127\n'.format(x, y, z))
+    for i in range(count):
+        if i % 5000 == 4999:
+            f.write('T{}\n'.format((i // 5000) % 2))
+        if i % 1000 == 999:
+            z += 0.2
+            f.write(';LAYER:{}\nG0 Z{:.3f}\n'.format(i // 1000, z))
+        elif i % 10 == 0:
+            x = rng.uniform(0, 200)
+            y = rng.uniform(0, 200)
+            f.write('G0 F9000 X{:.3f} Y{:.3f}\n'.format(x, y))
+        else:
+            x += rng.uniform(-2, 2)
+            y += rng.uniform(-2, 2)
+            e += rng.uniform(0, 0.1)
+            f.write('G1 F1200 X{:.3f} Y{:.3f} E{:.5f}\n'.format(x, y, e))
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark DeTool.py on generated moves.')
+    parser.add_argument('--count', type=int, default=1000000, help='Number of generated moves.')
+    parser.add_argument('scripts', nargs='*', help='DeTool.py files to run (default: the one in this repository).')
+    args = parser.parse_args()
+    scripts = args.scripts or [os.path.join(repo_dir, 'DeTool.py')]
+
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([repo_dir] + ([env['PYTHONPATH']] if 'PYTHONPATH' in env else []))
+
+    fd, input_name = tempfile.mkstemp(suffix='.gcode')
+    temp_names = [input_name]
+    try:
+        with os.fdopen(fd, 'w') as f:
+            write_moves(f, args.count)
+        with open(input_name, 'r') as f:
+            line_count = sum(1 for line in f)
+        print('{} lines'.format(line_count))
+
+        output_names = []
+        for script in scripts:
+            fd, output_name = tempfile.mkstemp(suffix='.gcode')
+            os.close(fd)
+            temp_names.append(output_name)
+            output_names.append(output_name)
+            start_time = time.time()
+            subprocess.check_call([sys.executable, script, '--input', input_name, '--output', output_name] + detool_args, env=env)
+            run_time = time.time() - start_time
+            print('{}: {:.3f} s ({:.0f} lines/s)'.format(script, run_time, line_count / run_time))
+
+        for output_name in output_names[1:]:
+            if not filecmp.cmp(output_names[0], output_name, shallow=False):
+                print('ERROR: outputs differ.')
+                sys.exit(1)
+    finally:
+        for name in temp_names:
+            os.remove(name)
+
+if __name__ == '__main__':
+    main()
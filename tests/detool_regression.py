@@ -0,0 +1,213 @@
+#!/usr/bin/env python2.7
+# Runs DeTool.py over the regression corpus in tests/detool and checks that
+# the output is byte-identical to the expected files. The --binary output,
+# for which there is no expected file, is checked against the --sdcard
+# output packed by aprinter_encode.py. The expected --optimize output is
+# also checked to make the machine do the same as the plain output, and so
+# is the --optimize output of inputs which have no expected files, such as
+# one using relative extrusion. The encoding of generated commands, which
+# --binary uses, is checked against encoding their text, including
+# parameters written without decimals. Resume indexes written with text
+# and --binary output are checked to have checkpoints at the same lines,
+# and a checkpoint for every layer, including the first one, which starts
+# before the position is known.
+# Rewriting a file in place through a symbolic link is checked to keep the
+# link and the mode of the file.
+
+from __future__ import print_function
+import os
+import sys
+import json
+import stat
+import shutil
+import filecmp
+import tempfile
+import subprocess
+
+tests_dir = os.path.dirname(os.path.abspath(__file__))
+detool = os.path.join(tests_dir, '..', 'DeTool.py')
+encoder = os.path.join(tests_dir, '..', 'aprinter_encode.py')
+corpus_dir = os.path.join(tests_dir, 'detool')
+
+sys.path.insert(0, os.path.join(tests_dir, '..'))
+from aprinter_gcode import GcodeCommand
+from aprinter_encode import encode_command, encode_line
+from aprinter_resume import layer_of
+
+common_args = ['--tool-travel-speed', '120', '--physical', 'E', '0.0', '0.0', '0.0',
+               '--physical', 'U', '-10.0', '1.5', '0.2', '--tool', '0', '1', '--tool', '1', '0']
+
+fan_args = ['--fan', 'M106', '0', '1.0', '--fan', 'M406', '1', '0.8']
+
+cases = [
+    ('input.gcode', 'expected.gcode', common_args + fan_args, False),
+    ('input.gcode', 'expected_optimized.gcode', common_args + fan_args + ['--optimize'], False),
+    ('input.gcode', 'expected_sdcard.gcode', common_args + ['--sdcard'], False),
+    ('input_packed.gcode', None, common_args + ['--binary'], True),
+]
+
+same_behaviour = [
+    ('expected_optimized.gcode', 'expected.gcode'),
+]
+
+optimized_inputs = [
+    ('input_relative_e.gcode', common_args),
+]
+
+index_input = 'input_packed.gcode'
+index_modes = [[], ['--sdcard'], ['--binary']]
+
+generated_commands = [
+    GcodeCommand('G0', [('X', 112.0, 5), ('Y', -3.25, 5), ('F', 7200.0, 1)]),
+    GcodeCommand('G92', [('U', 0.0, 5)]),
+    GcodeCommand('M106', [('S', 0, None)]),
+    GcodeCommand('M406', [('S', 204.0, 2)]),
+    GcodeCommand('M104', [('S', 200.0, 0)]),
+    GcodeCommand('M106', [('S', 127.6, 0)]),
+    GcodeCommand('G1', [('X', -0.4, 0), ('Y', 12.5, 0), ('E', 1.23456, 5), ('F', 1800.0, 1)]),
+    GcodeCommand('G92', [('E', 0.0, 0)]),
+    GcodeCommand('G1', [('X', 1e20, 0)]),
+]
+
+def machine_trace(path):
+    # Returns what the g-code makes the machine do: the moves which change
+    # the position, with their feedrate, fan speed changes, and all other
+    # commands.
+    events = []
+    pos = {}
+    feedrate = None
+    relative = False
+    relative_e = False
+    speeds = {}
+    with open(path, 'r') as f:
+        for line in f:
+            words = line.split(';')[0].split()
+            if len(words) == 0:
+                continue
+            cmd = words[0]
+            if cmd in ('G0', 'G1'):
+                new_pos = dict(pos)
+                for word in words[1:]:
+                    if word[0] == 'F':
+                        feedrate = float(word[1:])
+                    elif relative or (relative_e and word[0] not in 'XYZ'):
+                        new_pos[word[0]] = new_pos.get(word[0], 0.0) + float(word[1:])
+                    else:
+                        new_pos[word[0]] = float(word[1:])
+                if new_pos != pos:
+                    pos = new_pos
+                    events.append((cmd, sorted(pos.items()), feedrate))
+                continue
+            if cmd == 'G28':
+                pos = {}
+            elif cmd == 'G90' or cmd == 'G91':
+                relative = (cmd == 'G91')
+            elif cmd == 'M82' or cmd == 'M83':
+                relative_e = (cmd == 'M83')
+            elif cmd == 'G92':
+                for word in words[1:]:
+                    pos[word[0]] = float(word[1:])
+            elif cmd[0] == 'M' and len(words) == 2 and words[1][0] == 'S':
+                speed = float(words[1][1:])
+                if speeds.get(cmd) == speed:
+                    continue
+                speeds[cmd] = speed
+            events.append(tuple(words))
+    return events
+
+def main():
+    failed = False
+    for (input_name, expected_name, args, encoded) in cases:
+        fd, output_name = tempfile.mkstemp(suffix='.gcode')
+        os.close(fd)
+        fd, sdcard_name = tempfile.mkstemp(suffix='.gcode')
+        os.close(fd)
+        fd, encoded_name = tempfile.mkstemp(suffix='.bin')
+        os.close(fd)
+        try:
+            input_path = os.path.join(corpus_dir, input_name)
+            subprocess.check_call([sys.executable, detool, '--input', input_path, '--output', output_name] + args)
+            if encoded:
+                sdcard_args = [('--sdcard' if arg == '--binary' else arg) for arg in args]
+                subprocess.check_call([sys.executable, detool, '--input', input_path, '--output', sdcard_name] + sdcard_args)
+                subprocess.check_call([sys.executable, encoder, '--input', sdcard_name, '--output', encoded_name])
+                expected_path = encoded_name
+                expected_name = input_name + ' (packed)'
+            else:
+                expected_path = os.path.join(corpus_dir, expected_name)
+            ok = filecmp.cmp(output_name, expected_path, shallow=False)
+        finally:
+            os.remove(output_name)
+            os.remove(sdcard_name)
+            os.remove(encoded_name)
+        print('{}: {}'.format(expected_name, 'ok' if ok else 'DIFFERS'))
+        failed = failed or not ok
+    for (name, reference_name) in same_behaviour:
+        ok = machine_trace(os.path.join(corpus_dir, name)) == machine_trace(os.path.join(corpus_dir, reference_name))
+        print('{} behaves as {}: {}'.format(name, reference_name, 'ok' if ok else 'DIFFERS'))
+        failed = failed or not ok
+    for (input_name, args) in optimized_inputs:
+        fd, plain_name = tempfile.mkstemp(suffix='.gcode')
+        os.close(fd)
+        fd, optimized_name = tempfile.mkstemp(suffix='.gcode')
+        os.close(fd)
+        try:
+            input_path = os.path.join(corpus_dir, input_name)
+            subprocess.check_call([sys.executable, detool, '--input', input_path, '--output', plain_name] + args)
+            subprocess.check_call([sys.executable, detool, '--input', input_path, '--output', optimized_name, '--optimize'] + args)
+            ok = machine_trace(optimized_name) == machine_trace(plain_name)
+        finally:
+            os.remove(plain_name)
+            os.remove(optimized_name)
+        print('{} behaves the same with --optimize: {}'.format(input_name, 'ok' if ok else 'DIFFERS'))
+        failed = failed or not ok
+    checkpoint_lines = []
+    checkpoint_layers = []
+    for mode_args in index_modes:
+        fd, output_name = tempfile.mkstemp(suffix='.gcode')
+        os.close(fd)
+        fd, index_name = tempfile.mkstemp(suffix='.idx')
+        os.close(fd)
+        try:
+            subprocess.check_call([sys.executable, detool, '--input', os.path.join(corpus_dir, index_input), '--output', output_name,
+                                   '--index', index_name, '--index-interval', '50'] + common_args + mode_args)
+            with open(index_name, 'r') as f:
+                checkpoints = [json.loads(line) for line in f.readlines()[1:]]
+            checkpoint_lines.append([checkpoint['line'] for checkpoint in checkpoints])
+            checkpoint_layers.append([checkpoint['layer'] for checkpoint in checkpoints if checkpoint['layer'] is not None])
+        finally:
+            os.remove(output_name)
+            os.remove(index_name)
+    for (mode_args, lines) in zip(index_modes[1:], checkpoint_lines[1:]):
+        ok = lines == checkpoint_lines[0]
+        print('index checkpoints ({}): {}'.format(' '.join(mode_args), 'ok' if ok else 'DIFFERS'))
+        failed = failed or not ok
+    with open(os.path.join(corpus_dir, index_input), 'r') as f:
+        input_layers = [layer_of(line) for line in f if layer_of(line) is not None]
+    ok = all([layers == input_layers for layers in checkpoint_layers])
+    print('index checkpoints for all layers: {}'.format('ok' if ok else 'MISSING'))
+    failed = failed or not ok
+    temp_dir = tempfile.mkdtemp()
+    try:
+        real_name = os.path.join(temp_dir, 'real.gcode')
+        link_name = os.path.join(temp_dir, 'link.gcode')
+        shutil.copyfile(os.path.join(corpus_dir, 'input.gcode'), real_name)
+        os.chmod(real_name, 0o644)
+        os.symlink('real.gcode', link_name)
+        subprocess.check_call([sys.executable, detool, '--input', link_name, '--output', link_name] + common_args + fan_args)
+        ok = (os.path.islink(link_name) and stat.S_IMODE(os.stat(real_name).st_mode) == 0o644 and
+              filecmp.cmp(real_name, os.path.join(corpus_dir, 'expected.gcode'), shallow=False) and
+              sorted(os.listdir(temp_dir)) == ['link.gcode', 'real.gcode'])
+    finally:
+        shutil.rmtree(temp_dir)
+    print('in place through a link: {}'.format('ok' if ok else 'DIFFERS'))
+    failed = failed or not ok
+    for command in generated_commands:
+        ok = encode_command(command) == encode_line(command.format())
+        print('encode_command({}): {}'.format(command.format(), 'ok' if ok else 'DIFFERS'))
+        failed = failed or not ok
+    if failed:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
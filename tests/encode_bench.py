@@ -0,0 +1,146 @@
+#!/usr/bin/env python2.7
+# Compares aprinter_encode.encode_line, with its G0/G1/G92 fast path,
+# against the original encoder (baseline_encode_line below, kept as it was
+# before the fast path) on motion-heavy g-code, and checks that both
+# produce the same bytes. Lines which cannot be encoded (such as M117 with
+# text) must fail in both, and are counted.
+
+from __future__ import print_function
+import os
+import sys
+import time
+import random
+import struct
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import aprinter_encode
+
+def baseline_encode_line(line):
+    comment_index = line.find(';')
+    if comment_index >= 0:
+        line = line[:comment_index]
+    line = line.strip()
+    if len(line) == 0:
+        return ''
+    parts = line.split()
+    cmd_letter = parts[0][0]
+    if cmd_letter == 'E':
+        return chr(0xE0)
+    if not _letter_ok(cmd_letter):
+        raise aprinter_encode.GcodeSyntaxError('invalid command letter')
+    try:
+        cmd_number = int(parts[0][1:])
+    except ValueError:
+        raise aprinter_encode.GcodeSyntaxError('invalid command number')
+    if not (cmd_number >= 0 and cmd_number < 2048):
+        raise aprinter_encode.GcodeSyntaxError('invalid command number')
+    packet_index = ''
+    packet_payload = ''
+    num_params = len(parts) - 1
+    if num_params > 14:
+        raise aprinter_encode.GcodeSyntaxError('too many parameters')
+    for part in parts[1:]:
+        param_letter = part[0]
+        if not _letter_ok(param_letter):
+            raise aprinter_encode.GcodeSyntaxError('invalid parameter letter')
+        param_value = part[1:]
+        if param_value == '':
+            encode_as = 'void'
+        else:
+            encode_as = 'integer'
+            try:
+                integer_value = int(param_value)
+                if not (integer_value >= 0 and integer_value < 2**64):
+                    raise ValueError()
+            except ValueError:
+                encode_as = 'real'
+                try:
+                    real_value = float(param_value)
+                except ValueError:
+                    raise aprinter_encode.GcodeSyntaxError('invalid command argument')
+        if encode_as == 'void':
+            type_code = 5
+            param_payload = ''
+        elif encode_as == 'integer':
+            if integer_value < 2**32:
+                type_code = 3
+                param_payload = struct.pack('<I', integer_value)
+            else:
+                type_code = 4
+                param_payload = struct.pack('<Q', integer_value)
+        elif encode_as == 'real':
+            type_code = 1
+            param_payload = struct.pack('<f', real_value)
+        packet_index += chr((type_code << 5) + (ord(param_letter) - ord('A')))
+        packet_payload += param_payload
+    if (cmd_letter, cmd_number) in _SmallCommands:
+        command_type_code = _SmallCommands[(cmd_letter, cmd_number)]
+        packet_header_large = ''
+    else:
+        command_type_code = 15
+        packet_header_large = struct.pack('BB', ((ord(cmd_letter) - ord('A')) << 3) + (cmd_number >> 8), (cmd_number & 0xFF))
+    packet_header = struct.pack('B', (command_type_code << 4) + num_params) + packet_header_large
+    packet = packet_header + packet_index + packet_payload
+    return packet
+
+_SmallCommands = {
+    ('G', 0) : 1,
+    ('G', 1) : 2,
+    ('G', 92) : 3
+}
+
+def _letter_ok(ch):
+    return (ord(ch) >= ord('A') and ord(ch) <= ord('Z'))
+
+def generate_lines(count):
+    rng = random.Random(1)
+    x, y, e = 100.0, 100.0, 0.0
+    lines = []
+    for i in range(count):
+        if i % 10 == 0:
+            lines.append('G0 F9000 X{:.3f} Y{:.3f}'.format(rng.uniform(0, 200), rng.uniform(0, 200)))
+        else:
+            x += rng.uniform(-2, 2)
+            y += rng.uniform(-2, 2)
+            e += rng.uniform(0, 0.1)
+            lines.append('G1 X{:.3f} Y{:.3f} E{:.5f}'.format(x, y, e))
+    return lines
+
+def run(func, lines):
+    # Returns the time taken and the packets, None for lines which failed.
+    result = []
+    start_time = time.time()
+    for line in lines:
+        try:
+            result.append(func(line))
+        except aprinter_encode.GcodeSyntaxError:
+            result.append(None)
+    return (time.time() - start_time, result)
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the aprinter_encode fast path.')
+    parser.add_argument('--input', help='G-code file to use instead of generated moves.')
+    parser.add_argument('--count', type=int, default=200000, help='Number of generated moves.')
+    args = parser.parse_args()
+    
+    if args.input is not None:
+        with open(args.input, 'rb') as f:
+            lines = [line.split(';')[0].strip() for line in f]
+        lines = [line for line in lines if len(line) > 0]
+    else:
+        lines = generate_lines(args.count)
+    
+    baseline_time, baseline_result = run(baseline_encode_line, lines)
+    fast_time, fast_result = run(aprinter_encode.encode_line, lines)
+    if fast_result != baseline_result:
+        print('ERROR: fast path output differs from the baseline encoder.')
+        sys.exit(1)
+    
+    print('{} lines, {} not encodable'.format(len(lines), baseline_result.count(None)))
+    print('baseline: {:.3f} s ({:.0f} lines/s)'.format(baseline_time, len(lines) / baseline_time))
+    print('fast:     {:.3f} s ({:.0f} lines/s)'.format(fast_time, len(lines) / fast_time))
+    print('speedup:  {:.2f}x'.format(baseline_time / fast_time))
+
+if __name__ == '__main__':
+    main()
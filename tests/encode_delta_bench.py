@@ -0,0 +1,76 @@
+#!/usr/bin/env python2.7
+# Reports how much smaller the delta profile of aprinter_encode makes a
+# corpus of g-code files compared to the standard packed format, and checks
+# that the delta reference decoder reproduces the source values.
+
+from __future__ import print_function
+import os
+import sys
+import time
+import struct
+import argparse
+import cStringIO
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import aprinter_encode
+
+def encode(gcode, delta_encoder=None):
+    output_file = cStringIO.StringIO()
+    start_time = time.time()
+    aprinter_encode.encode_stream(cStringIO.StringIO(gcode), output_file, delta_encoder=delta_encoder)
+    return (output_file.getvalue(), time.time() - start_time)
+
+def check_round_trip(gcode, delta_data):
+    # Every decoded value must be either the source value itself (deltas)
+    # or the source value rounded to float (absolute values).
+    source_commands = []
+    for line in gcode.split('\n'):
+        parts = line.split(';')[0].split()
+        if len(parts) > 0:
+            command = aprinter_encode._parse_parts(parts)
+            if command is None:
+                break
+            source_commands.append(command)
+    decoded_commands = list(aprinter_encode.iter_delta_commands(delta_data))
+    if len(decoded_commands) != len(source_commands):
+        return 'command count differs'
+    for (i, (source, decoded)) in enumerate(zip(source_commands, decoded_commands)):
+        if source[:2] != decoded[:2] or [l for (l, v) in source[2]] != [l for (l, v) in decoded[2]]:
+            return 'command {} differs'.format(i)
+        for ((letter, source_value), (_, value)) in zip(source[2], decoded[2]):
+            if isinstance(source_value, float):
+                rounded_value = struct.unpack('<f', struct.pack('<f', source_value))[0]
+                if value != source_value and value != rounded_value:
+                    return 'command {} parameter {} differs'.format(i, letter)
+            elif value != source_value:
+                return 'command {} parameter {} differs'.format(i, letter)
+    return None
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the aprinter_encode delta profile.')
+    parser.add_argument('--digits', type=int, default=3, help='Quantum decimal digits.')
+    parser.add_argument('files', nargs='+', metavar='GcodeFile')
+    args = parser.parse_args()
+    
+    totals = [0, 0, 0]
+    failed = False
+    print('{:>12} {:>12} {:>12} {:>7} {:>7}  {}'.format('text', 'standard', 'delta', 'ratio', 'MB/s', 'file'))
+    for file_name in args.files:
+        with open(file_name, 'rb') as f:
+            gcode = f.read()
+        standard_data, _ = encode(gcode)
+        delta_data, delta_time = encode(gcode, aprinter_encode.DeltaEncoder(args.digits))
+        error = check_round_trip(gcode, delta_data)
+        if error is not None:
+            print('ERROR: {}: {}'.format(file_name, error))
+            failed = True
+        sizes = (len(gcode), len(standard_data), len(delta_data))
+        totals = [t + s for (t, s) in zip(totals, sizes)]
+        print('{:>12} {:>12} {:>12} {:>7.3f} {:>7.2f}  {}'.format(sizes[0], sizes[1], sizes[2],
+            sizes[2] / float(sizes[1]), sizes[0] / max(delta_time, 1e-9) / 1e6, file_name))
+    print('{:>12} {:>12} {:>12} {:>7.3f}          total'.format(totals[0], totals[1], totals[2], totals[2] / float(max(totals[1], 1))))
+    if failed:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python2.7
+# Encodes g-code with aprinter_encode.py under a number of encoding
+# policies, decodes the result with --decode, and checks with --verify that
+# encoding the decoded g-code with the same policy gives the same packets,
+# that is, that decoding is lossless. Both a few edge cases and moves
+# written the way slicers write them are checked. Values beyond the float
+# range are checked to round trip as doubles with --double, and to be
+# reported as an error of their line otherwise. Decoding and verifying are
+# also checked through standard input and output, and decoding an empty
+# file to be reported in one line. Parallel encoding is checked to give
+# the same bytes as serial encoding, over many small chunks, and an error
+# in a chunk to be reported with its input line number.
+
+from __future__ import print_function
+import os
+import sys
+import random
+import tempfile
+import subprocess
+from cStringIO import StringIO
+
+tests_dir = os.path.dirname(os.path.abspath(__file__))
+encoder = os.path.join(tests_dir, '..', 'aprinter_encode.py')
+
+sys.path.insert(0, os.path.join(tests_dir, '..'))
+import aprinter_encode
+
+gcode_lines = [
+    'G28',
+    'G1 X18.708 Y0.995 F1200',
+    'G1 X0.005 Y0.015 E-0.5',
+    'G1 X0.99999999 Y123456.789',
+    'G1 X4294967295.6',
+    'M104 S4294967295.6',
+    'M104 S200',
+]
+
+float_range_lines = [
+    'G28',
+    'G1 X1e300 Y-3.5e38',
+    'G1 X350000000000000000000000000000000000000.0 Y1.5',
+    'M104 S1e300',
+]
+
+float_range_policies = [
+    [],
+    ['--precision', '2'],
+]
+
+def sliced_lines(count, seed):
+    rng = random.Random(seed)
+    lines = []
+    e = 0.0
+    for i in range(count):
+        e += rng.uniform(0, 0.1)
+        lines.append('G1 X{:.3f} Y{:.3f} Z{:.2f} E{:.5f} F{}'.format(
+            rng.uniform(0, 200), rng.uniform(0, 200), 0.2 * (i // 100 + 1), e, rng.choice([1200, 1800, 4800])))
+    return lines
+
+policies = [
+    [],
+    ['--double'],
+    ['--precision', '0'],
+    ['--precision', '2'],
+    ['--precision', '4'],
+    ['--double', '--precision', '2'],
+]
+
+def check_parallel(gcode, policy, bad_line=None):
+    # Encodes the g-code serially and in small chunks by 3 processes, and
+    # returns whether the output is the same. With bad_line, that line is
+    # replaced by an invalid one, and both must report its number.
+    lines = gcode.rstrip('\n').split('\n')
+    if bad_line is not None:
+        lines[bad_line - 1] = 'G1 Xnope'
+    gcode = '\n'.join(lines) + '\n'
+    results = []
+    for encode in (lambda f, out: aprinter_encode.encode_stream(f, out, policy=policy),
+                   lambda f, out: aprinter_encode.encode_stream_parallel(f, out, 3, chunk_size=4096, policy=policy)):
+        output = StringIO()
+        try:
+            encode(StringIO(gcode), output)
+            results.append(output.getvalue())
+        except aprinter_encode.GcodeSyntaxError as e:
+            results.append(str(e))
+    if bad_line is not None:
+        return results == ['line {}: invalid command argument'.format(bad_line)] * 2
+    return results[0] == results[1] and len(results[0]) > 1
+
+def run(args):
+    subprocess.check_call([sys.executable] + args)
+
+def main():
+    temp_names = []
+    def temp_name(suffix):
+        fd, name = tempfile.mkstemp(suffix=suffix)
+        os.close(fd)
+        temp_names.append(name)
+        return name
+    failed = False
+    try:
+        gcode_name = temp_name('.gcode')
+        packed_name = temp_name('.packed')
+        decoded_name = temp_name('.gcode')
+        sliced_name = temp_name('.gcode')
+        with open(gcode_name, 'w') as f:
+            f.write('\n'.join(gcode_lines) + '\n')
+        with open(sliced_name, 'w') as f:
+            f.write('\n'.join(sliced_lines(2000, 1)) + '\n')
+        for (label, input_name) in (('edge cases', gcode_name), ('sliced moves', sliced_name)):
+            for policy in policies:
+                run([encoder, '--input', input_name, '--output', packed_name] + policy)
+                run([encoder, '--decode', '--input', packed_name, '--output', decoded_name])
+                with open(os.devnull, 'w') as devnull:
+                    ok = subprocess.call([sys.executable, encoder, '--verify', '--input', decoded_name, '--output', packed_name] + policy, stderr=devnull) == 0
+                print('round trip {} ({}): {}'.format(label, ' '.join(policy) or 'default', 'ok' if ok else 'DIFFERS'))
+                failed = failed or not ok
+        with open(sliced_name, 'r') as f:
+            sliced = f.read()
+        for policy in (None, aprinter_encode.EncodingPolicy(precision=2, allow_double=True)):
+            ok = check_parallel(sliced, policy)
+            print('parallel encoding ({}): {}'.format('default' if policy is None else '--double --precision 2', 'ok' if ok else 'DIFFERS'))
+            failed = failed or not ok
+        ok = check_parallel(sliced, None, 1500)
+        print('parallel encoding error line: {}'.format('ok' if ok else 'DIFFERS'))
+        failed = failed or not ok
+        run([encoder, '--input', sliced_name, '--output', packed_name])
+        parallel_name = temp_name('.packed')
+        run([encoder, '--input', sliced_name, '--output', parallel_name, '--jobs', '2'])
+        with open(packed_name, 'rb') as f:
+            with open(parallel_name, 'rb') as g:
+                ok = f.read() == g.read()
+        print('--jobs 2: {}'.format('ok' if ok else 'DIFFERS'))
+        failed = failed or not ok
+        run([encoder, '--decode', '--input', packed_name, '--output', decoded_name])
+        with open(packed_name, 'rb') as f:
+            process = subprocess.Popen([sys.executable, encoder, '--decode', '--input', '-', '--output', '-'], stdin=f, stdout=subprocess.PIPE)
+            piped = process.communicate()[0]
+        with open(decoded_name, 'rb') as f:
+            ok = process.returncode == 0 and piped == f.read()
+        with open(decoded_name, 'rb') as f:
+            ok = ok and subprocess.call([sys.executable, encoder, '--verify', '--input', '-', '--output', packed_name], stdin=f) == 0
+        print('decode and verify through a pipe: {}'.format('ok' if ok else 'DIFFERS'))
+        failed = failed or not ok
+        with open(packed_name, 'wb') as f:
+            pass
+        process = subprocess.Popen([sys.executable, encoder, '--decode', '--input', packed_name, '--output', decoded_name], stderr=subprocess.PIPE)
+        error = process.communicate()[1]
+        ok = process.returncode == 1 and error == 'Decoding failed: empty file\n'
+        print('decode empty file: {}'.format('ok' if ok else 'NOT REPORTED'))
+        failed = failed or not ok
+        with open(gcode_name, 'w') as f:
+            f.write('\n'.join(float_range_lines) + '\n')
+        for policy in float_range_policies:
+            process = subprocess.Popen([sys.executable, encoder, '--input', gcode_name, '--output', packed_name] + policy, stderr=subprocess.PIPE)
+            error = process.communicate()[1]
+            ok = process.returncode == 1 and error == 'Encoding failed: line 2: command argument out of float range\n'
+            print('out of float range ({}): {}'.format(' '.join(policy) or 'default', 'ok' if ok else 'NOT REPORTED'))
+            failed = failed or not ok
+        for policy in (['--double'], ['--double', '--precision', '2']):
+            run([encoder, '--input', gcode_name, '--output', packed_name] + policy)
+            run([encoder, '--decode', '--input', packed_name, '--output', decoded_name])
+            with open(os.devnull, 'w') as devnull:
+                ok = subprocess.call([sys.executable, encoder, '--verify', '--input', decoded_name, '--output', packed_name] + policy, stderr=devnull) == 0
+            print('round trip out of float range ({}): {}'.format(' '.join(policy), 'ok' if ok else 'DIFFERS'))
+            failed = failed or not ok
+    finally:
+        for name in temp_names:
+            os.remove(name)
+    if failed:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
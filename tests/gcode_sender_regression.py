@@ -0,0 +1,90 @@
+#!/usr/bin/env python2.7
+# Drives host_stuff/littlevent/gcode_sender.py against a scripted serial
+# port and checks how often each line is written when the firmware asks for
+# a line to be sent again. A single fault can be reported twice, by an
+# "Error:...Last Line:N" and by a "Resend: N+1", and the line must then be
+# sent again only once.
+
+from __future__ import print_function
+import os
+import re
+import sys
+
+tests_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(tests_dir, '..', 'host_stuff'))
+
+import littlevent.gcode_sender
+
+class ScriptedIo (object):
+    def __init__ (self):
+        self.written = []
+        self.read_handler = None
+        self.write_handler = None
+
+    def read_io (self):
+        return self
+
+    def write_io (self):
+        return self
+
+    def read_set_handler (self, handler, buffered=False):
+        self.read_handler = handler
+
+    def read_start (self, max_bytes):
+        pass
+
+    def read_cancel (self):
+        pass
+
+    def write_set_handler (self, handler):
+        self.write_handler = handler
+
+    def write_start (self, data):
+        self.written.append(data)
+
+    def reply (self, data):
+        self.read_handler(data, None)
+
+def written_numbers (io):
+    return [int(re.match(br'N(\d+) ', data).group(1)) for data in io.written]
+
+def run_case (name, window_size, replies, expected):
+    io = ScriptedIo()
+    result = []
+    commands = [b'G1 X%d' % i for i in range(1, 6)]
+    sender = littlevent.gcode_sender.GcodeSender(io, commands, window_size, result.append)
+    sender.start()
+    for data in replies:
+        io.reply(data)
+    # Acknowledge whatever is still outstanding.
+    for i in range(20):
+        if len(result) != 0:
+            break
+        io.reply(b'ok\n')
+    numbers = written_numbers(io)
+    ok = result == [None] and numbers == expected
+    print('{}: {}'.format(name, 'ok' if ok else 'DIFFERS'))
+    if not ok:
+        print('  written {} result {}'.format(numbers, result))
+    return ok
+
+def main ():
+    # The firmware reports that it expected line 3 while lines 1 and 2 are
+    # still outstanding, so the rewind does not start at the oldest command.
+    both = [b'ok\n', b'Error:Line Number is not Last Line Number+1, Last Line:2\n', b'Resend: 3\n', b'ok\n']
+    cases = [
+        # All lines fit, so the copy of line 3 is written before the Resend.
+        ('error and resend, copy already sent', 1000, both, [0, 1, 2, 3, 4, 5, 3, 4, 5]),
+        # Only four lines fit, so the copy of line 3 is still waiting.
+        ('error and resend, copy waiting', 4 * 14, both, [0, 1, 2, 3, 4, 3, 4, 5]),
+        ('resend only', 1000, [b'ok\n', b'Resend: 3\n', b'ok\n'], [0, 1, 2, 3, 4, 5, 3, 4, 5]),
+    ]
+    failed = False
+    for (name, window_size, replies, expected) in cases:
+        if not run_case(name, window_size, replies, expected):
+            failed = True
+    if failed:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python2.7
+# Runs host_stuff/printer_farm.py against host_stuff/fake_firmware.py and
+# checks through the control socket that the status of a running job shows
+# how far it has got, and that cancelling it keeps those counters.
+
+from __future__ import print_function
+import os
+import sys
+import json
+import time
+import shutil
+import socket
+import tempfile
+import subprocess
+
+tests_dir = os.path.dirname(os.path.abspath(__file__))
+host_dir = os.path.join(tests_dir, '..', 'host_stuff')
+
+JobCommands = 2000
+
+def request(socket_name, req):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_name)
+        sock.sendall((json.dumps(req) + '\n').encode('utf-8'))
+        response = b''
+        while not response.endswith(b'\n'):
+            data = sock.recv(4096)
+            if len(data) == 0:
+                break
+            response += data
+    finally:
+        sock.close()
+    return json.loads(response.decode('utf-8'))
+
+def wait_for(condition, timeout=10.0):
+    end_time = time.time() + timeout
+    while time.time() < end_time:
+        value = condition()
+        if value:
+            return value
+        time.sleep(0.05)
+    return None
+
+def main():
+    temp_dir = tempfile.mkdtemp()
+    processes = []
+    failed = False
+    try:
+        job_name = os.path.join(temp_dir, 'job.gcode')
+        socket_name = os.path.join(temp_dir, 'farm.sock')
+        with open(job_name, 'w') as f:
+            for i in range(JobCommands):
+                f.write('G1 X{}.0\n'.format(i % 200))
+        # Each command takes a millisecond, so the job runs for seconds.
+        firmware = subprocess.Popen([sys.executable, '-B', os.path.join(host_dir, 'fake_firmware.py'), '--delay', '0.001'], stdout=subprocess.PIPE)
+        processes.append(firmware)
+        port = firmware.stdout.readline().decode('ascii').strip()
+        with open(os.devnull, 'w') as devnull:
+            processes.append(subprocess.Popen([sys.executable, '-B', os.path.join(host_dir, 'printer_farm.py'), '--socket', socket_name,
+                                               '--printer', 'p1', port, '115200', '7'], stdout=devnull))
+        wait_for(lambda: os.path.exists(socket_name))
+        job_id = request(socket_name, {'command': 'queue', 'printer': 'p1', 'file': job_name})['job']
+
+        def printer_status():
+            return request(socket_name, {'command': 'status'})['printers'][0]
+
+        def running_job():
+            printer = printer_status()
+            job = printer['job']
+            if job is not None and job.get('sent', 0) > 0:
+                return (printer, job)
+            return None
+
+        def idle_printer():
+            printer = printer_status()
+            return printer if printer['job'] is None else None
+        running = wait_for(running_job)
+        ok = running is not None and running[0]['state'] == 'printing' and 0 < running[1]['sent'] < JobCommands
+        print('status during a job: {}'.format('ok' if ok else 'DIFFERS'))
+        failed = failed or not ok
+
+        request(socket_name, {'command': 'cancel', 'printer': 'p1', 'job': job_id})
+        printer = wait_for(idle_printer)
+        finished = printer['finished'][-1] if printer is not None and len(printer['finished']) != 0 else None
+        ok = finished is not None and finished['result'] == 'cancelled' and running is not None and finished['sent'] >= running[1]['sent']
+        print('status after cancelling a job: {}'.format('ok' if ok else 'DIFFERS'))
+        failed = failed or not ok
+    finally:
+        for process in reversed(processes):
+            process.terminate()
+            process.wait()
+        shutil.rmtree(temp_dir)
+    if failed:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
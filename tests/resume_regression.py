@@ -0,0 +1,106 @@
+#!/usr/bin/env python2.7
+# Encodes g-code with a resume index using aprinter_encode.py, resumes it
+# with aprinter_resume.py from every checkpoint, and checks that the
+# resumed file, once its preamble is done, makes the machine visit the
+# same positions as the rest of the original file. The g-code has sections
+# with relative moves (G91) and relative extrusion (M83) which the
+# checkpoints fall into, and a G92 without a value, which sets 0.
+
+from __future__ import print_function
+import os
+import sys
+import json
+import tempfile
+import subprocess
+
+tests_dir = os.path.dirname(os.path.abspath(__file__))
+encoder = os.path.join(tests_dir, '..', 'aprinter_encode.py')
+resume = os.path.join(tests_dir, '..', 'aprinter_resume.py')
+
+gcode_lines = (
+    ['G28', 'G90', 'G92 E0', 'G1 X10.0 Y10.0 Z0.3 F1200', 'G1 X14.0 E1.0', 'G91'] +
+    ['G1 X1.0 E0.1'] * 10 +
+    ['G1 Y1.0 Z0.2', 'G90', 'G1 X30.0 Y20.0 E3.0', 'M83'] +
+    ['G1 X{}.0 E0.5'.format(31 + i) for i in range(6)] +
+    ['M82', 'G92 E', 'G1 X40.0 E1.0', 'G91', 'G1 X-1.0 Y-1.0', 'M83', 'G1 E0.3', 'G1 X-1.0 E0.2']
+)
+
+def machine_trace(gcode):
+    # Returns the positions after each move, following G90/G91 for all
+    # axes and M82/M83 for E. Positions which are not known are left out.
+    trace = []
+    pos = {}
+    relative = False
+    relative_extrusion = False
+    for line in gcode.split('\n'):
+        words = line.split(';')[0].split()
+        if len(words) == 0:
+            continue
+        cmd = words[0]
+        if cmd in ('G0', 'G1'):
+            for word in words[1:]:
+                if word[0] == 'F':
+                    continue
+                if relative or (relative_extrusion and word[0] == 'E'):
+                    if word[0] in pos:
+                        pos[word[0]] += float(word[1:] or 0)
+                else:
+                    pos[word[0]] = float(word[1:] or 0)
+            trace.append(sorted([(axis, round(value, 4)) for (axis, value) in pos.items()]))
+        elif cmd == 'G28':
+            pos = {}
+        elif cmd == 'G90' or cmd == 'G91':
+            relative = (cmd == 'G91')
+        elif cmd == 'M82' or cmd == 'M83':
+            relative_extrusion = (cmd == 'M83')
+        elif cmd == 'G92':
+            for word in words[1:]:
+                pos[word[0]] = float(word[1:] or 0)
+    return trace
+
+def run(args):
+    subprocess.check_call([sys.executable] + args)
+
+def main():
+    temp_names = []
+    def temp_name(suffix):
+        fd, name = tempfile.mkstemp(suffix=suffix)
+        os.close(fd)
+        temp_names.append(name)
+        return name
+    failed = False
+    try:
+        gcode_name = temp_name('.gcode')
+        packed_name = temp_name('.packed')
+        index_name = temp_name('.index')
+        resumed_name = temp_name('.packed')
+        decoded_name = temp_name('.gcode')
+        with open(gcode_name, 'w') as f:
+            f.write('\n'.join(gcode_lines) + '\n')
+        run([encoder, '--input', gcode_name, '--output', packed_name, '--index', index_name, '--index-interval', '5'])
+        with open(index_name, 'r') as f:
+            checkpoints = [json.loads(line) for line in f.readlines()[1:]]
+        full_trace = machine_trace('\n'.join(gcode_lines))
+        for checkpoint in checkpoints:
+            line = checkpoint['line']
+            run([resume, '--input', packed_name, '--index', index_name, '--output', resumed_name, '--line', str(line)])
+            run([encoder, '--decode', '--input', resumed_name, '--output', decoded_name])
+            with open(decoded_name, 'r') as f:
+                resumed_lines = f.read().rstrip('\n').split('\n')
+            # The preamble is what comes before the rest of the original.
+            rest_lines = gcode_lines[(line - 1):]
+            preamble_moves = len(machine_trace('\n'.join(resumed_lines[:(len(resumed_lines) - len(rest_lines))])))
+            resumed_trace = machine_trace('\n'.join(resumed_lines))[preamble_moves:]
+            expected_trace = full_trace[(len(full_trace) - len(resumed_trace)):]
+            ok = resumed_trace == expected_trace and len(resumed_trace) == len(machine_trace('\n'.join(rest_lines)))
+            modes = [mode for (mode, key) in (('G91', 'relative'), ('M83', 'relative_extrusion')) if checkpoint.get(key)]
+            print('resume at line {}{}: {}'.format(line, ''.join([' ({})'.format(mode) for mode in modes]), 'ok' if ok else 'DIFFERS'))
+            failed = failed or not ok
+    finally:
+        for name in temp_names:
+            os.remove(name)
+    if failed:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()